@@ -2,77 +2,152 @@
 # -*- coding: utf-8 -*-
 """
 Pridėti Word atsisiuntimo mygtuką į HTML failus
+Failas skaitomas eilutėmis iki warning div pabaigos, mygtukas įterpiamas po jo,
+o likusi dalis nukopijuojama nepakeista (be viso dokumento analizės ir
+perrašymo). Jei mygtukas jau yra - failas nekeičiamas. Rašoma į laikiną failą,
+kuris pakeičia originalą tik pavykus (atomiškai).
 """
 
-from bs4 import BeautifulSoup
+import html
+import os
 import re
-
-# Straipsnių sąrašas
-STRAIPSNIAI = [1, 2, 3, 4, 5, 6]
-
-def add_download_button(html_file, straipsnis_id):
-    """Pridėti atsisiuntimo mygtuką į HTML failą"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from build_manifest import BuildManifest, data_hash, source_hash
+from articles import parse_ids, select_articles
+
+# Žymeklis, pagal kurį atpažįstamas jau įterptas mygtukas
+DOWNLOAD_MARKER = 'class="download-section"'
+WARNING_START = '<div class="warning">'
+
+BUTTON_TEMPLATE = (
+    '<div class="download-section" style="background: #e8f5e9; border-left: 4px solid #4caf50; '
+    'padding: 15px; margin: 20px 0;"><strong>📥 ATSISIŲSTI WORD FORMATĄ:</strong> Galite atsisiųsti šį '
+    'straipsnį Word dokumentu (.docx) redagavimui ir spausdinimui. <a class="download-btn" download="" '
+    'href="{href}" style="display: inline-block; background: #4caf50; color: white; padding: 10px 20px; '
+    'text-decoration: none; border-radius: 5px; margin: 10px 0; font-weight: bold;">'
+    '⬇ Atsisiųsti Word (.docx)</a></div>'
+)
+
+_DIV_TAG_RE = re.compile(r'<div\b|</div>')
+
+def button_html(word_file):
+    """Atsisiuntimo mygtuko HTML"""
+    return BUTTON_TEMPLATE.format(href=html.escape(word_file, quote=True))
+
+def _closing_position(line, start, depth):
+    """Pozicija po div, kuris uždaro warning bloką (arba None) ir naujas gylis"""
+    for match in _DIV_TAG_RE.finditer(line, start):
+        depth += -1 if match.group(0) == '</div>' else 1
+        if depth == 0:
+            return match.end(), 0
+    return None, depth
+
+def inject_button(source, target, button):
+    """
+    Kopijuoti source į target, įterpiant mygtuką po warning div
+    Grąžina 'added', 'present' (mygtukas jau yra) arba 'missing' (warning div nėra).
+    """
+    depth = 0
+    inserted = False
+    for line in source:
+        if DOWNLOAD_MARKER in line:
+            return 'present'
+        if not inserted:
+            start = line.find(WARNING_START) if depth == 0 else 0
+            if start >= 0:
+                position, depth = _closing_position(line, start, depth)
+                if position is not None:
+                    line = line[:position] + button + line[position:]
+                    inserted = True
+        target.write(line)
+    return 'added' if inserted else 'missing'
+
+def add_download_button(html_file, word_file):
+    """Pridėti atsisiuntimo mygtuką į HTML failą (pakartotinai - nieko nekeičia)"""
     print(f"Atnaujiname {html_file}...")
+    tmp_file = html_file + ".tmp"
 
     try:
-        # Skaityti HTML failą
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Rasti warning div
-        warning_div = soup.find('div', class_='warning')
-
-        if warning_div:
-            # Sukurti naują download mygtuką
-            download_section = soup.new_tag('div', **{'class': 'download-section', 'style': 'background: #e8f5e9; border-left: 4px solid #4caf50; padding: 15px; margin: 20px 0;'})
-
-            # Pridėti tekstą
-            strong_tag = soup.new_tag('strong')
-            strong_tag.string = '📥 ATSISIŲSTI WORD FORMATĄ:'
-            download_section.append(strong_tag)
-
-            download_section.append(' Galite atsisiųsti šį straipsnį Word dokumentu (.docx) redagavimui ir spausdinimui. ')
-
-            # Pridėti mygtuką
-            download_btn = soup.new_tag('a', href=f'straipsnis-{straipsnis_id}-pilnas.docx', download='', **{'class': 'download-btn', 'style': 'display: inline-block; background: #4caf50; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; margin: 10px 0; font-weight: bold;'})
-            download_btn.string = f'⬇ Atsisiųsti Word (.docx)'
-
-            download_section.append(download_btn)
-
-            # Įterpti po warning div
-            warning_div.insert_after(download_section)
-
-            # Išsaugoti atnaujintą HTML
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(str(soup))
+        with open(html_file, 'r', encoding='utf-8', newline='') as source, \
+                open(tmp_file, 'w', encoding='utf-8', newline='') as target:
+            result = inject_button(source, target, button_html(word_file))
 
+        if result == 'added':
+            os.replace(tmp_file, html_file)
             print(f"✓ Sėkmingai atnaujintas {html_file}")
             return True
-        else:
-            print(f"⚠ Nerasta warning div {html_file}")
-            return False
+        os.remove(tmp_file)
+        if result == 'present':
+            print(f"⏭  Mygtukas jau yra {html_file}")
+            return True
+        print(f"⚠ Nerasta warning div {html_file}")
+        return False
 
     except Exception as e:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
         print(f"✗ Klaida: {e}")
         return False
 
+def add_download_buttons(items, jobs=1):
+    """Įterpti mygtukus į kelis failus (items - (html, word) poros); jobs > 1 - atskiruose procesuose"""
+    if jobs <= 1 or len(items) <= 1:
+        return [add_download_button(html_file, word_file) for html_file, word_file in items]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+        return list(pool.map(add_download_button, *zip(*items)))
+
+def button_inputs(manifest, straipsnis_info, code_version, output_dir='.'):
+    """Mygtuko etapo įėjimai: HTML versija, Word failo vardas, kodo versija ir HTML kelias"""
+    html_file = os.path.join(output_dir, straipsnis_info['pilnas_vertimas'])
+    return {
+        'html': manifest.content_version(html_file),
+        'word_file': data_hash(straipsnis_info['word_file']),
+        'code': code_version,
+        'outputs': [os.path.abspath(html_file)]
+    }
+
 def main():
     """Pagrindinė funkcija"""
+    parser = argparse.ArgumentParser(description="Pridėti Word atsisiuntimo mygtuką į HTML failus")
+    parser.add_argument('--ids', type=parse_ids,
+                        help="apdoroti tik nurodytus straipsnius, pvz. 1,3-5 (numatyta - visi)")
+    parser.add_argument('--force', action='store_true',
+                        help="apdoroti visus failus, net jei jie nepasikeitė")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help="kiek failų apdoroti lygiagrečiai (numatyta - branduolių skaičius)")
+    args = parser.parse_args()
+    straipsniai = select_articles(args.ids)
+
     print("\n" + "="*70)
     print(" PRIDEDAMAS WORD ATSISIUNTIMO MYGTUKAS Į HTML FAILUS ")
     print("="*70 + "\n")
 
     success_count = 0
-
-    for straipsnis_id in STRAIPSNIAI:
-        html_file = f"straipsnis-{straipsnis_id}-pilnas.html"
-        if add_download_button(html_file, straipsnis_id):
+    skipped = 0
+    manifest = BuildManifest()
+    code_version = source_hash('add_word_download_button.py')
+
+    pending = []
+    for straipsnis in straipsniai:
+        html_file = straipsnis['pilnas_vertimas']
+        inputs = button_inputs(manifest, straipsnis, code_version)
+        if not args.force and manifest.is_fresh('buttons', straipsnis['id'], inputs):
+            print(f"⏭  {html_file} nepasikeitė, praleidžiamas")
+            skipped += 1
+            continue
+        pending.append((straipsnis, inputs))
+
+    results = add_download_buttons([(s['pilnas_vertimas'], s['word_file']) for s, _ in pending], args.jobs)
+    for (straipsnis, inputs), success in zip(pending, results):
+        if success:
             success_count += 1
+            # Failas papildomas vietoje - jo versija tolesniems etapams nesikeičia
+            manifest.record('buttons', straipsnis['id'], inputs, [straipsnis['pilnas_vertimas']], in_place=True)
+    manifest.save()
 
     print("\n" + "="*70)
-    print(f" ✓ Atnaujinta {success_count}/{len(STRAIPSNIAI)} failų ")
+    print(f" ✓ Atnaujinta {success_count}/{len(straipsniai)} failų (praleista: {skipped})")
     print("="*70 + "\n")
 
 if __name__ == "__main__":
@@ -1,6 +1,17 @@
-// Užkrauti straipsnius
+// Užkrauti straipsnius (tik kortelių laukai, žr. frontend_bundle.py)
 function loadStraipsniai() {
-    displayStraipsniai(straipsniuDuomenys);
+    fetch('bundle/index.json')
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(response.status);
+            }
+            return response.json();
+        })
+        .then(displayStraipsniai)
+        .catch(() => {
+            document.getElementById('straipsniai-container').innerHTML =
+                '<p>Nepavyko įkelti straipsnių sąrašo.</p>';
+        });
 }
 
 // Rodyti straipsnius puslapyje
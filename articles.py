@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Straipsnių manifestas - vienintelis straipsnių duomenų šaltinis
+data/straipsniai.json nuskaitomas vieną kartą, patikrinamas pagal schemą ir
+indeksuojamas pagal id. Iš jo skaito visi skriptai, o svetainės duomenų
+paketas (bundle/, žr. frontend_bundle.py) generuojamas:
+
+    python3 articles.py            # perrašyti bundle/
+    python3 articles.py --check    # tik patikrinti manifestą
+"""
+
+import argparse
+import json
+import os
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(REPO_DIR, "data", "straipsniai.json")
+
+# Laukas -> (tipas, privalomas)
+SCHEMA = {
+    'id': (int, True),
+    'pavadinimas': (str, True),
+    'original_title': (str, False),
+    'autoriai': (str, True),
+    'institucija': (str, False),
+    'metai': (int, True),
+    'santrauka': (str, True),
+    'raktiniai_zodziai': (list, True),
+    'turinys': (dict, False),
+    'saltinis': (str, False),
+    'doi': (str, False),
+    'pdf_file': (str, True),
+    'pilnas_vertimas': (str, True),
+    'word_file': (str, True),
+}
+
+class ManifestError(ValueError):
+    """Straipsnių manifestas neatitinka schemos"""
+
+
+def validate(articles):
+    """Patikrinti straipsnių sąrašą pagal SCHEMA; klaidos atveju iškelti ManifestError"""
+    if not isinstance(articles, list):
+        raise ManifestError("Manifestas turi būti straipsnių sąrašas")
+
+    seen = set()
+    for position, article in enumerate(articles):
+        label = f"straipsnis #{position + 1}"
+        if not isinstance(article, dict):
+            raise ManifestError(f"{label}: turi būti objektas")
+        for field, (field_type, required) in SCHEMA.items():
+            if field not in article:
+                if required:
+                    raise ManifestError(f"{label}: trūksta lauko '{field}'")
+                continue
+            # bool yra int poklasis - id ir metai turi būti tikri skaičiai
+            if not isinstance(article[field], field_type) or isinstance(article[field], bool):
+                raise ManifestError(f"{label}: laukas '{field}' turi būti {field_type.__name__}")
+        unknown = set(article) - set(SCHEMA)
+        if unknown:
+            raise ManifestError(f"{label}: nežinomi laukai {', '.join(sorted(unknown))}")
+        if article['id'] in seen:
+            raise ManifestError(f"{label}: pasikartojantis id {article['id']}")
+        seen.add(article['id'])
+    return articles
+
+
+def load_articles(path=MANIFEST_PATH):
+    """Nuskaityti ir patikrinti manifestą"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return validate(json.load(f))
+
+
+_articles = None
+_index = None
+
+
+def get_articles():
+    """Visi straipsniai (manifestas skaitomas tik pirmą kartą)"""
+    global _articles, _index
+    if _articles is None:
+        _articles = load_articles()
+        _index = {article['id']: article for article in _articles}
+    return _articles
+
+
+def get_article(straipsnis_id):
+    """Straipsnis pagal id"""
+    get_articles()
+    try:
+        return _index[straipsnis_id]
+    except KeyError:
+        raise KeyError(f"Manifeste nėra straipsnio {straipsnis_id}")
+
+
+def parse_ids(value):
+    """Paversti "1,3-5" į id sąrašą (argparse tipas)"""
+    ids = []
+    try:
+        for part in value.split(','):
+            part = part.strip()
+            if '-' in part:
+                start, end = part.split('-', 1)
+                ids.extend(range(int(start), int(end) + 1))
+            elif part:
+                ids.append(int(part))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Netinkamas id sąrašas: {value}")
+    return ids
+
+
+def select_articles(ids=None):
+    """Straipsniai pagal id sąrašą (None - visi), manifesto tvarka"""
+    articles = get_articles()
+    if not ids:
+        return list(articles)
+    for straipsnis_id in ids:
+        get_article(straipsnis_id)
+    wanted = set(ids)
+    return [article for article in articles if article['id'] in wanted]
+
+
+def main():
+    """Pagrindinė funkcija"""
+    parser = argparse.ArgumentParser(description="Straipsnių manifestas ir svetainės paketo generavimas")
+    parser.add_argument('--check', action='store_true', help="tik patikrinti manifestą")
+    args = parser.parse_args()
+
+    articles = get_articles()
+    print(f"✓ Manifestas tinkamas: {len(articles)} straipsnių ({MANIFEST_PATH})")
+    if not args.check:
+        from frontend_bundle import BUNDLE_DIR, print_bundle_report, write_bundle
+        print_bundle_report(write_bundle(articles))
+        print(f"✓ Sugeneruotas {BUNDLE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
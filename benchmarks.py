@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Našumo matavimai (benchmark'ai)
+Paleidimas: python3 benchmarks.py <matavimas>
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+from concurrent_translation import configure_rate_limiter, get_rate_limiter, translate_chunks_concurrently
+from translation_backends import FlakyBackend, OfflineBackend, set_default_backend
+from translation_cache import TranslationCache, set_default_cache
+from retry_engine import configure_retry_engine
+from translation import translate_many
+from pdf_extraction import extract_text_from_pdf
+from html_renderer import render_html, write_html_file
+from articles import get_articles
+import html_to_word
+import search_index
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def bench_concurrent_translation(chunk_count=100, latency=0.05, workers=8, rate=20.0, limited_count=40):
+    """Palyginti nuoseklų, lygiagretų ir paketinį vertimą su offline varikliu; patikrinti dažnio ribotuvą"""
+    chunks = [f"Sakinys numeris {i}." for i in range(chunk_count)]
+
+    sequential_backend = OfflineBackend(latency=latency, prefix="[LT] ")
+    start = time.perf_counter()
+    sequential = [sequential_backend.translate(chunk) for chunk in chunks]
+    sequential_time = time.perf_counter() - start
+
+    concurrent_backend = OfflineBackend(latency=latency, prefix="[LT] ")
+    start = time.perf_counter()
+    concurrent = translate_chunks_concurrently(chunks, concurrent_backend.translate, workers)
+    concurrent_time = time.perf_counter() - start
+
+    batched_backend = OfflineBackend(latency=latency, prefix="[LT] ")
+    start = time.perf_counter()
+    batched = batched_backend.translate_many(chunks)
+    batched_time = time.perf_counter() - start
+
+    # Lygiagrečiai per bendrą ribotuvą: užklausų dažnis neturi viršyti nustatytojo
+    previous = get_rate_limiter()
+    limiter = configure_rate_limiter(rate, burst=1)
+    try:
+        limited_backend = OfflineBackend(latency=latency, prefix="[LT] ", rate_limited=True)
+        start = time.perf_counter()
+        limited = translate_chunks_concurrently(chunks[:limited_count], limited_backend.translate, workers)
+        limited_time = time.perf_counter() - start
+    finally:
+        configure_rate_limiter(previous.rate, previous.capacity)
+    min_time = (limited_backend.requests - limiter.capacity) / rate
+
+    assert concurrent == sequential, "Lygiagretaus vertimo tvarka nesutampa su nuosekliu"
+    assert batched == sequential, "Paketinio vertimo rezultatas nesutampa su nuosekliu"
+    assert limited == sequential[:limited_count], "Riboto vertimo rezultatas nesutampa su nuosekliu"
+    assert limited_time >= min_time, f"Ribotuvas praleido per daug užklausų ({limited_time:.2f} s < {min_time:.2f} s)"
+
+    print(f"Gabalų: {chunk_count} | vėlavimas: {latency * 1000:.0f} ms | gijų: {workers}")
+    print(f"  Nuosekliai:   {sequential_time:.2f} s ({sequential_backend.requests} užklausų)")
+    print(f"  Lygiagrečiai: {concurrent_time:.2f} s ({sequential_time / concurrent_time:.1f}x)")
+    print(f"  Paketais:     {batched_time:.2f} s ({batched_backend.requests} užklausų)")
+    print(f"  Su ribotuvu:  {limited_time:.2f} s ({limited_backend.requests} užklausų, "
+          f"{limited_backend.requests / limited_time:.1f}/s, riba {rate:.0f}/s)")
+
+
+def bench_pdf_extraction(workers=0):
+    """Palyginti nuoseklų ir lygiagretų teksto išgavimą iš pridėtų PDF"""
+    workers = workers or os.cpu_count() or 1
+    print(f"Procesų: {workers}")
+    total_serial = total_parallel = 0.0
+
+    for pdf_path in sorted(glob.glob(os.path.join(REPO_DIR, "*.pdf"))):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            serial = extract_text_from_pdf(pdf_path, workers=1, use_cache=False)
+            serial_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parallel = extract_text_from_pdf(pdf_path, workers=workers, use_cache=False)
+            parallel_time = time.perf_counter() - start
+
+        assert parallel == serial, f"Lygiagretus išgavimas nesutampa: {pdf_path}"
+        total_serial += serial_time
+        total_parallel += parallel_time
+        print(f"  {os.path.basename(pdf_path)[:50]:50} {len(serial):3} psl. | "
+              f"{serial_time:.2f} s -> {parallel_time:.2f} s")
+
+    print(f"  Iš viso: {total_serial:.2f} s -> {total_parallel:.2f} s ({total_serial / total_parallel:.1f}x)")
+
+
+def bench_html_render(page_count=500, page_chars=3000, repeats=5):
+    """Sugeneruoti sintetinio 500 puslapių straipsnio HTML ir pamatuoti laiką bei dydį"""
+    straipsnis_info = {
+        'id': 0,
+        'pavadinimas': "Sintetinis straipsnis",
+        'autoriai': "Testas",
+        'original_title': "Synthetic article",
+        'pdf_file': "sintetinis.pdf"
+    }
+    sentence = "Tai yra sintetinis sakinys našumo matavimui. "
+    text = (sentence * (page_chars // len(sentence) + 1))[:page_chars]
+    pages = [{'page': i + 1, 'translated': text} for i in range(page_count)]
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        html = render_html(pages, straipsnis_info, translation_date="2026 m. sausio 1 d.")
+    memory_time = (time.perf_counter() - start) / repeats
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_html = os.path.join(tmp_dir, "sintetinis.html")
+        start = time.perf_counter()
+        for _ in range(repeats):
+            write_html_file(pages, straipsnis_info, output_html, translation_date="2026 m. sausio 1 d.")
+        file_time = (time.perf_counter() - start) / repeats
+        file_size = os.path.getsize(output_html)
+
+    print(f"Puslapių: {page_count} x {page_chars} simb.")
+    print(f"  StringIO: {memory_time * 1000:.1f} ms | Failas: {file_time * 1000:.1f} ms")
+    print(f"  Dydis: {len(html.encode('utf-8')) / 1024:.0f} KB (faile {file_size / 1024:.0f} KB)")
+
+
+def bench_retry(chunk_count=200, workers=4, seed=1):
+    """Vertimas su gedimus įterpiančiu varikliu: visi gabalai turi būti išversti be klaidų žymių"""
+    chunks = [" ".join([f"Sakinys numeris {i}."] * 20) for i in range(chunk_count)]
+    expected = OfflineBackend(prefix="[LT] ").translate_many(chunks)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = set_default_cache(TranslationCache(os.path.join(tmp_dir, "vertimai.sqlite")))
+        backend = set_default_backend(FlakyBackend(max_chars=1000, prefix="[LT] ", rate_limit_rate=0.15,
+                                                   transient_rate=0.15, permanent_rate=0.02, seed=seed))
+        engine = configure_retry_engine(attempts=3, base_delay=0.01, max_delay=0.1, cooldown=0.05)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            translated = translate_many(chunks, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        cache.close()
+        set_default_cache(None)
+
+    failed = [i for i, text in enumerate(translated) if text.startswith('[KLAIDA:')]
+    assert len(failed) == engine.failed, "Klaidų žymių skaičius nesutampa su statistika"
+    assert all(translated[i] == expected[i] for i in range(chunk_count) if i not in failed)
+
+    print(f"Gabalų: {chunk_count} | gijų: {workers} | užklausų: {backend.requests} "
+          f"(įterpta gedimų: {backend.failures}) | {elapsed:.2f} s")
+    engine.print_report()
+
+
+def _docx_texts(output_dir, straipsniai):
+    """Sukurtų Word dokumentų pastraipų tekstai (palyginimui)"""
+    from docx import Document
+    return [[p.text for p in Document(os.path.join(output_dir, s['word_file'])).paragraphs] for s in straipsniai]
+
+
+def bench_docx(jobs=0):
+    """Word konvertavimas pridėtiems straipsnis-*-pilnas.html: html.parser, lxml ir procesų telkinys"""
+    jobs = jobs or os.cpu_count() or 1
+    straipsniai = [s for s in get_articles() if os.path.exists(os.path.join(REPO_DIR, s['pilnas_vertimas']))]
+    print(f"Straipsnių: {len(straipsniai)} | procesų: {jobs}")
+
+    timings = []
+    texts = []
+    default_parser = html_to_word.HTML_PARSER
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for s in straipsniai:
+            shutil.copy(os.path.join(REPO_DIR, s['pilnas_vertimas']), tmp_dir)
+
+        for label, parser, run_jobs in (("html.parser", 'html.parser', 1), ("lxml", 'lxml', 1),
+                                        (f"lxml, {jobs} proc.", 'lxml', jobs)):
+            html_to_word.HTML_PARSER = parser
+            try:
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results = html_to_word.convert_articles(straipsniai, run_jobs, tmp_dir)
+                timings.append((label, time.perf_counter() - start))
+            finally:
+                html_to_word.HTML_PARSER = default_parser
+            assert all(results), f"Konvertavimas nepavyko ({label})"
+            texts.append(_docx_texts(tmp_dir, straipsniai))
+
+    assert all(t == texts[0] for t in texts), "Word dokumentų turinys skiriasi"
+    baseline = timings[0][1]
+    for label, elapsed in timings:
+        print(f"  {label:16} {elapsed:.2f} s ({baseline / elapsed:.1f}x)")
+
+
+def _legacy_word_document(content, output_file):
+    """Ankstesnis Word generavimas (formatavimas kiekvienam run) - tik palyginimui"""
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt, RGBColor
+
+    doc = Document()
+    doc.add_heading(content['title'], 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle = doc.add_heading('PILNAS AUTOMATINIS VERTIMAS (100%)', 2)
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for run in subtitle.runs:
+        run.font.color.rgb = RGBColor(231, 76, 60)
+    meta_para = doc.add_paragraph()
+    for key, value in content['meta'].items():
+        meta_para.add_run(f"{key}: ").bold = True
+        meta_para.add_run(f"{value}\n")
+    doc.add_page_break()
+    for page in content['pages']:
+        page_heading = doc.add_heading(page['number'], 2)
+        page_heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        for run in page_heading.runs:
+            run.font.color.rgb = RGBColor(52, 152, 219)
+        page_para = doc.add_paragraph(page['text'])
+        page_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        for run in page_para.runs:
+            run.font.size = Pt(11)
+            run.font.name = 'Times New Roman'
+        doc.add_paragraph()
+    doc.save(output_file)
+    return True
+
+
+def _document_xml_size(docx_file):
+    with zipfile.ZipFile(docx_file) as archive:
+        return archive.getinfo('word/document.xml').file_size
+
+
+def bench_docx_styles(page_count=500, page_chars=3000, repeats=3):
+    """Word generavimas: formatavimas kiekvienam run (anksčiau) prieš pavadintus stilius"""
+    contents = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for s in get_articles():
+            html_file = os.path.join(REPO_DIR, s['pilnas_vertimas'])
+            if os.path.exists(html_file):
+                contents.append((f"straipsnis {s['id']}", html_to_word.extract_content_from_html(html_file)))
+    sentence = "Tai yra sintetinis sakinys našumo matavimui. "
+    text = (sentence * (page_chars // len(sentence) + 1))[:page_chars]
+    contents.append((f"sintetinis {page_count} psl.", {
+        'title': "Sintetinis straipsnis",
+        'meta': {'Autoriai': "Testas"},
+        'pages': [{'number': f"📄 Originalus puslapis {i + 1}", 'text': text} for i in range(page_count)]
+    }))
+
+    print(f"{'':22} {'anksčiau':>24} {'stiliai':>24}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, content in contents:
+            row = []
+            for name, create in (("legacy", _legacy_word_document), ("styled", html_to_word.create_word_document)):
+                output_file = os.path.join(tmp_dir, f"{name}.docx")
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for _ in range(repeats):
+                        assert create(content, output_file)
+                elapsed = (time.perf_counter() - start) / repeats
+                row.append(f"{elapsed * 1000:6.0f} ms {os.path.getsize(output_file) / 1024:5.0f} KB "
+                           f"(xml {_document_xml_size(output_file) / 1024:4.0f})")
+            print(f"  {label:20} {row[0]:>24} {row[1]:>24}")
+
+
+def _docx_peak_memory(html_file, output_file, stream, results):
+    """Vykdoma atskirame procese: Word konvertavimo didžiausios atminties prieaugis"""
+    import resource
+    import sys
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if stream:
+            ok = html_to_word.create_word_document_streaming(html_to_word.stream_content_from_html(html_file),
+                                                             output_file)
+        else:
+            ok = html_to_word.create_word_document(html_to_word.extract_content_from_html(html_file), output_file)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux ru_maxrss grąžina KB, macOS - baitus
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    results.put((ok, (peak - before) / scale, elapsed))
+
+
+def bench_docx_memory(page_counts=(250, 1000, 2000), page_chars=3000):
+    """Atminties prieaugis verčiant sintetinį HTML į Word: įprastas ir srautinis režimas"""
+    import multiprocessing
+    context = multiprocessing.get_context('spawn')
+
+    straipsnis_info = {'id': 0, 'pavadinimas': "Sintetinis straipsnis", 'autoriai': "Testas"}
+    sentence = "Tai yra sintetinis sakinys našumo matavimui. "
+    text = (sentence * (page_chars // len(sentence) + 1))[:page_chars]
+
+    print(f"{'Puslapių':>9} {'HTML':>8} {'įprastas':>20} {'srautu':>20}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        html_file = os.path.join(tmp_dir, "sintetinis.html")
+        for page_count in page_counts:
+            pages = ({'page': i + 1, 'translated': text} for i in range(page_count))
+            write_html_file(pages, straipsnis_info, html_file, translation_date="2026 m. sausio 1 d.")
+
+            row = []
+            for stream in (False, True):
+                results = context.Queue()
+                output_file = os.path.join(tmp_dir, f"sintetinis-{int(stream)}.docx")
+                process = context.Process(target=_docx_peak_memory, args=(html_file, output_file, stream, results))
+                process.start()
+                ok, peak_mb, elapsed = results.get()
+                process.join()
+                assert ok, f"Konvertavimas nepavyko ({page_count} psl., stream={stream})"
+                row.append(f"+{peak_mb:6.1f} MB {elapsed:6.2f} s")
+            print(f"{page_count:9} {os.path.getsize(html_file) / 1024 / 1024:6.1f}MB {row[0]:>20} {row[1]:>20}")
+
+
+def bench_search(queries=('politinis smurtas', '"potrauminio streso sutrikimas"', 'Holokaustas palikuonys',
+                          'posttraumatic growth', 'trauma'), repeats=100):
+    """Paieškos indekso sudarymas ir užklausų trukmė (lyginant su tiesiogine paieška tekste)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        index = search_index.build_index(get_articles(), REPO_DIR)
+    build_time = time.perf_counter() - start
+    size = len(search_index.encode_json(index))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        documents = [
+            search_index.fold(" ".join(texts))
+            for info in get_articles()
+            for _, texts in search_index.article_documents(info, REPO_DIR)
+        ]
+
+    print(f"Indeksas: {len(index['docs'])} dokumentų, {len(index['terms'])} terminų, "
+          f"{size / 1024:.0f} KB, sudarytas per {build_time:.2f} s")
+    print(f"{'užklausa':<36} {'indeksas':>10} {'skenavimas':>11} {'rezultatų':>10} {'rasta skenuojant':>17}")
+    for query in queries:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            # Naujas objektas - matuojamas ir postings dekodavimas
+            results = search_index.SearchIndex(index).search(query)
+        indexed = (time.perf_counter() - start) / repeats * 1000
+
+        words = search_index.fold(query.replace('"', '')).split()
+        start = time.perf_counter()
+        for _ in range(repeats):
+            matched = [doc for doc in documents if any(word in doc for word in words)]
+        scanned = (time.perf_counter() - start) / repeats * 1000
+        # Skenavimas randa ir kamienų/frazių neatitinkančius dokumentus - skaičius tik palyginimui
+        print(f"{query:<36} {indexed:>8.2f}ms {scanned:>9.2f}ms {len(results):>10} {len(matched):>17}")
+
+
+BENCHMARKS = {
+    'search': bench_search,
+    'docx-memory': bench_docx_memory,
+    'docx-styles': bench_docx_styles,
+    'docx': bench_docx,
+    'render': bench_html_render,
+    'extraction': bench_pdf_extraction,
+    'translation': bench_concurrent_translation,
+    'retry': bench_retry,
+}
+
+
+def main():
+    """Pagrindinė funkcija"""
+    parser = argparse.ArgumentParser(description="Našumo matavimai")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS) + ['all'])
+    args = parser.parse_args()
+
+    names = sorted(BENCHMARKS) if args.benchmark == 'all' else [args.benchmark]
+    for name in names:
+        print(f"\n=== {name} ===")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pasikartojančių antraščių, poraščių ir puslapių numerių šalinimas
+Kiekvienam PDF atskirai randamos eilutės, kurios kartojasi daugelio puslapių
+viršuje ar apačioje (skaitmenys normalizuojami, kad puslapių numeriai nesiskirtų).
+PyPDF2 dažnai prilipdo antraštę prie paskutinės eilutės be tarpo
+("...at leastC.R. Brewin, ... 342"), todėl ieškoma ir pasikartojančių apatinių eilučių galūnių.
+"""
+
+import math
+import re
+
+from text_processing import MAX_CHUNK_LENGTH
+
+EDGE_LINES = 3          # kiek eilučių puslapio viršuje ir apačioje tikrinti
+MIN_SUFFIX_LENGTH = 8   # trumpesnės galūnės nelaikomos antraštėmis
+MIN_SHARE = 0.3         # dalis puslapių, kuriuose eilutė turi pasikartoti
+
+_DIGITS_RE = re.compile(r'\d+')
+
+
+def normalize_line(line):
+    """Normalizuoti eilutę palyginimui: skaitmenys -> #, tarpai suvienodinti"""
+    return _DIGITS_RE.sub('#', ' '.join(line.split()))
+
+
+def _suffix_starts(line):
+    """Pozicijos, nuo kurių gali prasidėti prilipusi antraštė (didžioji raidė ar skaičius)"""
+    return [
+        i for i in range(1, len(line) - MIN_SUFFIX_LENGTH + 1)
+        if _is_start_char(line[i]) and not _is_start_char(line[i - 1])
+    ]
+
+
+def _is_start_char(char):
+    """Didžioji raidė arba (normalizuotas) skaičius"""
+    return char.isupper() or char.isdigit() or char == '#'
+
+
+class BoilerplateProfile:
+    """Vieno PDF išmoktos pasikartojančios eilutės ir galūnės"""
+
+    def __init__(self, lines=(), suffixes=()):
+        self.lines = set(lines)
+        self.suffixes = sorted(set(suffixes), key=len, reverse=True)
+
+    @classmethod
+    def learn(cls, text_by_page):
+        """Išmokti profilį iš PDF puslapių"""
+        pages = [page_data['text'] or "" for page_data in text_by_page]
+        threshold = max(2, math.ceil(MIN_SHARE * len(pages)))
+
+        line_counts = {}
+        suffix_counts = {}
+        for text in pages:
+            lines = [line for line in text.split('\n') if line.strip()]
+            edge = set(normalize_line(line) for line in lines[:EDGE_LINES] + lines[-EDGE_LINES:])
+            for key in edge:
+                line_counts[key] = line_counts.get(key, 0) + 1
+
+            page_suffixes = set()
+            for line in lines[-EDGE_LINES:]:
+                normalized = normalize_line(line)
+                page_suffixes.update(normalized[i:] for i in _suffix_starts(normalized))
+            for key in page_suffixes:
+                suffix_counts[key] = suffix_counts.get(key, 0) + 1
+
+        lines = [key for key, count in line_counts.items() if count >= threshold]
+        suffixes = [key for key, count in suffix_counts.items() if count >= threshold]
+        # Galūnė, kuri yra ilgesnės pasikartojančios galūnės dalis, nereikalinga
+        suffixes = [s for s in suffixes if not any(o != s and o.endswith(s) for o in suffixes)]
+        return cls(lines, suffixes)
+
+    def strip_page(self, text):
+        """Pašalinti pasikartojančias eilutes ir galūnes iš puslapio teksto"""
+        lines = text.split('\n')
+        nonempty = [i for i, line in enumerate(lines) if line.strip()]
+        edge = set(nonempty[:EDGE_LINES] + nonempty[-EDGE_LINES:])
+
+        kept = []
+        for i, line in enumerate(lines):
+            if i in edge and normalize_line(line) in self.lines:
+                continue
+            kept.append(line)
+
+        if self.suffixes:
+            bottom = [i for i, line in enumerate(kept) if line.strip()][-EDGE_LINES:]
+            for i in bottom:
+                kept[i] = self._strip_suffix(kept[i])
+
+        return '\n'.join(kept)
+
+    def _strip_suffix(self, line):
+        normalized = normalize_line(line)
+        for suffix in self.suffixes:
+            if normalized.endswith(suffix) and len(normalized) > len(suffix):
+                # Normalizacija keičia ilgį, todėl galūnę atkerpame pagal ne tarpų simbolių skaičių
+                keep = len(normalized) - len(suffix)
+                return _cut_normalized_prefix(line, normalized[:keep])
+        return line
+
+
+def _cut_normalized_prefix(line, normalized_prefix):
+    """Grąžinti originalios eilutės pradžią, kuri po normalizacijos lygi normalized_prefix"""
+    for end in range(len(line), -1, -1):
+        if normalize_line(line[:end]) == normalized_prefix.strip():
+            return line[:end].rstrip()
+    return line
+
+
+class BoilerplateStats:
+    """Kiek simbolių ir eilučių pašalinta"""
+
+    def __init__(self):
+        self.chars = 0
+        self.pages = 0
+
+    @property
+    def requests(self):
+        """Apytikslis sutaupytų vertimo užklausų skaičius"""
+        return math.ceil(self.chars / MAX_CHUNK_LENGTH)
+
+    def print_report(self, label=""):
+        """Atspausdinti ataskaitą"""
+        print(f"🧹 Pašalintos antraštės/poraštės{label}: {self.chars:,} simbolių "
+              f"({self.pages} puslapiuose, ≈{self.requests} užklausų)")
+
+
+def strip_boilerplate(text_by_page, profile=None, stats=None):
+    """Pašalinti pasikartojančias antraštes iš visų puslapių; grąžina naują puslapių sąrašą"""
+    text_by_page = list(text_by_page)
+    profile = profile or BoilerplateProfile.learn(text_by_page)
+    return list(_strip_pages(text_by_page, profile, stats))
+
+
+def strip_boilerplate_stream(pages, learn_pages=8, stats=None):
+    """
+    Srautinė versija: profilis išmokstamas iš pirmų learn_pages puslapių,
+    po to likę puslapiai apdorojami po vieną
+    """
+    pages = iter(pages)
+    buffered = []
+    for page_data in pages:
+        buffered.append(page_data)
+        if len(buffered) >= learn_pages:
+            break
+
+    profile = BoilerplateProfile.learn(buffered)
+    yield from _strip_pages(buffered, profile, stats)
+    yield from _strip_pages(pages, profile, stats)
+
+
+def _strip_pages(pages, profile, stats):
+    for page_data in pages:
+        original = page_data['text'] or ""
+        stripped = profile.strip_page(original)
+        if stats is not None and len(stripped) != len(original):
+            stats.chars += len(original) - len(stripped)
+            stats.pages += 1
+        yield {**page_data, 'text': stripped}
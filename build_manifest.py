@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Inkrementinio surinkimo manifestas (kaip make)
+Kiekvienam etapui ir straipsniui įrašomi įėjimų maišai (PDF, metaduomenys,
+kodo/šablono versija) ir sukurtų failų versijos. Jei įėjimai nepasikeitė ir
+išvesties failai tie patys - straipsnis praleidžiamas. Failų maišai
+perskaičiuojami tik pasikeitus dydžiui ar mtime, todėl tuščias perrinkimas
+tik patikrina os.stat.
+"""
+
+import hashlib
+import json
+import os
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MANIFEST_PATH = os.path.join(REPO_DIR, ".cache", "build_manifest.json")
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def data_hash(data):
+    """JSON serializuojamų duomenų (pvz. straipsnio metaduomenų) maiša"""
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def source_hash(*module_files):
+    """Kodo versija - nurodytų repozitorijos modulių turinio maiša"""
+    digest = hashlib.sha256()
+    for name in module_files:
+        with open(os.path.join(REPO_DIR, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Etapų įėjimų/išėjimų registras viename JSON faile"""
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        self.path = path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.stages = data.get('stages', {})
+        # Failų registras: kelias -> {size, mtime_ns, sha256, version}
+        self.files = data.get('files', {})
+
+    def file_hash(self, path):
+        """Failo turinio maiša (iš registro, jei dydis ir mtime nepasikeitė); None - failo nėra"""
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        entry = self.files.get(path)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha256']
+        sha256 = _sha256_file(path)
+        self.files[path] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': sha256,
+            # Failas pasikeitė ne per surinkimą - jo versija lygi turiniui
+            'version': sha256 if not entry or entry['sha256'] != sha256 else entry.get('version', sha256)
+        }
+        return sha256
+
+    def content_version(self, path):
+        """
+        Loginė failo versija tolesniems etapams
+        Jei failą vietoje pakeitė surinkimo etapas (pvz. įterptas mygtukas),
+        versija lieka ta, kurią sukūrė jį pagaminęs etapas.
+        """
+        if self.file_hash(path) is None:
+            return None
+        return self.files[os.path.abspath(path)]['version']
+
+    def is_fresh(self, stage, key, inputs):
+        """Ar etapo rezultatas straipsniui key aktualus (įėjimai tie patys, išvestis nepakeista)"""
+        record = self.stages.get(stage, {}).get(str(key))
+        if not record or record['inputs'] != inputs:
+            return False
+        # Vietoje papildytas failas tikrinamas pagal turinį (pvz. perpieštas HTML be mygtuko)
+        current = self.file_hash if record.get('in_place') else self.content_version
+        for path, version in record['outputs'].items():
+            if current(path) != version:
+                return False
+        return True
+
+    def record(self, stage, key, inputs, outputs, in_place=False):
+        """
+        Įrašyti sėkmingą etapo vykdymą
+        in_place=True - etapas tik papildė esamą failą, jo loginė versija nekeičiama.
+        FileNotFoundError, jei kurio nors išvesties failo nėra (manifestas nekeičiamas).
+        """
+        paths = [os.path.abspath(path) for path in outputs]
+        missing = [path for path in paths if not os.path.isfile(path)]
+        if missing:
+            raise FileNotFoundError(f"Etapas '{stage}' ({key}) nesukūrė failų: {', '.join(missing)}")
+        recorded = {}
+        for path in paths:
+            previous = self.files.get(path, {}).get('version')
+            self.files.pop(path, None)
+            if self.file_hash(path) is None:
+                raise FileNotFoundError(f"Etapas '{stage}' ({key}): failas dingo įrašant {path}")
+            if in_place and previous:
+                self.files[path]['version'] = previous
+            recorded[path] = self.files[path]['sha256' if in_place else 'version']
+        self.stages.setdefault(stage, {})[str(key)] = {'inputs': inputs, 'outputs': recorded, 'in_place': in_place}
+
+    def invalidate(self, stage, key):
+        """Pamiršti etapo rezultatą (kitą kartą bus perrinkta)"""
+        self.stages.get(stage, {}).pop(str(key), None)
+
+    def save(self):
+        """Išsaugoti manifestą (atomiškai)"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'stages': self.stages, 'files': self.files}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
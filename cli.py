@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bendra komandinės eilutės programa visiems etapams
+
+    python3 cli.py translate --ids 3
+    python3 cli.py render-docx --ids 1,3-5 --jobs 4
+    python3 cli.py build-all --input-dir ~/vertimui --output-dir . --jobs 3
+
+Subkomandos: extract, translate, render-html, render-parallel, render-docx, inject-buttons, build-all.
+Nepriklausomi straipsniai apdorojami lygiagrečiai atskiruose procesuose (--jobs).
+Manifestą (praleidžiamus nepasikeitusius straipsnius) tvarko tik pagrindinis procesas.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from translation_cache import get_default_cache
+from concurrent_translation import DEFAULT_RATE, configure_rate_limiter
+from translation_backends import BACKENDS, create_backend, get_default_backend, set_default_backend
+from pdf_extraction import extract_text_from_pdf
+from text_processing import get_chunk_stats
+from untranslatable import get_untranslatable_stats
+from retry_engine import DEFAULT_ATTEMPTS, configure_retry_engine, get_retry_engine
+from translation import get_dedup_stats
+from translation_journal import TranslationJournal, journal_path
+from segment_store import get_segment_store, write_parallel_view
+from translation_model import build_model, load_model, model_path, write_html_from_model, write_model
+from build_manifest import REPO_DIR, BuildManifest, source_hash
+from articles import get_article, parse_ids, select_articles
+import translate_all_articles
+import html_to_word
+import add_word_download_button
+
+# Etapas -> įrašo pavadinimas build manifeste (None - manifestas nenaudojamas)
+MANIFEST_STAGES = {
+    'extract': None,
+    'translate': 'translate',
+    'render-html': 'translate',
+    'render-parallel': None,
+    'render-docx': 'docx',
+    'inject-buttons': 'buttons',
+}
+
+# build-all etapų tvarka (extract atliekamas verčiant, render-html - taip pat)
+BUILD_ALL_STAGES = ('translate', 'render-docx', 'inject-buttons')
+
+
+def configure_process(options):
+    """Nustatyti vertimo variklį, užklausų ribotuvą ir pakartojimus šiam procesui"""
+    # Bendras užklausų dažnis padalinamas visiems procesams
+    configure_rate_limiter(options['rate'] / max(1, options['jobs']))
+    configure_retry_engine(attempts=options['retries'])
+    set_default_backend(create_backend(options['backend']))
+    translate_all_articles.EXTRACT_WORKERS = options['extract_workers']
+
+
+def _extract(straipsnis_info, options):
+    pdf_path = translate_all_articles.article_paths(straipsnis_info, options['input_dir'])[0]
+    text_by_page = extract_text_from_pdf(pdf_path, workers=options['extract_workers'])
+    if not text_by_page:
+        print(f"✗ Nepavyko išgauti teksto iš {pdf_path}")
+        return False
+    total_chars = sum(len(page['text'] or "") for page in text_by_page)
+    print(f"✓ Straipsnis {straipsnis_info['id']}: {len(text_by_page)} puslapių, {total_chars:,} simbolių")
+    return True
+
+
+def _translate(straipsnis_info, options):
+    if options['stream']:
+        translate_fn = translate_all_articles.translate_article_streaming
+    else:
+        translate_fn = translate_all_articles.translate_article
+    return translate_fn(straipsnis_info, resume=options['resume'],
+                        input_dir=options['input_dir'], output_dir=options['output_dir'])
+
+
+def _render_html(straipsnis_info, options):
+    output_html = translate_all_articles.article_paths(straipsnis_info, output_dir=options['output_dir'])[1]
+    path = model_path(straipsnis_info, options['output_dir'])
+    if os.path.exists(path):
+        page_count = write_html_from_model(load_model(path), output_html)
+        print(f"✓ Sukurtas {output_html} ({page_count} puslapių iš {path})")
+        return True
+
+    # Modelio dar nėra (senas vertimas) - sudaromas iš vertimo žurnalo
+    journal = TranslationJournal(journal_path(straipsnis_info['id']), resume=True)
+    try:
+        translated_pages = journal.translated_pages()
+    finally:
+        journal.close()
+    if not translated_pages:
+        print(f"✗ Straipsnio {straipsnis_info['id']} vertimo žurnalas tuščias - pirmiau paleiskite translate")
+        return False
+    model = build_model(translated_pages, straipsnis_info)
+    write_model(model, path)
+    write_html_from_model(model, output_html)
+    print(f"✓ Sukurtas {output_html} ({len(translated_pages)} puslapių iš žurnalo)")
+    return True
+
+
+def _render_parallel(straipsnis_info, options):
+    result = write_parallel_view(straipsnis_info, options['output_dir'])
+    if result is None:
+        print(f"✗ Straipsnio {straipsnis_info['id']} segmentų saugykloje nėra - pirmiau paleiskite translate")
+        return False
+    print(f"✓ Sukurtas {result[0]} ({result[1]} puslapių)")
+    return True
+
+
+def _render_docx(straipsnis_info, options):
+    return html_to_word.convert_article(straipsnis_info, options['output_dir'], options['stream'])
+
+
+def _inject_buttons(straipsnis_info, options):
+    html_file = translate_all_articles.article_paths(straipsnis_info, output_dir=options['output_dir'])[1]
+    return add_word_download_button.add_download_button(html_file, straipsnis_info['word_file'])
+
+
+STAGES = {
+    'extract': _extract,
+    'translate': _translate,
+    'render-html': _render_html,
+    'render-parallel': _render_parallel,
+    'render-docx': _render_docx,
+    'inject-buttons': _inject_buttons,
+}
+
+
+def run_task(stage, straipsnis_id, options):
+    """Atlikti vieno straipsnio etapą (vykdoma ir atskirame procese); grąžina ar pavyko"""
+    try:
+        return bool(STAGES[stage](get_article(straipsnis_id), options))
+    except Exception as e:
+        print(f"✗ KLAIDA ({stage}) straipsniui {straipsnis_id}: {e}")
+        return False
+
+
+def run_parallel(stage, straipsniai, options):
+    """Atlikti etapą straipsniams (--jobs procesuose); generuoja (straipsnis, pavyko) baigimo tvarka"""
+    jobs = min(options['jobs'], len(straipsniai))
+    if jobs <= 1:
+        for straipsnis in straipsniai:
+            yield straipsnis, run_task(stage, straipsnis['id'], options)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=configure_process, initargs=(options,)) as pool:
+        futures = {pool.submit(run_task, stage, straipsnis['id'], options): straipsnis for straipsnis in straipsniai}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def stage_code_version(stage):
+    """Etapo kodo versija (ta pati, kurią naudoja atskiri skriptai)"""
+    if stage in ('translate', 'render-html'):
+        return source_hash(*translate_all_articles.TRANSLATION_MODULES)
+    if stage == 'render-docx':
+        return source_hash(*html_to_word.DOCX_MODULES)
+    if stage == 'inject-buttons':
+        return source_hash('add_word_download_button.py')
+    return None
+
+
+def stage_inputs(stage, manifest, straipsnis_info, code_version, options):
+    """Etapo įėjimai build manifestui"""
+    if stage in ('translate', 'render-html'):
+        return translate_all_articles.translation_inputs(manifest, straipsnis_info, code_version,
+                                                         options['input_dir'], options['output_dir'])
+    if stage == 'render-docx':
+        return html_to_word.conversion_inputs(manifest, straipsnis_info, code_version, options['output_dir'])
+    if stage == 'inject-buttons':
+        return add_word_download_button.button_inputs(manifest, straipsnis_info, code_version,
+                                                      options['output_dir'])
+    return None
+
+
+def record_stage(stage, manifest, straipsnis_info, inputs, options):
+    """Įrašyti sėkmingą etapą į build manifestą"""
+    output_dir = options['output_dir']
+    if stage in ('translate', 'render-html'):
+        translate_all_articles.record_translation(manifest, straipsnis_info, inputs, output_dir)
+        return
+    if stage == 'render-docx':
+        word_file = os.path.join(output_dir, straipsnis_info['word_file'])
+        manifest.record('docx', straipsnis_info['id'], inputs, [word_file])
+    elif stage == 'inject-buttons':
+        # Failas papildomas vietoje - jo versija tolesniems etapams nesikeičia
+        html_file = translate_all_articles.article_paths(straipsnis_info, output_dir=output_dir)[1]
+        manifest.record('buttons', straipsnis_info['id'], inputs, [html_file], in_place=True)
+    manifest.save()
+
+
+def run_stage(stage, straipsniai, options, manifest):
+    """Atlikti etapą visiems pasirinktiems straipsniams; grąžina nepavykusių id sąrašą"""
+    print("\n" + "="*70)
+    print(f" ETAPAS: {stage} ({len(straipsniai)} straipsnių, {options['jobs']} procesų) ")
+    print("="*70 + "\n")
+
+    manifest_stage = MANIFEST_STAGES[stage]
+    code_version = stage_code_version(stage)
+    pending = []
+    inputs_by_id = {}
+    for straipsnis in straipsniai:
+        if manifest_stage is None:
+            pending.append(straipsnis)
+            continue
+        inputs = stage_inputs(stage, manifest, straipsnis, code_version, options)
+        fresh = manifest.is_fresh(manifest_stage, straipsnis['id'], inputs)
+        if stage == 'render-html':
+            # Perpiešiama visada; manifeste vertimas lieka aktualus tik jei buvo aktualus prieš tai
+            inputs_by_id[straipsnis['id']] = inputs if fresh else None
+            pending.append(straipsnis)
+        elif fresh and not options['force']:
+            print(f"⏭  Straipsnis {straipsnis['id']} nepasikeitė, praleidžiamas")
+        else:
+            inputs_by_id[straipsnis['id']] = inputs
+            pending.append(straipsnis)
+
+    success_count = 0
+    failed = []
+    for straipsnis, ok in run_parallel(stage, pending, options):
+        if not ok:
+            failed.append(straipsnis['id'])
+            continue
+        inputs = inputs_by_id.get(straipsnis['id'])
+        if inputs is not None:
+            try:
+                record_stage(stage, manifest, straipsnis, inputs, options)
+            except OSError as e:
+                print(f"✗ KLAIDA ({stage}) straipsniui {straipsnis['id']}: {e}")
+                failed.append(straipsnis['id'])
+                continue
+        success_count += 1
+
+    print(f"\n📊 {stage}: pavyko {success_count}/{len(pending)} | "
+          f"praleista (nepasikeitė): {len(straipsniai) - len(pending)}")
+    if failed:
+        print(f"   • Nepavyko: {', '.join(map(str, sorted(failed)))}")
+    return failed
+
+
+def print_translation_reports():
+    """Vertimo ataskaitos (tik šio proceso; su --jobs > 1 kiekvienas procesas verčia atskirai)"""
+    get_default_cache().print_report()
+    get_chunk_stats().print_report()
+    get_dedup_stats().print_report()
+    get_untranslatable_stats().print_report()
+    get_retry_engine().print_report()
+    get_segment_store().print_report()
+    print(f"   • Užklausų į vertimo variklį: {get_default_backend().requests}")
+
+
+def parse_args(argv=None):
+    """Nuskaityti komandinės eilutės parametrus"""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--ids', type=parse_ids,
+                        help="apdoroti tik nurodytus straipsnius, pvz. 1,3-5 (numatyta - visi manifeste)")
+    common.add_argument('--jobs', '-j', type=int, default=1,
+                        help="kiek straipsnių apdoroti lygiagrečiai atskiruose procesuose (numatyta 1)")
+    common.add_argument('--input-dir', default=REPO_DIR,
+                        help="katalogas su PDF failais (numatyta - repozitorijos katalogas)")
+    common.add_argument('--output-dir', default=REPO_DIR,
+                        help="katalogas HTML ir Word failams (numatyta - repozitorijos katalogas)")
+    common.add_argument('--force', action='store_true',
+                        help="apdoroti visus straipsnius, net jei jų įėjimai nepasikeitė")
+    common.add_argument('--backend', choices=sorted(BACKENDS), default='google',
+                        help="vertimo variklis (numatyta google per deep-translator)")
+    common.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f"didžiausias užklausų skaičius per sekundę visiems procesams (numatyta {DEFAULT_RATE})")
+    common.add_argument('--retries', type=int, default=DEFAULT_ATTEMPTS,
+                        help=f"bandymų skaičius kiekvienai užklausai (numatyta {DEFAULT_ATTEMPTS})")
+    common.add_argument('--extract-workers', type=int, default=1,
+                        help="procesų skaičius vieno PDF teksto išgavimui (0 - visi branduoliai)")
+    common.add_argument('--stream', action='store_true',
+                        help="srautinis režimas: puslapiai verčiami, rašomi į HTML ir Word dalimis")
+    common.add_argument('--resume', action='store_true',
+                        help="tęsti nutrūkusį vertimą nuo pirmo trūkstamo gabalo (pagal žurnalą)")
+
+    parser = argparse.ArgumentParser(description="Traumos tyrimų bibliotekos surinkimas")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('extract', parents=[common], help="išgauti PDF tekstą (į talpyklą)")
+    subparsers.add_parser('translate', parents=[common], help="išversti straipsnius į HTML")
+    subparsers.add_parser('render-html', parents=[common], help="perpiešti HTML iš vertimo žurnalo (be vertimo)")
+    subparsers.add_parser('render-parallel', parents=[common], help="originalas ir vertimas greta (iš segmentų saugyklos)")
+    subparsers.add_parser('render-docx', parents=[common], help="konvertuoti HTML į Word")
+    subparsers.add_parser('inject-buttons', parents=[common], help="įterpti Word atsisiuntimo mygtukus")
+    subparsers.add_parser('build-all', parents=[common], help="translate -> render-docx -> inject-buttons")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Pagrindinė funkcija"""
+    args = parse_args(argv)
+    options = {
+        'jobs': max(1, args.jobs),
+        'input_dir': args.input_dir,
+        'output_dir': args.output_dir,
+        'force': args.force,
+        'backend': args.backend,
+        'rate': args.rate,
+        'retries': args.retries,
+        'extract_workers': args.extract_workers,
+        'stream': args.stream,
+        'resume': args.resume,
+    }
+    # Pagrindinis procesas verčia pats, kai --jobs 1 (tada ir visas užklausų dažnis jam)
+    configure_process({**options, 'jobs': 1})
+
+    straipsniai = select_articles(args.ids)
+    stages = BUILD_ALL_STAGES if args.command == 'build-all' else (args.command,)
+    manifest = BuildManifest()
+    start_time = time.time()
+
+    failed = set()
+    for stage in stages:
+        # Straipsniai, kuriems nepavyko ankstesnis etapas, toliau neapdorojami
+        remaining = [straipsnis for straipsnis in straipsniai if straipsnis['id'] not in failed]
+        failed.update(run_stage(stage, remaining, options, manifest))
+
+    if 'translate' in stages and options['jobs'] == 1:
+        print_translation_reports()
+
+    print("\n" + "="*70)
+    print(f" ✓ {args.command} baigta per {(time.time() - start_time)/60:.1f} min."
+          + (f" Nepavyko: {', '.join(map(str, sorted(failed)))}" if failed else ""))
+    print("="*70 + "\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
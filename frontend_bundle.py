@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Svetainės duomenų paketas (bundle/)
+Svetainė nebekrauna viso manifesto - generuojami:
+
+    bundle/index.json            - tik kortelių laukai sąrašo puslapiui
+    bundle/straipsnis-N.json     - vieno straipsnio duomenys (įkeliami pagal id)
+
+Kiekvienam failui šalia įrašomi iš anksto suspausti variantai .gz ir .br
+(brotli - jei įdiegtas paketas brotli), kuriuos serveris gali atiduoti
+tiesiogiai (pvz. nginx gzip_static / brotli_static). Nepasikeitę failai
+neperrašomi.
+
+    python3 frontend_bundle.py
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+
+from articles import REPO_DIR, get_articles
+
+BUNDLE_DIR = os.path.join(REPO_DIR, "bundle")
+INDEX_NAME = "index.json"
+
+# Laukai, kurių reikia straipsnio kortelei (app.js)
+CARD_FIELDS = ('id', 'pavadinimas', 'autoriai', 'metai', 'santrauka', 'raktiniai_zodziai')
+
+
+def article_file_name(straipsnis_id):
+    """Straipsnio duomenų failo vardas (straipsnis.js naudoja tą patį šabloną)"""
+    return f"straipsnis-{straipsnis_id}.json"
+
+
+def encode_json(data):
+    """Kompaktiškas JSON (UTF-8 baitai)"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def card(article):
+    """Straipsnio kortelės laukai"""
+    return {field: article[field] for field in CARD_FIELDS if field in article}
+
+
+def bundle_files(articles):
+    """Paketo failai: vardas -> turinys (baitai)"""
+    files = {INDEX_NAME: encode_json([card(article) for article in articles])}
+    for article in articles:
+        files[article_file_name(article['id'])] = encode_json(article)
+    return files
+
+
+def brotli_compressor():
+    """brotli.compress arba None, jei paketas neįdiegtas"""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return lambda data: brotli.compress(data, quality=11)
+
+
+def compressed_variants(data, brotli_compress=None):
+    """Suspausti variantai: plėtinys -> baitai (gzip be laiko žymos - atkuriamas)"""
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli_compress is not None:
+        variants['.br'] = brotli_compress(data)
+    return variants
+
+
+def _write_if_changed(path, data):
+    """Įrašyti failą tik jei turinys pasikeitė (atomiškai); grąžina True, jei įrašyta"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_bundle_file(bundle_dir, name, data, brotli_compress=None):
+    """
+    Įrašyti paketo failą su suspaustais variantais
+    Grąžina (įrašytų vardai, perrašytų skaičius, dydžiai (json, gz, br arba None))
+    """
+    outputs = {name: data}
+    for suffix, compressed in compressed_variants(data, brotli_compress).items():
+        outputs[name + suffix] = compressed
+    written = 0
+    for output_name, output_data in outputs.items():
+        if _write_if_changed(os.path.join(bundle_dir, output_name), output_data):
+            written += 1
+    br = outputs.get(name + '.br')
+    return list(outputs), written, (len(data), len(outputs[name + '.gz']), len(br) if br is not None else None)
+
+
+def write_bundle(articles=None, bundle_dir=BUNDLE_DIR):
+    """
+    Sugeneruoti paketą; grąžina statistiką {'files', 'written', 'removed', 'sizes'}
+    sizes: vardas -> (json, gz, br arba None) baitais
+    """
+    if articles is None:
+        articles = get_articles()
+    os.makedirs(bundle_dir, exist_ok=True)
+    brotli_compress = brotli_compressor()
+
+    stats = {'files': 0, 'written': 0, 'removed': 0, 'sizes': {}}
+    expected = set()
+    for name, data in bundle_files(articles).items():
+        names, written, sizes = write_bundle_file(bundle_dir, name, data, brotli_compress)
+        expected.update(names)
+        stats['files'] += len(names)
+        stats['written'] += written
+        stats['sizes'][name] = sizes
+
+    # Pašalinti straipsnių, kurių nebėra manifeste, failus
+    for path in glob.glob(os.path.join(bundle_dir, article_file_name('*') + '*')):
+        if os.path.basename(path) not in expected:
+            os.remove(path)
+            stats['removed'] += 1
+    return stats
+
+
+def print_bundle_report(stats):
+    """Paketo dydžių ataskaita"""
+    print("\n📦 Svetainės duomenų paketas:")
+    for name, (raw, gz, br) in sorted(stats['sizes'].items()):
+        br_text = f", br {br:,} B" if br is not None else ""
+        print(f"   {name:<22} {raw:>8,} B (gz {gz:,} B{br_text})")
+    print(f"   Failų: {stats['files']}, perrašyta: {stats['written']}, pašalinta: {stats['removed']}")
+
+
+def main():
+    """Pagrindinė funkcija"""
+    parser = argparse.ArgumentParser(description="Svetainės duomenų paketo (bundle/) generavimas")
+    parser.add_argument('--output-dir', default=BUNDLE_DIR, help="paketo katalogas")
+    args = parser.parse_args()
+
+    if brotli_compressor() is None:
+        print("⚠️  Paketas brotli neįdiegtas - .br failai nebus sugeneruoti (pip3 install brotli)")
+    stats = write_bundle(bundle_dir=args.output_dir)
+    print_bundle_report(stats)
+    print(f"✓ Sugeneruotas {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
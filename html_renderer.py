@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bendras pilno vertimo HTML generatorius
+Šablonai sukompiliuojami vieną kartą modulio lygyje, puslapiai rašomi
+srautu į failą (arba io.StringIO), o stiliai imami iš styles.css
+(body.pilnas-vertimas), vietoj kiekviename faile įterpto CSS bloko.
+"""
+
+import html
+import io
+import time
+from string import Template
+
+HEADER_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="lt">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$pavadinimas - PILNAS VERTIMAS 100%</title>
+    <link rel="stylesheet" href="styles.css">
+</head>
+<body class="pilnas-vertimas">
+    <header>
+        <div class="container">
+            <h1>Traumos Tyrimai Baltijos Šalyse</h1>
+            <p class="tagline">Mokslinių straipsnių biblioteka</p>
+        </div>
+    </header>
+
+    <main class="container">
+        <a href="straipsnis.html?id=$id" class="back-btn">← Grįžti į santrauką</a>
+        <a href="index.html" class="back-btn">← Grįžti į pagrindinį</a>
+
+        <article class="pilnas-straipsnis">
+            <h1>$pavadinimas</h1>
+            <h2>PILNAS AUTOMATINIS VERTIMAS (100%)</h2>
+
+            <div class="meta-info">
+$meta_rows            </div>
+
+            <div class="warning">
+                <strong>⚠ SVARBI PASTABA:</strong> Tai yra automatinis vertimas naudojant Google Translate.
+                Akademiniai terminai ir sudėtingos frazės gali būti išversti ne visai tiksliai.
+                Svarbiems teiginiams rekomenduojama pasitikrinti su originaliu PDF failu.
+            </div>
+""")
+
+META_ROW_TEMPLATE = Template("""                <p><strong>$label:</strong> $value</p>
+""")
+
+PAGE_TEMPLATE = Template("""
+            <div class="page-section">
+                <div class="page-number">📄 Originalus puslapis $page</div>
+                <div class="page-text">$text</div>
+            </div>
+""")
+
+FOOTER_TEMPLATE = Template("""
+            <div class="meta-info" style="margin-top: 50px;">
+                <h3>Apie šį vertimą</h3>
+                <p>Šis vertimas buvo sukurtas automatiškai naudojant Google Translate API.</p>
+                <p>Iš viso išversta <strong>$page_count puslapių</strong> akademinio teksto.</p>
+                <p>Vertimas apima visą straipsnio turinį.</p>
+            </div>
+
+        </article>
+    </main>
+
+    <footer>
+        <div class="container">
+            <p>&copy; 2026 Traumos Tyrimai Baltijos Šalyse | Automatinis vertimas</p>
+        </div>
+    </footer>
+</body>
+</html>
+""")
+
+# Lygiagretus vaizdas (originalas | vertimas) iš segmentų saugyklos
+PARALLEL_HEADER_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="lt">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$pavadinimas - ORIGINALAS IR VERTIMAS</title>
+    <link rel="stylesheet" href="styles.css">
+</head>
+<body class="pilnas-vertimas">
+    <header>
+        <div class="container">
+            <h1>Traumos Tyrimai Baltijos Šalyse</h1>
+            <p class="tagline">Mokslinių straipsnių biblioteka</p>
+        </div>
+    </header>
+
+    <main class="container">
+        <a href="$pilnas_vertimas" class="back-btn">← Grįžti į pilną vertimą</a>
+        <a href="index.html" class="back-btn">← Grįžti į pagrindinį</a>
+
+        <article class="pilnas-straipsnis">
+            <h1>$pavadinimas</h1>
+            <h2>ORIGINALAS IR VERTIMAS</h2>
+""")
+
+PARALLEL_PAGE_TEMPLATE = Template("""
+            <div class="page-section">
+                <div class="page-number">📄 Originalus puslapis $page</div>
+                <table class="lygiagretus">
+$rows                </table>
+            </div>
+""")
+
+PARALLEL_ROW_TEMPLATE = Template("""                    <tr$row_class><td lang="en">$source</td><td lang="lt">$translated</td></tr>
+""")
+
+PARALLEL_FOOTER_TEMPLATE = Template("""
+        </article>
+    </main>
+
+    <footer>
+        <div class="container">
+            <p>&copy; 2026 Traumos Tyrimai Baltijos Šalyse | Automatinis vertimas</p>
+        </div>
+    </footer>
+</body>
+</html>
+""")
+
+
+ERROR_MARKER = '[VERTIMO KLAIDA:'
+
+# Straipsnio laukai, kurie patenka į HTML (kiti manifesto laukai HTML nekeičia)
+META_FIELDS = ('id', 'pavadinimas', 'original_title', 'autoriai', 'institucija', 'saltinis', 'doi', 'pdf_file')
+
+
+def meta_items(straipsnis_info, translation_date):
+    """Meta informacijos (pavadinimas, reikšmė) poros be HTML (neprivalomi laukai praleidžiami)"""
+    rows = []
+    if straipsnis_info.get('original_title'):
+        rows.append(("Originalus pavadinimas", straipsnis_info['original_title']))
+    rows.append(("Autoriai", straipsnis_info['autoriai']))
+    if straipsnis_info.get('institucija'):
+        rows.append(("Institucija", straipsnis_info['institucija']))
+    if straipsnis_info.get('saltinis'):
+        rows.append(("Šaltinis", straipsnis_info['saltinis']))
+    if straipsnis_info.get('doi'):
+        rows.append(("DOI", straipsnis_info['doi']))
+    if straipsnis_info.get('pdf_file'):
+        rows.append(("PDF", straipsnis_info['pdf_file']))
+    rows.append(("Vertimo data", translation_date))
+    rows.append(("Vertimo metodas", "Google Translate API (deep-translator)"))
+    return rows
+
+
+def _meta_rows(straipsnis_info, translation_date):
+    """Meta informacijos eilutės HTML (DOI ir PDF - nuorodos; reikšmės ekranuojamos)"""
+    html_rows = []
+    for label, value in meta_items(straipsnis_info, translation_date):
+        value = html.escape(str(value))
+        if label == "DOI":
+            value = f'<a href="{value}" target="_blank">{value}</a>'
+        elif label == "PDF":
+            value = f'<a href="{value}" target="_blank">Originalus PDF</a>'
+        html_rows.append(META_ROW_TEMPLATE.substitute(label=label, value=value))
+    return "".join(html_rows)
+
+
+def render_header(straipsnis_info, translation_date=None):
+    """HTML dokumento pradžia iki pirmo puslapio"""
+    if translation_date is None:
+        translation_date = time.strftime('%Y m. %B %d d.')
+    return HEADER_TEMPLATE.substitute(
+        id=html.escape(str(straipsnis_info['id'])),
+        pavadinimas=html.escape(straipsnis_info['pavadinimas']),
+        meta_rows=_meta_rows(straipsnis_info, translation_date)
+    )
+
+
+def render_page(page_data):
+    """Vieno išversto puslapio HTML blokas (tekstas ekranuojamas, klaidų žymės paryškinamos)"""
+    translated_text = html.escape(page_data['translated'])
+    if '[KLAIDA:' in translated_text:
+        translated_text = translated_text.replace('[KLAIDA:', f'<span style="color: red;">{ERROR_MARKER}</span>')
+    return PAGE_TEMPLATE.substitute(page=page_data['page'], text=translated_text)
+
+
+def render_footer(page_count):
+    """HTML dokumento pabaiga"""
+    return FOOTER_TEMPLATE.substitute(page_count=page_count)
+
+
+def write_html(translated_pages, straipsnis_info, out, translation_date=None):
+    """Rašyti HTML į atvirą failą po vieną puslapį; grąžina puslapių skaičių"""
+    out.write(render_header(straipsnis_info, translation_date))
+    out.flush()
+    page_count = 0
+    for page_data in translated_pages:
+        out.write(render_page(page_data))
+        out.flush()
+        page_count += 1
+    out.write(render_footer(page_count))
+    return page_count
+
+
+def write_html_file(translated_pages, straipsnis_info, output_html, translation_date=None):
+    """Rašyti HTML failą srautu; grąžina puslapių skaičių"""
+    with open(output_html, 'w', encoding='utf-8') as f:
+        return write_html(translated_pages, straipsnis_info, f, translation_date)
+
+
+def render_html(translated_pages, straipsnis_info, translation_date=None):
+    """Sugeneruoti visą HTML kaip eilutę (per io.StringIO)"""
+    buffer = io.StringIO()
+    write_html(translated_pages, straipsnis_info, buffer, translation_date)
+    return buffer.getvalue()
+
+
+def render_parallel_page(page, segments):
+    """Vieno puslapio segmentų lentelė (nauja pastraipa - nauja eilutė su skirtuku)"""
+    rows = []
+    previous = None
+    for segment in segments:
+        classes = []
+        if previous is not None and segment['paragraph'] != previous:
+            classes.append('nauja-pastraipa')
+        if segment['error']:
+            classes.append('klaida')
+        previous = segment['paragraph']
+        rows.append(PARALLEL_ROW_TEMPLATE.substitute(
+            row_class=f' class="{" ".join(classes)}"' if classes else "",
+            source=html.escape(segment['source']),
+            translated=html.escape(segment['translated'])
+        ))
+    return PARALLEL_PAGE_TEMPLATE.substitute(page=page, rows="".join(rows))
+
+
+def write_parallel_html(pages, straipsnis_info, out):
+    """Rašyti lygiagretų HTML (pages: [(puslapis, [segmentai])]); grąžina puslapių skaičių"""
+    out.write(PARALLEL_HEADER_TEMPLATE.substitute(
+        pavadinimas=html.escape(straipsnis_info['pavadinimas']),
+        pilnas_vertimas=html.escape(straipsnis_info['pilnas_vertimas'])
+    ))
+    page_count = 0
+    for page, segments in pages:
+        out.write(render_parallel_page(page, segments))
+        page_count += 1
+    out.write(PARALLEL_FOOTER_TEMPLATE.substitute())
+    return page_count
+
+
+def has_translation_errors(output_html):
+    """Ar sugeneruotame HTML liko nepavykusių vertimo gabalų (failo nėra - irgi klaida)"""
+    try:
+        with open(output_html, 'r', encoding='utf-8') as f:
+            return ERROR_MARKER in f.read()
+    except FileNotFoundError:
+        return True
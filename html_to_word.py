@@ -2,54 +2,36 @@
 # -*- coding: utf-8 -*-
 """
 HTML į Word konvertavimo skriptas
-Konvertuoja pilnus HTML vertimus į Word dokumentus
+Konvertuoja pilnus vertimus į Word dokumentus. Turinys imamas iš struktūrinio
+vertimo modelio (straipsnis-N-pilnas.json); HTML analizuojamas tik tada, kai
+modelio nėra (seni vertimai).
 """
 
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+import io
+import os
 import re
+import zipfile
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from build_manifest import BuildManifest, data_hash, source_hash
+from articles import parse_ids, select_articles
+from html_renderer import ERROR_MARKER, meta_items
+from translation_model import load_model, model_path, model_pages
 
-# Straipsnių informacija
-STRAIPSNIAI = [
-    {
-        "id": 1,
-        "html_file": "straipsnis-1-pilnas.html",
-        "pavadinimas": "Traumos tyrimai Baltijos šalyse: nuo politinio engimo iki atsigavimo",
-        "autoriai": "Evaldas Kazlauskas ir Paulina Zelvienė"
-    },
-    {
-        "id": 2,
-        "html_file": "straipsnis-2-pilnas.html",
-        "pavadinimas": "Holokausto tarpkartinės pasekmės palikuonių psichinei sveikatai",
-        "autoriai": "Patricia Dashorst, Trudy M. Mooren, Rolf J. Kleber, et al."
-    },
-    {
-        "id": 3,
-        "html_file": "straipsnis-3-pilnas.html",
-        "pavadinimas": "Potrauminis augimas: koncepciniai pagrindai ir empiriniai įrodymai",
-        "autoriai": "Richard G. Tedeschi ir Lawrence G. Calhoun"
-    },
-    {
-        "id": 4,
-        "html_file": "straipsnis-4-pilnas.html",
-        "pavadinimas": "Psichoterapijos metodai PTSS gydymui: kas jiems bendra?",
-        "autoriai": "Ulrich Schnyder, Anke Ehlers, Thomas Elbert, et al."
-    },
-    {
-        "id": 5,
-        "html_file": "straipsnis-5-pilnas.html",
-        "pavadinimas": "Sveikatos priežiūros teikimo traumuotoms populiacijoms iššūkiai",
-        "autoriai": "Evaldas Kazlauskas"
-    },
-    {
-        "id": 6,
-        "html_file": "straipsnis-6-pilnas.html",
-        "pavadinimas": "Psichologinės potrauminio streso sutrikimo teorijos",
-        "autoriai": "Chris R. Brewin ir Emily A. Holmes"
-    }
-]
+# lxml (C) parseris kelis kartus greitesnis už html.parser, rezultatas tas pats
+HTML_PARSER = 'lxml'
+
+# Moduliai, nuo kurių priklauso Word rezultatas
+DOCX_MODULES = ('html_to_word.py', 'translation_model.py', 'html_renderer.py')
+
+# Fiksuota ZIP įrašų data - tas pats turinys duoda tą patį .docx failą
+DOCX_TIMESTAMP = (2000, 1, 1, 0, 0, 0)
 
 def extract_content_from_html(html_file):
     """Išgauti turinį iš HTML failo"""
@@ -59,10 +41,10 @@ def extract_content_from_html(html_file):
         with open(html_file, 'r', encoding='utf-8') as f:
             html_content = f.read()
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
 
-        # Išgauti pavadinimą
-        title_elem = soup.find('h1')
+        # Išgauti straipsnio pavadinimą (pirmas h1 - svetainės antraštė)
+        title_elem = soup.select_one('article h1') or soup.find('h1')
         title = title_elem.get_text() if title_elem else "Nežinomas pavadinimas"
 
         # Išgauti meta informaciją
@@ -100,114 +82,360 @@ def extract_content_from_html(html_file):
         print(f"Klaida skaitant HTML failą: {e}")
         return None
 
+def _element_text(elem):
+    return "".join(elem.itertext())
+
+def _has_class(elem, name):
+    return name in (elem.get('class') or "").split()
+
+def _page_from_section(section):
+    """Puslapio numeris ir tekstas iš div.page-section (None, jei jų nėra)"""
+    number = text = None
+    for child in section:
+        if _has_class(child, 'page-number'):
+            number = _element_text(child)
+        elif _has_class(child, 'page-text'):
+            text = _element_text(child)
+    if number is None or text is None:
+        return None
+    return {'number': number, 'text': text}
+
+# Puslapio bloko pradžia (html_renderer.PAGE_TEMPLATE)
+SECTION_START = '<div class="page-section">'
+READ_BLOCK = 64 * 1024
+
+def _iter_html_parts(html_file):
+    """Skaityti HTML dalimis: pirma - pradžia iki pirmo puslapio, toliau - po vieną page-section"""
+    buffer = ""
+    first = True
+    with open(html_file, 'r', encoding='utf-8') as f:
+        for block in iter(lambda: f.read(READ_BLOCK), ''):
+            buffer += block
+            parts = buffer.split(SECTION_START)
+            for part in parts[:-1]:
+                yield part if first else SECTION_START + part
+                first = False
+            buffer = parts[-1]
+    yield buffer if first else SECTION_START + buffer
+
+def stream_content_from_html(html_file):
+    """
+    Tas pats turinys kaip extract_content_from_html, bet puslapiai - generatorius
+    Failas skaitomas dalimis ir kiekvienas page-section analizuojamas lxml atskirai.
+    (lxml iterparse HTML režimu laiko visą perskaitytą failą atmintyje, todėl čia
+    atmintis priklauso tik nuo vieno puslapio dydžio.)
+    """
+    print(f"Skaitomas HTML failas (srautu): {html_file}")
+    parts = _iter_html_parts(html_file)
+    header = lxml_html.document_fromstring(next(parts))
+
+    title_elem = header.find('.//article/h1')
+    if title_elem is None:
+        title_elem = header.find('.//h1')
+    meta = {}
+    meta_div = header.find_class('meta-info')
+    if meta_div:
+        for p in meta_div[0].iter('p'):
+            text = _element_text(p)
+            if ':' in text:
+                key, value = text.split(':', 1)
+                meta[key.strip()] = value.strip()
+
+    def pages():
+        for part in parts:
+            for section in lxml_html.fragment_fromstring(part, create_parent='div').find_class('page-section'):
+                page = _page_from_section(section)
+                if page is not None:
+                    yield page
+
+    return {
+        'title': _element_text(title_elem) if title_elem is not None else "Nežinomas pavadinimas",
+        'meta': meta,
+        'pages': pages()
+    }
+
+def extract_content_from_model(model):
+    """Word turinys iš struktūrinio vertimo modelio (be HTML analizės)"""
+    straipsnis = model['straipsnis']
+    return {
+        'title': straipsnis['pavadinimas'],
+        'meta': dict(meta_items(straipsnis, model['translation_date'])),
+        'pages': (
+            {
+                'number': f"📄 Originalus puslapis {page['page']}",
+                'text': page['translated'].replace('[KLAIDA:', ERROR_MARKER)
+            }
+            for page in model_pages(model)
+        )
+    }
+
+def save_reproducible(doc, output_file):
+    """Išsaugoti dokumentą su fiksuotomis ZIP įrašų datomis (atomiškai)"""
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    tmp_file = output_file + ".tmp"
+    with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(tmp_file, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            info = zipfile.ZipInfo(item.filename, date_time=DOCX_TIMESTAMP)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            target.writestr(info, source.read(item.filename))
+    os.replace(tmp_file, output_file)
+
+def define_styles(doc):
+    """
+    Apibrėžti pavadintus stilius vieną kartą; grąžina {vardas: stilius}
+    Puslapių tekstas formatuojamas nuoroda į stilių, o ne kiekvienam run atskirai.
+    """
+    styles = doc.styles
+
+    title = styles['Title']
+    title.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    subtitle = styles.add_style('Vertimo paantraštė', WD_STYLE_TYPE.PARAGRAPH)
+    subtitle.base_style = styles['Heading 2']
+    subtitle.font.color.rgb = RGBColor(231, 76, 60)
+    subtitle.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    page_number = styles.add_style('Puslapio numeris', WD_STYLE_TYPE.PARAGRAPH)
+    page_number.base_style = styles['Heading 2']
+    page_number.font.color.rgb = RGBColor(52, 152, 219)
+    page_number.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
+
+    page_text = styles.add_style('Puslapio tekstas', WD_STYLE_TYPE.PARAGRAPH)
+    page_text.base_style = styles['Normal']
+    page_text.font.name = 'Times New Roman'
+    page_text.font.size = Pt(11)
+    page_text.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+    page_text.paragraph_format.space_after = Pt(18)   # vietoj tuščios pastraipos tarp puslapių
+
+    warning = styles.add_style('Įspėjimas', WD_STYLE_TYPE.PARAGRAPH)
+    warning.base_style = styles['Normal']
+    warning.font.size = Pt(10)
+    warning.font.color.rgb = RGBColor(133, 100, 4)
+
+    meta_label = styles.add_style('Meta laukas', WD_STYLE_TYPE.CHARACTER)
+    meta_label.font.bold = True
+
+    return {
+        'title': title,
+        'subtitle': subtitle,
+        'heading': styles['Heading 2'],
+        'page_number': page_number,
+        'page_text': page_text,
+        'warning': warning,
+        'meta_label': meta_label,
+    }
+
+def add_styled_paragraph(doc, text, style):
+    """
+    Pridėti pastraipą su stiliumi tiesiogiai per jo id
+    python-docx kiekvienam style= priskyrimui perrenka visus stilius, o run.text
+    rašo tekstą po simbolį - ilguose straipsniuose tai užima didžiąją laiko dalį.
+    """
+    paragraph = doc.add_paragraph()
+    paragraph._p.style = style.style_id
+    if '\t' in text or '\r' in text:
+        paragraph.add_run(text)
+        return paragraph
+    run = paragraph._p.add_r()
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            run.add_br()
+        if line:
+            run.add_t(line)
+    return paragraph
+
+def _new_document(content):
+    """Naujas dokumentas su stiliais, paraštėmis ir pradžia iki pirmo puslapio"""
+    doc = Document()
+    style = define_styles(doc)
+
+    # Nustatyti puslapio paraštės
+    sections = doc.sections
+    for section in sections:
+        section.top_margin = Inches(1)
+        section.bottom_margin = Inches(1)
+        section.left_margin = Inches(1)
+        section.right_margin = Inches(1)
+
+    # Pavadinimas ir subpavadinimas
+    doc.add_paragraph(content['title'], style['title'])
+    doc.add_paragraph('PILNAS AUTOMATINIS VERTIMAS (100%)', style['subtitle'])
+
+    doc.add_paragraph()
+
+    # Pridėti meta informaciją
+    if content['meta']:
+        meta_para = doc.add_paragraph()
+        for key, value in content['meta'].items():
+            meta_para.add_run(f"{key}: ", style['meta_label'])
+            meta_para.add_run(f"{value}\n")
+
+    # Pridėti įspėjimą
+    doc.add_paragraph(
+        "⚠ SVARBI PASTABA: Tai yra automatinis vertimas naudojant Google Translate. "
+        "Akademiniai terminai ir sudėtingos frazės gali būti išversti ne visai tiksliai. "
+        "Svarbiems teiginiams rekomenduojama pasitikrinti su originaliuoniu PDF failu.",
+        style['warning']
+    )
+
+    doc.add_page_break()
+    return doc, style
+
+def _add_footer(doc, style, page_count):
+    """Pridėti footer su informacija"""
+    doc.add_page_break()
+    doc.add_paragraph('Apie šį vertimą', style['heading'])
+    doc.add_paragraph(
+        f"Šis vertimas buvo sukurtas automatiškai naudojant Google Translate API.\n\n"
+        f"Iš viso išversta {page_count} puslapių akademinio teksto.\n\n"
+        f"Vertimas apima visą straipsnio turinį: įvadą, teorinius modelius, "
+        f"empirinius tyrimus ir išvadas."
+    )
+
 def create_word_document(content, output_file):
-    """Sukurti Word dokumentą iš HTML turinio"""
+    """Sukurti Word dokumentą iš straipsnio turinio"""
     print(f"Kuriamas Word dokumentas: {output_file}")
 
     try:
-        doc = Document()
-
-        # Nustatyti puslapio paraštės
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
-
-        # Pridėti pavadinimą
-        title = doc.add_heading(content['title'], 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-        # Pridėti subpavadinimą
-        subtitle = doc.add_heading('PILNAS AUTOMATINIS VERTIMAS (100%)', 2)
-        subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        for run in subtitle.runs:
-            run.font.color.rgb = RGBColor(231, 76, 60)
-
-        doc.add_paragraph()
-
-        # Pridėti meta informaciją
-        if content['meta']:
-            meta_para = doc.add_paragraph()
-            meta_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
-            for key, value in content['meta'].items():
-                run = meta_para.add_run(f"{key}: ")
-                run.bold = True
-                meta_para.add_run(f"{value}\n")
-
-        # Pridėti įspėjimą
-        warning = doc.add_paragraph()
-        warning_run = warning.add_run(
-            "⚠ SVARBI PASTABA: Tai yra automatinis vertimas naudojant Google Translate. "
-            "Akademiniai terminai ir sudėtingos frazės gali būti išversti ne visai tiksliai. "
-            "Svarbiems teiginiams rekomenduojama pasitikrinti su originaliuoniu PDF failu."
-        )
-        warning_run.font.size = Pt(10)
-        warning_run.font.color.rgb = RGBColor(133, 100, 4)
+        doc, style = _new_document(content)
 
-        doc.add_page_break()
-
-        # Pridėti kiekvieno puslapio turinį
+        # Pridėti kiekvieno puslapio turinį (stiliai - nuorodos, be run formatavimo)
+        page_count = 0
         for page in content['pages']:
-            # Puslapio numeris
-            page_heading = doc.add_heading(page['number'], 2)
-            page_heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            for run in page_heading.runs:
-                run.font.color.rgb = RGBColor(52, 152, 219)
-
-            # Puslapio tekstas
-            page_para = doc.add_paragraph(page['text'])
-            page_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-            for run in page_para.runs:
-                run.font.size = Pt(11)
-                run.font.name = 'Times New Roman'
-
-            doc.add_paragraph()  # Tarpas tarp puslapių
-
-        # Pridėti footer su informacija
-        doc.add_page_break()
-        footer_heading = doc.add_heading('Apie šį vertimą', 2)
-        footer_para = doc.add_paragraph(
-            f"Šis vertimas buvo sukurtas automatiškai naudojant Google Translate API.\n\n"
-            f"Iš viso išversta {len(content['pages'])} puslapių akademinio teksto.\n\n"
-            f"Vertimas apima visą straipsnio turinį: įvadą, teorinius modelius, "
-            f"empirinius tyrimus ir išvadas."
-        )
+            add_styled_paragraph(doc, page['number'], style['page_number'])
+            add_styled_paragraph(doc, page['text'], style['page_text'])
+            page_count += 1
+
+        _add_footer(doc, style, page_count)
 
         # Išsaugoti dokumentą
-        doc.save(output_file)
-        print(f"✓ Word dokumentas sėkmingai sukurtas!")
+        save_reproducible(doc, output_file)
+        print(f"✓ Word dokumentas sėkmingai sukurtas! ({page_count} puslapių)")
         return True
 
     except Exception as e:
         print(f"✗ Klaida kuriant Word dokumentą: {e}")
         return False
 
-def convert_article(straipsnis_info):
-    """Konvertuoti vieną straipsnį į Word formatą"""
-    html_file = straipsnis_info['html_file']
-    output_file = f"straipsnis-{straipsnis_info['id']}-pilnas.docx"
+# Žymekliai, kurių vietoje srautinis režimas įrašo puslapius ir jų skaičių
+PAGES_MARKER = "⟦PUSLAPIAI⟧"
+PAGE_COUNT_MARKER = "⟦PUSLAPIŲ SKAIČIUS⟧"
+
+# Simboliai, kurių negalima rašyti į XML
+_XML_INVALID_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def _text_xml(text):
+    """w:t elementas (xml:space="preserve", jei yra kraštinių tarpų - kaip python-docx)"""
+    escaped = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escaped}</w:t>'
+    return f'<w:t>{escaped}</w:t>'
+
+def paragraph_xml(text, style_id):
+    """Pastraipos XML - toks pats, kokį sukuria add_styled_paragraph"""
+    text = _XML_INVALID_RE.sub('', text).replace('\r\n', '\n').replace('\r', '\n')
+    parts = [f'<w:p><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr><w:r>']
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            parts.append('<w:br/>')
+        for j, piece in enumerate(line.split('\t')):
+            if j:
+                parts.append('<w:tab/>')
+            if piece:
+                parts.append(_text_xml(piece))
+    parts.append('</w:r></w:p>')
+    return "".join(parts)
+
+def _split_document_xml(document_xml):
+    """Padalinti document.xml ties žymekliu: (pradžia, pabaiga be žymeklio pastraipos)"""
+    position = document_xml.index(PAGES_MARKER)
+    start = document_xml.rfind('<w:p>', 0, position)
+    end = document_xml.index('</w:p>', position) + len('</w:p>')
+    return document_xml[:start], document_xml[end:]
+
+def create_word_document_streaming(content, output_file, batch_pages=50):
+    """
+    Srautinis Word dokumentas labai ilgiems straipsniams
+    python-docx sukuria tik pradžią ir pabaigą, o puslapiai (content['pages'] gali
+    būti generatorius) rašomi tiesiai į suspaustą document.xml po batch_pages.
+    Atmintis nepriklauso nuo puslapių skaičiaus.
+    """
+    print(f"Kuriamas Word dokumentas (srautu): {output_file}")
+
+    try:
+        doc, style = _new_document(content)
+        doc.add_paragraph(PAGES_MARKER)
+        _add_footer(doc, style, PAGE_COUNT_MARKER)
+
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
+
+        tmp_file = output_file + ".tmp"
+        page_count = 0
+        with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(tmp_file, 'w', zipfile.ZIP_DEFLATED) as target:
+            for item in source.infolist():
+                info = zipfile.ZipInfo(item.filename, date_time=DOCX_TIMESTAMP)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                if item.filename != 'word/document.xml':
+                    target.writestr(info, source.read(item.filename))
+                    continue
+
+                prefix, suffix = _split_document_xml(source.read(item.filename).decode('utf-8'))
+                with target.open(info, 'w') as out:
+                    out.write(prefix.encode('utf-8'))
+                    batch = []
+                    for page in content['pages']:
+                        batch.append(paragraph_xml(page['number'], style['page_number'].style_id))
+                        batch.append(paragraph_xml(page['text'], style['page_text'].style_id))
+                        page_count += 1
+                        if page_count % batch_pages == 0:
+                            out.write("".join(batch).encode('utf-8'))
+                            batch = []
+                    out.write("".join(batch).encode('utf-8'))
+                    out.write(suffix.replace(PAGE_COUNT_MARKER, str(page_count)).encode('utf-8'))
+        os.replace(tmp_file, output_file)
+        print(f"✓ Word dokumentas sėkmingai sukurtas! ({page_count} puslapių)")
+        return True
+
+    except Exception as e:
+        print(f"✗ Klaida kuriant Word dokumentą: {e}")
+        return False
+
+def convert_article(straipsnis_info, output_dir='.', stream=False):
+    """
+    Konvertuoti vieną straipsnį į Word formatą (modelis/HTML ir Word failai - output_dir kataloge)
+    stream=True - puslapiai skaitomi ir rašomi srautu (labai ilgiems straipsniams)
+    """
+    source_file = conversion_source(straipsnis_info, output_dir)
+    output_file = os.path.join(output_dir, straipsnis_info['word_file'])
 
     print("\n" + "="*70)
     print(f" STRAIPSNIS {straipsnis_info['id']}: {straipsnis_info['pavadinimas']}")
     print("="*70)
-    print(f"\n📄 HTML: {html_file}")
+    print(f"\n📄 Šaltinis: {source_file}")
     print(f"📝 Word: {output_file}")
     print("="*70 + "\n")
 
-    # 1. Išgauti turinį iš HTML
-    content = extract_content_from_html(html_file)
+    # 1. Išgauti turinį iš modelio (arba iš HTML, jei modelio nėra)
+    if source_file.endswith(".json"):
+        content = extract_content_from_model(load_model(source_file))
+    elif stream:
+        content = stream_content_from_html(source_file)
+    else:
+        content = extract_content_from_html(source_file)
 
     if not content:
-        print("✗ Nepavyko išgauti turinio iš HTML!")
+        print("✗ Nepavyko išgauti turinio!")
         return False
 
-    print(f"✓ Išgauta {len(content['pages'])} puslapių")
-
     # 2. Sukurti Word dokumentą
-    success = create_word_document(content, output_file)
+    if stream:
+        success = create_word_document_streaming(content, output_file)
+    else:
+        success = create_word_document(content, output_file)
 
     if success:
         print("\n" + "="*70)
@@ -217,32 +445,97 @@ def convert_article(straipsnis_info):
 
     return success
 
+def _convert_article_safely(straipsnis_info, output_dir='.', stream=False):
+    """convert_article, bet klaida tik atspausdinama (vieno straipsnio klaida nesustabdo kitų)"""
+    try:
+        return convert_article(straipsnis_info, output_dir, stream)
+    except Exception as e:
+        print(f"✗ KLAIDA konvertuojant straipsnį {straipsnis_info['id']}: {e}")
+        return False
+
+def convert_articles(straipsniai, jobs=1, output_dir='.', stream=False):
+    """Konvertuoti kelis straipsnius (jobs > 1 - kiekvienas atskirame procese); grąžina rezultatų sąrašą"""
+    if jobs <= 1 or len(straipsniai) <= 1:
+        return [_convert_article_safely(straipsnis, output_dir, stream) for straipsnis in straipsniai]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(straipsniai))) as pool:
+        futures = [pool.submit(_convert_article_safely, straipsnis, output_dir, stream) for straipsnis in straipsniai]
+        results = []
+        for straipsnis, future in zip(straipsniai, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # Pvz. nutrūkęs procesas (BrokenProcessPool)
+                print(f"✗ KLAIDA konvertuojant straipsnį {straipsnis['id']}: {e}")
+                results.append(False)
+        return results
+
+def conversion_source(straipsnis_info, output_dir='.'):
+    """Word turinio šaltinis: vertimo modelis, o jei jo nėra - HTML failas"""
+    path = model_path(straipsnis_info, output_dir)
+    if os.path.exists(path):
+        return path
+    return os.path.join(output_dir, straipsnis_info['pilnas_vertimas'])
+
+def conversion_inputs(manifest, straipsnis_info, code_version, output_dir='.'):
+    """Word etapo įėjimai: modelio/HTML versija (be vėliau įterpto mygtuko), failų vardai, kodo versija ir keliai"""
+    return {
+        'source': manifest.content_version(conversion_source(straipsnis_info, output_dir)),
+        'meta': data_hash([straipsnis_info['pilnas_vertimas'], straipsnis_info['word_file']]),
+        'code': code_version,
+        'outputs': [os.path.abspath(os.path.join(output_dir, straipsnis_info['word_file']))]
+    }
+
 def main():
     """Pagrindinė funkcija - konvertuoti visus straipsnius"""
+    parser = argparse.ArgumentParser(description="Konvertuoti HTML vertimus į Word")
+    parser.add_argument('--ids', type=parse_ids,
+                        help="konvertuoti tik nurodytus straipsnius, pvz. 1,3-5 (numatyta - visi)")
+    parser.add_argument('--force', action='store_true',
+                        help="konvertuoti visus straipsnius, net jei HTML nepasikeitė")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="kiek straipsnių konvertuoti lygiagrečiai atskiruose procesuose (numatyta 1)")
+    parser.add_argument('--stream', action='store_true',
+                        help="srautinis režimas: puslapiai rašomi į Word dalimis (labai ilgiems straipsniams)")
+    args = parser.parse_args()
+    straipsniai = select_articles(args.ids)
+
     print("\n" + "="*70)
     print(" VISŲ STRAIPSNIŲ KONVERTAVIMAS Į WORD FORMATĄ ")
     print("="*70)
-    print(f"\nIš viso straipsnių konvertavimui: {len(STRAIPSNIAI)}")
+    print(f"\nIš viso straipsnių konvertavimui: {len(straipsniai)}")
     print("="*70 + "\n")
 
     success_count = 0
+    skipped = 0
     failed = []
-
-    for straipsnis in STRAIPSNIAI:
-        try:
-            if convert_article(straipsnis):
-                success_count += 1
-            else:
-                failed.append(straipsnis['id'])
-        except Exception as e:
-            print(f"✗ KLAIDA konvertuojant straipsnį {straipsnis['id']}: {e}")
+    manifest = BuildManifest()
+    code_version = source_hash(*DOCX_MODULES)
+
+    pending = []
+    for straipsnis in straipsniai:
+        inputs = conversion_inputs(manifest, straipsnis, code_version)
+        if not args.force and manifest.is_fresh('docx', straipsnis['id'], inputs):
+            print(f"⏭  Straipsnis {straipsnis['id']} nepasikeitė, praleidžiamas")
+            skipped += 1
+            continue
+        pending.append((straipsnis, inputs))
+
+    results = convert_articles([straipsnis for straipsnis, _ in pending], args.jobs, stream=args.stream)
+
+    for (straipsnis, inputs), success in zip(pending, results):
+        if success:
+            success_count += 1
+            manifest.record('docx', straipsnis['id'], inputs, [straipsnis['word_file']])
+        else:
             failed.append(straipsnis['id'])
+    manifest.save()
 
     print("\n" + "="*70)
     print(" ✓✓✓ VISŲ STRAIPSNIŲ KONVERTAVIMAS BAIGTAS! ✓✓✓ ")
     print("="*70)
     print(f"\n📊 Galutinė statistika:")
-    print(f"   • Sėkmingai konvertuota: {success_count}/{len(STRAIPSNIAI)}")
+    print(f"   • Sėkmingai konvertuota: {success_count}/{len(straipsniai) - skipped}")
+    print(f"   • Praleista (nepasikeitė): {skipped}")
     if failed:
         print(f"   • Nepavyko: {', '.join(map(str, failed))}")
     print("\n")
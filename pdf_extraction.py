@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Teksto išgavimas iš PDF
+Nuoseklus arba lygiagretus (keli procesai) režimas. Lygiagrečiame režime
+puslapių intervalai paskirstomi procesams, kiekvienas atsidaro savo PdfReader.
+Išgautas tekstas saugomas šalutinėje talpykloje pagal PDF dydį, mtime ir
+turinio maišą, todėl pakartotiniai paleidimai PDF nebeanalizuoja.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import PyPDF2
+
+# Pakeitus išgavimo logiką - padidinti versiją, kad sena talpykla būtų ignoruojama
+EXTRACTOR_VERSION = f"pypdf2-{PyPDF2.__version__}/1"
+TEXT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "pdf_tekstas")
+
+
+def _extract_page_range(pdf_path, start, end):
+    """Išgauti puslapių [start, end) tekstą (vykdoma atskirame procese)"""
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return [
+            {'page': page_num + 1, 'text': pdf_reader.pages[page_num].extract_text()}
+            for page_num in range(start, end)
+        ]
+
+
+def split_page_ranges(total_pages, parts):
+    """Padalinti puslapius į beveik vienodus ištisinius intervalus"""
+    parts = max(1, min(parts, total_pages))
+    size, extra = divmod(total_pages, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def file_sha256(path):
+    """Failo turinio SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def text_cache_path(pdf_path, cache_dir=TEXT_CACHE_DIR):
+    """Šalutinės talpyklos failo kelias PDF failui"""
+    return os.path.join(cache_dir, os.path.basename(pdf_path) + ".json")
+
+
+def load_cached_text(pdf_path, cache_dir=TEXT_CACHE_DIR):
+    """Grąžinti išsaugotą puslapių tekstą, jei PDF ir išgavimo versija nepasikeitė"""
+    cache_file = text_cache_path(pdf_path, cache_dir)
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cached.get('version') != EXTRACTOR_VERSION:
+        return None
+
+    stat = os.stat(pdf_path)
+    if cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime:
+        return cached['pages']
+
+    # Dydis ar mtime pasikeitė - tikrinti turinį (pvz. failas tik nukopijuotas)
+    if cached['size'] == stat.st_size and cached['sha256'] == file_sha256(pdf_path):
+        save_cached_text(pdf_path, cached['pages'], cache_dir, sha256=cached['sha256'])
+        return cached['pages']
+
+    return None
+
+
+def save_cached_text(pdf_path, text_by_page, cache_dir=TEXT_CACHE_DIR, sha256=None):
+    """Išsaugoti puslapių tekstą šalutinėje talpykloje"""
+    os.makedirs(cache_dir, exist_ok=True)
+    stat = os.stat(pdf_path)
+    cache_file = text_cache_path(pdf_path, cache_dir)
+    tmp_file = cache_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': EXTRACTOR_VERSION,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'sha256': sha256 or file_sha256(pdf_path),
+            'pages': text_by_page
+        }, f, ensure_ascii=False)
+    os.replace(tmp_file, cache_file)
+
+
+def invalidate_text_cache(pdf_path=None, cache_dir=TEXT_CACHE_DIR):
+    """Ištrinti vieno PDF (arba visų) išgauto teksto talpyklą"""
+    if pdf_path:
+        paths = [text_cache_path(pdf_path, cache_dir)]
+    elif os.path.isdir(cache_dir):
+        paths = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+    else:
+        paths = []
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def extract_text_from_pdf(pdf_path, workers=1, use_cache=True):
+    """
+    Išgauti tekstą iš PDF failo
+    workers > 1 - puslapiai išgaunami keliais procesais, 0 - tiek procesų, kiek branduolių.
+    Grąžina [{'page', 'text'}] puslapių tvarka arba None klaidos atveju.
+    """
+    print(f"Skaitomas PDF failas: {pdf_path}")
+
+    if use_cache:
+        try:
+            cached = load_cached_text(pdf_path)
+        except OSError:
+            cached = None
+        if cached is not None:
+            print(f"✓ Tekstas paimtas iš talpyklos ({len(cached)} puslapių)")
+            return cached
+
+    text_by_page = _extract_text(pdf_path, workers)
+
+    if use_cache and text_by_page is not None:
+        try:
+            save_cached_text(pdf_path, text_by_page)
+        except OSError as e:
+            print(f"⚠ Nepavyko išsaugoti teksto talpyklos: {e}")
+
+    return text_by_page
+
+
+def iter_pdf_pages(pdf_path):
+    """
+    Srautiniu būdu grąžinti puslapius po vieną
+    Jei tekstas jau talpykloje - imamas iš jos; kitaip PDF skaitomas puslapis po puslapio
+    (talpykla šiuo atveju nepildoma, kad nereikėtų laikyti viso teksto atmintyje).
+    """
+    try:
+        cached = load_cached_text(pdf_path)
+    except OSError:
+        cached = None
+    if cached is not None:
+        yield from cached
+        return
+
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page_num, page in enumerate(pdf_reader.pages):
+            yield {'page': page_num + 1, 'text': page.extract_text()}
+
+
+def _extract_text(pdf_path, workers):
+    """Išanalizuoti PDF ir išgauti visų puslapių tekstą"""
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    try:
+        with open(pdf_path, 'rb') as file:
+            total_pages = len(PyPDF2.PdfReader(file).pages)
+        print(f"Rasta puslapių: {total_pages}")
+
+        if workers <= 1 or total_pages < 2:
+            text_by_page = []
+            for page_data in _extract_page_range(pdf_path, 0, total_pages):
+                text_by_page.append(page_data)
+                print(f"Puslapio {page_data['page']}/{total_pages} tekstas išgautas ({len(page_data['text'])} simbolių)")
+            return text_by_page
+
+        ranges = split_page_ranges(total_pages, workers)
+        print(f"⚡ Lygiagretus išgavimas: {len(ranges)} procesų")
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(_extract_page_range, pdf_path, start, end) for start, end in ranges]
+            text_by_page = [page_data for future in futures for page_data in future.result()]
+
+        print(f"✓ Išgautas {total_pages} puslapių tekstas")
+        return text_by_page
+
+    except Exception as e:
+        print(f"Klaida skaitant PDF: {e}")
+        return None
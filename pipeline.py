@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Srautinis vertimo konvejeris: PDF -> be antraščių -> pastraipos -> gabalai -> vertimas -> modelis + HTML
+Kiekvienas etapas yra generatorius ir perduoda puslapį toliau vos jis paruoštas,
+o modelis (JSON) ir HTML rašomi į failus po vieną puslapį. Atminties naudojimas nepriklauso
+nuo straipsnio ilgio, o pirmas puslapis diske atsiranda per kelias sekundes.
+"""
+
+import time
+
+from pdf_extraction import iter_pdf_pages
+from boilerplate import BoilerplateStats, strip_boilerplate_stream
+from text_processing import chunk_paragraphs, join_translated_chunks, reflow_pages
+from translation import translate_many
+from html_renderer import write_html_file
+from translation_model import write_model_stream
+
+
+def reflow_stage(pages, min_length=20):
+    """Atkurti pastraipas per puslapių ribas, praleidžiant tuščius puslapius"""
+    for page_data in reflow_pages(pages):
+        if sum(len(p) for p in page_data['paragraphs']) < min_length:
+            print(f"⊘ Puslapis {page_data['page']} tuščias arba per trumpas, praleidžiamas")
+            continue
+        yield page_data
+
+
+def chunk_stage(pages):
+    """Padalinti kiekvieno puslapio pastraipas į gabalus"""
+    for page_data in pages:
+        page_data['chunks'], page_data['paragraph_ids'] = chunk_paragraphs(page_data.pop('paragraphs'))
+        yield page_data
+
+
+def translate_stage(pages, journal=None):
+    """Išversti puslapių gabalus; jei nurodytas žurnalas - naudoti ir pildyti jį"""
+    for page_data in pages:
+        page_num = page_data['page']
+        chunks = page_data.pop('chunks')
+        paragraph_ids = page_data.pop('paragraph_ids')
+
+        if journal is not None:
+            journal.record_page(page_num, page_data['original'], chunks, paragraph_ids)
+            translated = [journal.lookup(page_num, i, chunk) for i, chunk in enumerate(chunks)]
+        else:
+            translated = [None] * len(chunks)
+
+        missing = [i for i, result in enumerate(translated) if result is None]
+
+        def record(position, result):
+            i = missing[position]
+            translated[i] = result
+            if journal is not None:
+                journal.record_chunk(page_num, i, chunks[i], result)
+
+        translate_many([chunks[i] for i in missing], on_result=record)
+
+        page_data['translated'] = join_translated_chunks(translated, paragraph_ids)
+        print(f"✓ Puslapis {page_num} išverstas ({len(chunks)} gab., {len(page_data['translated'])} simb.)")
+        yield page_data
+
+
+def run_streaming_pipeline(pdf_path, straipsnis_info, output_html, journal=None, model_file=None):
+    """Sujungti visus etapus ir srautu išversti vieną straipsnį (model_file - kartu rašyti ir modelį)"""
+    start_time = time.time()
+    translation_date = time.strftime('%Y m. %B %d d.')
+    boilerplate_stats = BoilerplateStats()
+    pages = iter_pdf_pages(pdf_path)
+    pages = strip_boilerplate_stream(pages, stats=boilerplate_stats)
+    pages = reflow_stage(pages)
+    pages = chunk_stage(pages)
+    pages = translate_stage(pages, journal)
+    if model_file is not None:
+        pages = write_model_stream(pages, straipsnis_info, model_file, translation_date)
+    page_count = write_html_file(pages, straipsnis_info, output_html, translation_date)
+    boilerplate_stats.print_report()
+    print(f"⏱  Srautinis vertimas baigtas per {(time.time() - start_time)/60:.1f}min ({page_count} puslapių)")
+    return page_count
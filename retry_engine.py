@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pakartotinių bandymų variklis vertimo užklausoms
+Klaidos skirstomos į dažnio ribojimą, laikinas ir nuolatines. Laikinos
+kartojamos su eksponentiškai didėjančia pauze ir atsitiktiniu svyravimu,
+nuolatinės nekartojamos. Kai variklis pradeda riboti užklausas, grandinės
+pertraukiklis sustabdo visas gijas, kol praeis atvėsimo laikas.
+"""
+
+import random
+import threading
+import time
+
+from translation_backends import PermanentBackendError, RateLimitError, TransientBackendError
+
+DEFAULT_ATTEMPTS = 3
+DEFAULT_BASE_DELAY = 2.0
+DEFAULT_MAX_DELAY = 60.0
+BREAKER_THRESHOLD = 3       # kiek ribojimo klaidų iš eilės atidaro pertraukiklį
+BREAKER_COOLDOWN = 30.0     # pirmoji pauzė; kiekvieną kartą dvigubinama iki BREAKER_MAX_COOLDOWN
+BREAKER_MAX_COOLDOWN = 300.0
+
+# Bibliotekų (deep-translator, googletrans, requests) klaidos atpažįstamos pagal klasės pavadinimą,
+# kad nereikėtų jų importuoti. Bendrų ValueError/TypeError čia nėra: iš jų paveldi ir
+# JSONDecodeError (sugadintas atsakymas), kurį verta kartoti
+_RATE_LIMIT_NAMES = {'TooManyRequests', 'RateLimitError'}
+_PERMANENT_NAMES = {
+    'NotValidPayload', 'NotValidLength', 'LanguageNotSupportedException', 'InvalidSourceOrTargetLanguage',
+    'ApiKeyException', 'AuthorizationException', 'PermanentBackendError',
+}
+_RATE_LIMIT_HINTS = ('429', 'too many requests', 'rate limit', 'quota')
+
+
+def classify_error(error):
+    """Klaidos rūšis: 'rate_limit', 'transient' arba 'permanent'"""
+    if isinstance(error, RateLimitError):
+        return 'rate_limit'
+    if isinstance(error, PermanentBackendError):
+        return 'permanent'
+    if isinstance(error, TransientBackendError):
+        return 'transient'
+
+    names = {cls.__name__ for cls in type(error).__mro__}
+    message = str(error).lower()
+    if names & _RATE_LIMIT_NAMES or any(hint in message for hint in _RATE_LIMIT_HINTS):
+        return 'rate_limit'
+    if names & _PERMANENT_NAMES:
+        return 'permanent'
+    # Tinklo klaidos, 5xx, tuščias atsakymas ir nežinomos klaidos - kartojamos
+    return 'transient'
+
+
+class RetryPolicy:
+    """Eksponentinė pauzė su svyravimu (equal jitter)"""
+
+    def __init__(self, attempts=DEFAULT_ATTEMPTS, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                 rng=None):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng or random.Random()
+
+    def delay(self, attempt):
+        """Pauzė prieš bandymą attempt + 1 (attempt skaičiuojamas nuo 0)"""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return ceiling / 2 + self._rng.uniform(0, ceiling / 2)
+
+
+class CircuitBreaker:
+    """Bendras visoms gijoms: po kelių ribojimo klaidų iš eilės visos užklausos palaukia"""
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN, max_cooldown=BREAKER_MAX_COOLDOWN,
+                 sleep=time.sleep):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.trips = 0
+        self._sleep = sleep
+        self._failures = 0
+        self._current_cooldown = cooldown
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Palaukti, kol pertraukiklis užsidarys"""
+        while True:
+            with self._lock:
+                remaining = self._open_until - time.monotonic()
+            if remaining <= 0:
+                return
+            self._sleep(remaining)
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._current_cooldown = self.cooldown
+
+    def record_rate_limit(self):
+        with self._lock:
+            self._failures += 1
+            now = time.monotonic()
+            if self._failures < self.threshold or now < self._open_until:
+                return
+            self._open_until = now + self._current_cooldown
+            self.trips += 1
+            self._failures = 0
+            print(f"  ⛔ Variklis riboja užklausas - visos gijos pristabdomos {self._current_cooldown:.0f}s")
+            self._current_cooldown = min(self.max_cooldown, self._current_cooldown * 2)
+
+
+class RetryEngine:
+    """Vykdo užklausas su pakartojimais, pertraukikliu ir statistika"""
+
+    def __init__(self, policy=None, breaker=None, sleep=time.sleep):
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker(sleep=sleep)
+        self.errors = {'rate_limit': 0, 'transient': 0, 'permanent': 0}
+        self.retries = 0
+        self.deferred = 0
+        self.recovered = 0
+        self.failed = 0
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def call(self, fn, *args, attempts=None):
+        """Kviesti fn(*args); po paskutinio nesėkmingo bandymo iškeliama paskutinė klaida"""
+        attempts = attempts or self.policy.attempts
+        for attempt in range(attempts):
+            self.breaker.wait()
+            try:
+                result = fn(*args)
+            except Exception as e:
+                kind = classify_error(e)
+                with self._lock:
+                    self.errors[kind] += 1
+                if kind == 'rate_limit':
+                    self.breaker.record_rate_limit()
+                if kind == 'permanent' or attempt == attempts - 1:
+                    raise
+                delay = self.policy.delay(attempt)
+                with self._lock:
+                    self.retries += 1
+                print(f"  ⚠ Vertimo klaida ({kind}, bandymas {attempt + 1}/{attempts}): {str(e)[:100]}")
+                print(f"  Laukiama {delay:.1f}s prieš kitą bandymą...")
+                self._sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
+
+    def count(self, field, amount=1):
+        """Padidinti atidėtų/atstatytų/nepavykusių gabalų skaitiklį"""
+        with self._lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def print_report(self):
+        """Atspausdinti ataskaitą"""
+        print(f"\n🔄 Pakartotiniai bandymai:")
+        print(f"   • Klaidų: ribojimas {self.errors['rate_limit']} | laikinų {self.errors['transient']} | "
+              f"nuolatinių {self.errors['permanent']} | Pakartota: {self.retries}")
+        print(f"   • Pertraukiklis suveikė: {self.breaker.trips} k. | Atidėta gabalų: {self.deferred} | "
+              f"Išversta vėliau: {self.recovered} | Nepavyko: {self.failed}")
+
+
+_retry_engine = RetryEngine()
+
+
+def configure_retry_engine(attempts=DEFAULT_ATTEMPTS, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                           cooldown=BREAKER_COOLDOWN, sleep=time.sleep):
+    """Pakeisti bendrą pakartojimų variklį"""
+    global _retry_engine
+    _retry_engine = RetryEngine(
+        RetryPolicy(attempts, base_delay, max_delay),
+        CircuitBreaker(cooldown=cooldown, max_cooldown=max(cooldown, BREAKER_MAX_COOLDOWN), sleep=sleep),
+        sleep=sleep
+    )
+    return _retry_engine
+
+
+def get_retry_engine():
+    """Grąžinti bendrą pakartojimų variklį"""
+    return _retry_engine
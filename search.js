@@ -0,0 +1,152 @@
+// Paieška po išverstą biblioteką (indeksas - bundle/search-index.json, žr. search_index.py)
+const BM25_K1 = 1.2;
+const BM25_B = 0.75;
+
+let paieskosIndeksas = null;
+
+// Užkrauti indeksą (tik pirmą kartą)
+function loadSearchIndex() {
+    if (!paieskosIndeksas) {
+        paieskosIndeksas = fetch('bundle/search-index.json')
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(response.status);
+                }
+                return response.json();
+            })
+            .then(data => {
+                const total = data.lengths.reduce((sum, length) => sum + length, 0);
+                data.averageLength = data.lengths.length ? total / data.lengths.length : 0;
+                data.decoded = new Map();
+                return data;
+            });
+    }
+    return paieskosIndeksas;
+}
+
+// Mažosios raidės be diakritikų (kaip search_index.fold)
+function fold(text) {
+    return text.toLowerCase().normalize('NFKD').replace(/\p{M}/gu, '');
+}
+
+// Nukirpti galūnę (galūnės ir minimalus stiebas - iš indekso)
+function stem(token, stemmer) {
+    if (!/^\p{L}+$/u.test(token)) {
+        return token;
+    }
+    for (const suffix of stemmer.suffixes) {
+        if (token.endsWith(suffix) && token.length - suffix.length >= stemmer.min_stem) {
+            return token.slice(0, -suffix.length);
+        }
+    }
+    return token;
+}
+
+function tokenize(text, stemmer) {
+    return (fold(text).match(/[\p{L}\p{N}]+/gu) || []).map(token => stem(token, stemmer));
+}
+
+// Plokščias sąrašas [dokumento Δ, kiekis, pozicijos Δ...] -> Map(dokumentas -> pozicijos)
+function postings(index, term) {
+    if (!index.decoded.has(term)) {
+        const flat = index.terms[term] || [];
+        const result = new Map();
+        let doc = 0;
+        for (let i = 0; i < flat.length; i += 2 + flat[i + 1]) {
+            doc += flat[i];
+            const positions = [];
+            let position = 0;
+            for (let j = i + 2; j < i + 2 + flat[i + 1]; j++) {
+                position += flat[j];
+                positions.push(position);
+            }
+            result.set(doc, positions);
+        }
+        index.decoded.set(term, result);
+    }
+    return index.decoded.get(term);
+}
+
+// Ar dokumente terminai eina iš eilės
+function matchesPhrase(index, phrase, doc) {
+    const lists = phrase.map(term => postings(index, term).get(doc));
+    if (lists.some(positions => !positions)) {
+        return false;
+    }
+    const later = lists.slice(1).map(positions => new Set(positions));
+    return lists[0].some(start => later.every((positions, shift) => positions.has(start + shift + 1)));
+}
+
+// Rezultatai pagal BM25 (frazės - kabutėse)
+function search(index, query, limit = 10) {
+    const phrases = [...query.matchAll(/"([^"]*)"/g)]
+        .map(match => tokenize(match[1], index.stemmer))
+        .filter(phrase => phrase.length);
+    const terms = new Set(tokenize(query.replace(/"([^"]*)"/g, ' '), index.stemmer));
+    phrases.forEach(phrase => phrase.forEach(term => terms.add(term)));
+
+    const docCount = index.docs.length;
+    const scores = new Map();
+    for (const term of terms) {
+        const termPostings = postings(index, term);
+        if (!termPostings.size) {
+            continue;
+        }
+        const idf = Math.log(1 + (docCount - termPostings.size + 0.5) / (termPostings.size + 0.5));
+        for (const [doc, positions] of termPostings) {
+            const tf = positions.length;
+            const norm = 1 - BM25_B + BM25_B * index.lengths[doc] / index.averageLength;
+            scores.set(doc, (scores.get(doc) || 0) + idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm));
+        }
+    }
+
+    return [...scores]
+        .filter(([doc]) => phrases.every(phrase => matchesPhrase(index, phrase, doc)))
+        .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+        .slice(0, limit)
+        .map(([doc, score]) => {
+            const [id, page] = index.docs[doc];
+            return { id, page, score, ...index.articles[id] };
+        });
+}
+
+// Rodyti paieškos rezultatus
+function displaySearchResults(results, query) {
+    const container = document.getElementById('paieskos-rezultatai');
+    if (!query.trim()) {
+        container.innerHTML = '';
+        return;
+    }
+    if (!results.length) {
+        container.innerHTML = '<p>Nieko nerasta.</p>';
+        return;
+    }
+    container.innerHTML = results.map(result => {
+        const link = result.page === 0
+            ? `<a href="straipsnis.html?id=${result.id}">Santrauka</a>`
+            : `<a href="${result.pilnas_vertimas}">Pilnas vertimas, ${result.page} psl.</a>`;
+        return `<div class="paieskos-rezultatas"><strong>${result.pavadinimas}</strong> - ${link}</div>`;
+    }).join('');
+}
+
+// Inicializuoti paiešką
+document.addEventListener('DOMContentLoaded', () => {
+    const input = document.getElementById('paieska');
+    if (!input) {
+        return;
+    }
+    input.addEventListener('focus', loadSearchIndex, { once: true });
+    input.addEventListener('input', () => {
+        const query = input.value;
+        loadSearchIndex()
+            .then(index => {
+                if (input.value === query) {
+                    displaySearchResults(search(index, query), query);
+                }
+            })
+            .catch(() => {
+                document.getElementById('paieskos-rezultatai').innerHTML =
+                    '<p>Nepavyko įkelti paieškos indekso.</p>';
+            });
+    });
+});
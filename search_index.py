@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Paieška po išverstą biblioteką (be serverio)
+Surinkimo metu straipsnių metaduomenys (pavadinimai, santrauka, turinys,
+raktiniai žodžiai) ir visų vertimų puslapiai suskaidomi į žodžius:
+mažosios raidės, be diakritikų (ą -> a, š -> s), nukirptos lietuviškos
+galūnės. Sukuriamas atvirkštinis indeksas su žodžių pozicijomis
+(bundle/search-index.json), kurį naudoja ir ši komanda, ir svetainė (search.js).
+
+    python3 search_index.py build
+    python3 search_index.py query 'politinis smurtas'
+    python3 search_index.py query '"potrauminio streso"'   # frazė
+
+Dokumentas - vienas straipsnio puslapis; 0 puslapis - straipsnio metaduomenys.
+Rezultatai rikiuojami pagal BM25.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import time
+import unicodedata
+
+from articles import REPO_DIR, get_articles
+from frontend_bundle import BUNDLE_DIR, brotli_compressor, encode_json, write_bundle_file
+from html_to_word import stream_content_from_html
+from translation_model import load_model, model_path
+
+INDEX_VERSION = 1
+INDEX_NAME = "search-index.json"
+INDEX_PATH = os.path.join(BUNDLE_DIR, INDEX_NAME)
+
+# Galūnės (be diakritikų), ilgiausios pirmiau; stiebas ne trumpesnis nei MIN_STEM
+SUFFIXES = (
+    'iuose', 'iems', 'iams', 'ioms', 'uose', 'omis', 'imis', 'umis', 'emis', 'ymas', 'imas',
+    'iais', 'iaus', 'ijos', 'ioje', 'ose', 'ams', 'oms', 'ems', 'ims', 'ums', 'ais', 'ies',
+    'ios', 'iai', 'iui', 'ius', 'uje', 'yje', 'eje', 'oje', 'ija', 'iu', 'ui', 'as', 'is',
+    'ys', 'us', 'os', 'es', 'ai', 'ei', 'ie', 'am', 'om', 'em', 'im',
+    'a', 'e', 'i', 'o', 'u', 'y', 's'
+)
+MIN_STEM = 3
+
+# Tarpas tarp metaduomenų laukų pozicijose, kad frazė neperšoktų per lauko ribą
+FIELD_GAP = 100
+
+# BM25 parametrai
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+META_SEARCH_FIELDS = ('pavadinimas', 'original_title', 'autoriai', 'santrauka')
+
+_TOKEN_RE = re.compile(r'[^\W_]+')
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+
+
+def fold(text):
+    """Mažosios raidės be diakritikų"""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def stem(token):
+    """Nukirpti ilgiausią tinkamą galūnę (skaičiai nekeičiami)"""
+    if not token.isalpha():
+        return token
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM:
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text):
+    """Teksto terminai iš eilės (pozicija = indeksas sąraše)"""
+    return [stem(token) for token in _TOKEN_RE.findall(fold(text))]
+
+
+def _page_number(label):
+    """Puslapio numeris iš "📄 Originalus puslapis N" """
+    match = re.search(r'\d+', label)
+    return int(match.group()) if match else 0
+
+
+def article_documents(straipsnis_info, output_dir=REPO_DIR):
+    """
+    Straipsnio dokumentai: (puslapis, [tekstai])
+    Puslapių tekstai imami iš vertimo modelio (su originalu anglų kalba),
+    o jei jo nėra - iš pilno vertimo HTML.
+    """
+    meta_texts = [straipsnis_info.get(field) or "" for field in META_SEARCH_FIELDS]
+    meta_texts.append(" ".join(straipsnis_info.get('raktiniai_zodziai', [])))
+    meta_texts.extend(straipsnis_info.get('turinys', {}).values())
+    yield 0, meta_texts
+
+    model_file = model_path(straipsnis_info, output_dir)
+    html_file = os.path.join(output_dir, straipsnis_info['pilnas_vertimas'])
+    if os.path.exists(model_file):
+        for page in load_model(model_file)['pages']:
+            yield page['page'], ["\n".join(page['paragraphs']), page['original']]
+    elif os.path.exists(html_file):
+        for page in stream_content_from_html(html_file)['pages']:
+            yield _page_number(page['number']), [page['text']]
+
+
+def build_index(articles, output_dir=REPO_DIR):
+    """
+    Sudaryti indeksą
+    terms: terminas -> plokščias sąrašas [dokumento Δ, kiekis, pozicijos Δ...]
+    (dokumentų numeriai ir pozicijos užrašomi skirtumais - JSON mažesnis)
+    """
+    docs = []
+    lengths = []
+    postings = {}
+    for straipsnis_info in articles:
+        for page, texts in article_documents(straipsnis_info, output_dir):
+            doc = len(docs)
+            docs.append([straipsnis_info['id'], page])
+            positions = {}
+            offset = 0
+            for text in texts:
+                terms = tokenize(text)
+                for position, term in enumerate(terms, offset):
+                    positions.setdefault(term, []).append(position)
+                offset += len(terms) + FIELD_GAP
+            lengths.append(max(offset - FIELD_GAP, 0))
+            for term, term_positions in positions.items():
+                postings.setdefault(term, []).append((doc, term_positions))
+
+    terms = {}
+    for term in sorted(postings):
+        flat = []
+        previous_doc = 0
+        for doc, term_positions in postings[term]:
+            flat.extend((doc - previous_doc, len(term_positions)))
+            previous_position = 0
+            for position in term_positions:
+                flat.append(position - previous_position)
+                previous_position = position
+            previous_doc = doc
+        terms[term] = flat
+
+    return {
+        'version': INDEX_VERSION,
+        'stemmer': {'suffixes': list(SUFFIXES), 'min_stem': MIN_STEM},
+        'articles': {
+            str(info['id']): {'pavadinimas': info['pavadinimas'], 'pilnas_vertimas': info['pilnas_vertimas']}
+            for info in articles
+        },
+        'docs': docs,
+        'lengths': lengths,
+        'terms': terms
+    }
+
+
+def decode_postings(flat):
+    """Plokščias sąrašas -> {dokumentas: [pozicijos]}"""
+    result = {}
+    doc = 0
+    i = 0
+    while i < len(flat):
+        doc += flat[i]
+        count = flat[i + 1]
+        positions = []
+        position = 0
+        for delta in flat[i + 2:i + 2 + count]:
+            position += delta
+            positions.append(position)
+        result[doc] = positions
+        i += 2 + count
+    return result
+
+
+def parse_query(query):
+    """Užklausa -> (frazės, pavieniai terminai); frazės rašomos kabutėse"""
+    phrases = [tokenize(phrase) for phrase in _PHRASE_RE.findall(query)]
+    words = tokenize(_PHRASE_RE.sub(" ", query))
+    return [phrase for phrase in phrases if phrase], words
+
+
+class SearchIndex:
+    """Užklausos indeksui (postings dekoduojami tik paklaustiems terminams)"""
+
+    def __init__(self, data):
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"Nepalaikoma paieškos indekso versija {data.get('version')}")
+        self.data = data
+        self.docs = data['docs']
+        self.lengths = data['lengths']
+        self.average_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0
+        self._postings = {}
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def postings(self, term):
+        if term not in self._postings:
+            flat = self.data['terms'].get(term)
+            self._postings[term] = decode_postings(flat) if flat else {}
+        return self._postings[term]
+
+    def _phrase_docs(self, phrase):
+        """Dokumentai, kuriuose terminai eina iš eilės"""
+        lists = [self.postings(term) for term in phrase]
+        docs = set(lists[0])
+        for postings in lists[1:]:
+            docs &= set(postings)
+        matched = set()
+        for doc in docs:
+            starts = set(lists[0][doc])
+            for shift, postings in enumerate(lists[1:], 1):
+                starts &= {position - shift for position in postings[doc]}
+                if not starts:
+                    break
+            if starts:
+                matched.add(doc)
+        return matched
+
+    def search(self, query, limit=10):
+        """Rezultatai [{'id', 'page', 'pavadinimas', 'pilnas_vertimas', 'score'}] pagal BM25"""
+        phrases, words = parse_query(query)
+        terms = set(words)
+        for phrase in phrases:
+            terms.update(phrase)
+        doc_count = len(self.docs)
+
+        scores = {}
+        for term in terms:
+            postings = self.postings(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, positions in postings.items():
+                tf = len(positions)
+                norm = 1 - BM25_B + BM25_B * self.lengths[doc] / self.average_length
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+
+        for phrase in phrases:
+            allowed = self._phrase_docs(phrase)
+            scores = {doc: score for doc, score in scores.items() if doc in allowed}
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        results = []
+        for doc, score in ranked:
+            straipsnis_id, page = self.docs[doc]
+            article = self.data['articles'][str(straipsnis_id)]
+            results.append({'id': straipsnis_id, 'page': page, 'score': round(score, 4), **article})
+        return results
+
+
+def write_index(index, bundle_dir=BUNDLE_DIR):
+    """Įrašyti indeksą į paketą (su .gz/.br); grąžina dydžius"""
+    os.makedirs(bundle_dir, exist_ok=True)
+    _, _, sizes = write_bundle_file(bundle_dir, INDEX_NAME, encode_json(index), brotli_compressor())
+    return sizes
+
+
+def main():
+    """Pagrindinė funkcija"""
+    parser = argparse.ArgumentParser(description="Paieškos indeksas išverstiems straipsniams")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build = subparsers.add_parser('build', help="sudaryti bundle/search-index.json")
+    build.add_argument('--input-dir', default=REPO_DIR, help="katalogas su vertimais (HTML/JSON)")
+    build.add_argument('--bundle-dir', default=BUNDLE_DIR, help="paketo katalogas")
+    query = subparsers.add_parser('query', help="ieškoti indekse")
+    query.add_argument('query', help="užklausa (frazės - kabutėse)")
+    query.add_argument('--limit', type=int, default=10, help="kiek rezultatų rodyti")
+    query.add_argument('--index', default=INDEX_PATH, help="indekso failas")
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        start = time.perf_counter()
+        index = build_index(get_articles(), args.input_dir)
+        raw, gz, br = write_index(index, args.bundle_dir)
+        br_text = f", br {br:,} B" if br is not None else ""
+        print(f"✓ Indeksas: {len(index['docs'])} dokumentų, {len(index['terms'])} terminų "
+              f"({raw:,} B, gz {gz:,} B{br_text}) per {time.perf_counter() - start:.1f} s")
+        return
+
+    start = time.perf_counter()
+    index = SearchIndex.load(args.index)
+    loaded = time.perf_counter()
+    results = index.search(args.query, args.limit)
+    elapsed = (time.perf_counter() - loaded) * 1000
+    print(f"🔍 {len(results)} rezultatų per {elapsed:.1f} ms (indeksas įkeltas per {(loaded - start) * 1000:.0f} ms)")
+    for result in results:
+        where = "santrauka" if result['page'] == 0 else f"{result['page']} psl."
+        print(f"   {result['score']:7.3f}  [{result['id']}] {result['pavadinimas']} - {where}")
+
+
+if __name__ == "__main__":
+    main()
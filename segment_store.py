@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sulygintų segmentų saugykla (originalas <-> vertimas)
+Kiekvienas išverstas gabalas saugomas SQLite faile kartu su šaltinio tekstu:
+(straipsnis, puslapis, segmentas, pastraipa, originalas, vertimas, variklis,
+laikas). Pirminis raktas (straipsnis, puslapis, segmentas), todėl straipsnio
+ar puslapio segmentai nuskaitomi vienu indekso intervalu.
+
+Saugykla naudojama:
+  - vertimo žurnalui: nepasikeitęs segmentas imamas iš saugyklos, o ne verčiamas;
+  - lygiagrečiam (originalas | vertimas) HTML vaizdui;
+  - greitam palyginimui - kurių segmentų šaltinis pasikeitė (tik maišos).
+
+    python3 segment_store.py diff --ids 3 --input-dir ~/vertimui
+    python3 segment_store.py stats
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from translation_cache import normalize_text
+from html_renderer import write_parallel_html
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_STORE_PATH = os.path.join(REPO_DIR, ".cache", "segmentai.sqlite")
+
+
+def source_key(text):
+    """Normalizuoto šaltinio teksto maiša"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+class SegmentStore:
+    """SQLite saugykla su sulygintais segmentais"""
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        self.reused = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Keli cli.py procesai gali rašyti vienu metu - laukiama užrakto
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS segmentai ("
+            " straipsnis INTEGER NOT NULL,"
+            " puslapis INTEGER NOT NULL,"
+            " segmentas INTEGER NOT NULL,"
+            " pastraipa INTEGER,"
+            " originalas TEXT NOT NULL,"
+            " vertimas TEXT NOT NULL,"
+            " maisa TEXT NOT NULL,"
+            " variklis TEXT NOT NULL,"
+            " klaida INTEGER NOT NULL,"
+            " laikas REAL NOT NULL,"
+            " PRIMARY KEY (straipsnis, puslapis, segmentas)) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_maisa ON segmentai (maisa, variklis)")
+        self._conn.commit()
+
+    def lookup(self, straipsnis_id, page, index, text, backend):
+        """
+        Jau išverstas segmentas su tuo pačiu šaltiniu ir varikliu arba None
+        Pirmenybė - ta pati vieta straipsnyje, kitaip - bet kuri (pvz. perkeltas puslapis).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vertimas FROM segmentai WHERE maisa = ? AND variklis = ? AND klaida = 0"
+                " ORDER BY (straipsnis = ? AND puslapis = ? AND segmentas = ?) DESC LIMIT 1",
+                (source_key(text), backend, straipsnis_id, page, index)
+            ).fetchone()
+            if row is None:
+                return None
+            self.reused += 1
+            return row[0]
+
+    def save_page(self, straipsnis_id, page, chunk_count, segments, backend):
+        """
+        Įrašyti puslapio segmentus (dict: page, index, paragraph, source, translated, error)
+        Nepasikeitę segmentai neperrašomi (laikas lieka senas); puslapio segmentai
+        nuo chunk_count (puslapis sutrumpėjo) pašalinami.
+        Grąžina įrašytų (naujų ar pakeistų) segmentų skaičių.
+        """
+        now = time.time()
+        with self._lock:
+            existing = {
+                index: (key, translated, stored_backend)
+                for index, key, translated, stored_backend in self._conn.execute(
+                    "SELECT segmentas, maisa, vertimas, variklis FROM segmentai WHERE straipsnis = ? AND puslapis = ?",
+                    (straipsnis_id, page)
+                )
+            }
+            rows = []
+            for segment in segments:
+                index = segment['index']
+                key = source_key(segment['source'])
+                if existing.get(index) == (key, segment['translated'], backend):
+                    continue
+                rows.append((straipsnis_id, page, index, segment.get('paragraph'), segment['source'],
+                             segment['translated'], key, backend, int(segment['error']), now))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO segmentai (straipsnis, puslapis, segmentas, pastraipa, originalas,"
+                " vertimas, maisa, variklis, klaida, laikas) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute(
+                "DELETE FROM segmentai WHERE straipsnis = ? AND puslapis = ? AND segmentas >= ?",
+                (straipsnis_id, page, chunk_count)
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def prune(self, straipsnis_id, pages):
+        """Pašalinti straipsnio puslapius, kurių nebėra tarp pages; grąžina pašalintų segmentų skaičių"""
+        pages = set(pages)
+        with self._lock:
+            stale = [
+                (straipsnis_id, page)
+                for page, in self._conn.execute(
+                    "SELECT DISTINCT puslapis FROM segmentai WHERE straipsnis = ?", (straipsnis_id,)
+                )
+                if page not in pages
+            ]
+            removed = self._conn.executemany(
+                "DELETE FROM segmentai WHERE straipsnis = ? AND puslapis = ?", stale
+            ).rowcount
+            self._conn.commit()
+        return removed
+
+    def article(self, straipsnis_id, backend):
+        """Vieno straipsnio ir variklio vaizdas vertimo žurnalui"""
+        return ArticleSegments(self, straipsnis_id, backend)
+
+    def segments(self, straipsnis_id, page=None):
+        """Straipsnio (ar puslapio) segmentai eilės tvarka"""
+        query = ("SELECT puslapis, segmentas, pastraipa, originalas, vertimas, variklis, klaida, laikas"
+                 " FROM segmentai WHERE straipsnis = ?")
+        params = [straipsnis_id]
+        if page is not None:
+            query += " AND puslapis = ?"
+            params.append(page)
+        query += " ORDER BY puslapis, segmentas"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {'page': page, 'index': index, 'paragraph': paragraph, 'source': source, 'translated': translated,
+             'backend': backend, 'error': bool(error), 'timestamp': timestamp}
+            for page, index, paragraph, source, translated, backend, error, timestamp in rows
+        ]
+
+    def pages(self, straipsnis_id):
+        """Segmentai sugrupuoti pagal puslapį: [(puslapis, [segmentai])]"""
+        grouped = []
+        for segment in self.segments(straipsnis_id):
+            if not grouped or grouped[-1][0] != segment['page']:
+                grouped.append((segment['page'], []))
+            grouped[-1][1].append(segment)
+        return grouped
+
+    def diff(self, straipsnis_id, pages):
+        """
+        Palyginti naują šaltinį su išsaugotu (tik maišos)
+        pages: [(puslapis, [gabalai])]. Grąžina pasikeitusius segmentus:
+        [{'status': 'pakeistas'|'naujas'|'pašalintas', 'page', 'index', 'old', 'new'}]
+        """
+        with self._lock:
+            stored = {
+                (page, index): key
+                for page, index, key in self._conn.execute(
+                    "SELECT puslapis, segmentas, maisa FROM segmentai WHERE straipsnis = ?", (straipsnis_id,)
+                )
+            }
+        changes = []
+        for page, chunks in pages:
+            for index, chunk in enumerate(chunks):
+                old_key = stored.pop((page, index), None)
+                if old_key is None:
+                    changes.append({'status': 'naujas', 'page': page, 'index': index, 'old': None, 'new': chunk})
+                elif old_key != source_key(chunk):
+                    changes.append({'status': 'pakeistas', 'page': page, 'index': index, 'old': None, 'new': chunk})
+        for page, index in stored:
+            changes.append({'status': 'pašalintas', 'page': page, 'index': index, 'old': None, 'new': None})
+
+        # Senas tekstas skaitomas tik pasikeitusiems segmentams
+        with self._lock:
+            for change in changes:
+                if change['status'] != 'naujas':
+                    change['old'] = self._conn.execute(
+                        "SELECT originalas FROM segmentai WHERE straipsnis = ? AND puslapis = ? AND segmentas = ?",
+                        (straipsnis_id, change['page'], change['index'])
+                    ).fetchone()[0]
+        changes.sort(key=lambda change: (change['page'], change['index']))
+        return changes
+
+    def stats(self):
+        """Saugyklos statistika"""
+        with self._lock:
+            articles, segments, errors = self._conn.execute(
+                "SELECT COUNT(DISTINCT straipsnis), COUNT(*), COALESCE(SUM(klaida), 0) FROM segmentai"
+            ).fetchone()
+        return {'articles': articles, 'segments': segments, 'errors': errors, 'reused': self.reused}
+
+    def print_report(self):
+        """Atspausdinti saugyklos ataskaitą"""
+        stats = self.stats()
+        print(f"\n🧩 Segmentų saugykla ({self.path}):")
+        print(f"   • Straipsnių: {stats['articles']} | Segmentų: {stats['segments']} "
+              f"(su klaidomis: {stats['errors']}) | Panaudota iš saugyklos: {stats['reused']}")
+
+    def close(self):
+        """Uždaryti duomenų bazę"""
+        with self._lock:
+            self._conn.close()
+
+
+class ArticleSegments:
+    """Saugykla, pririšta prie straipsnio ir vertimo variklio (naudoja TranslationJournal)"""
+
+    def __init__(self, store, straipsnis_id, backend):
+        self.store = store
+        self.straipsnis_id = straipsnis_id
+        self.backend = backend
+
+    def lookup(self, page, index, text):
+        return self.store.lookup(self.straipsnis_id, page, index, text, self.backend)
+
+    def save_page(self, page, chunk_count, segments):
+        return self.store.save_page(self.straipsnis_id, page, chunk_count, segments, self.backend)
+
+    def prune(self, pages):
+        return self.store.prune(self.straipsnis_id, pages)
+
+
+_default_store = None
+
+
+def get_segment_store():
+    """Grąžinti bendrą segmentų saugyklą visam paleidimui"""
+    global _default_store
+    if _default_store is None:
+        _default_store = SegmentStore()
+    return _default_store
+
+
+def set_segment_store(store):
+    """Nustatyti segmentų saugyklą (pvz. testams ar benchmark'ams)"""
+    global _default_store
+    _default_store = store
+    return store
+
+
+def parallel_path(straipsnis_info, output_dir='.'):
+    """Lygiagretaus vaizdo failas (straipsnis-N-pilnas.html -> straipsnis-N-lygiagretus.html)"""
+    name = straipsnis_info['pilnas_vertimas'].replace('-pilnas.html', '-lygiagretus.html')
+    return os.path.join(output_dir, name)
+
+
+def write_parallel_view(straipsnis_info, output_dir='.', store=None):
+    """Sukurti lygiagretų HTML iš saugyklos; grąžina (kelias, puslapių skaičius), None - segmentų nėra"""
+    pages = (store or get_segment_store()).pages(straipsnis_info['id'])
+    if not pages:
+        return None
+    path = parallel_path(straipsnis_info, output_dir)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        page_count = write_parallel_html(pages, straipsnis_info, f)
+    os.replace(tmp_path, path)
+    return path, page_count
+
+
+def source_pages(straipsnis_info, input_dir=None):
+    """Dabartinis straipsnio šaltinis gabalais (kaip verčiant): [(puslapis, [gabalai])]"""
+    # Importuojama čia: translate_all_articles pats naudoja šį modulį
+    from pdf_extraction import extract_text_from_pdf
+    from translate_all_articles import EXTRACT_WORKERS, article_paths, prepare_page_chunks
+
+    text_by_page = extract_text_from_pdf(article_paths(straipsnis_info, input_dir)[0], workers=EXTRACT_WORKERS)
+    return [(page['page'], page['chunks']) for page in prepare_page_chunks(text_by_page or [])]
+
+
+def main():
+    """Pagrindinė funkcija"""
+    from articles import parse_ids, select_articles
+
+    parser = argparse.ArgumentParser(description="Sulygintų segmentų saugykla")
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH, help="saugyklos failas")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    diff = subparsers.add_parser('diff', help="parodyti segmentus, kurių šaltinis (PDF) pasikeitė")
+    diff.add_argument('--ids', type=parse_ids, help="straipsniai, pvz. 1,3-5 (numatyta - visi)")
+    diff.add_argument('--input-dir', default=REPO_DIR, help="katalogas su PDF failais (numatyta - repozitorija)")
+    subparsers.add_parser('stats', help="saugyklos statistika")
+    args = parser.parse_args()
+
+    store = SegmentStore(args.store)
+    if args.command == 'stats':
+        store.print_report()
+        return
+
+    for straipsnis in select_articles(args.ids):
+        pages = source_pages(straipsnis, args.input_dir)
+        if not pages:
+            print(f"✗ Nepavyko išgauti straipsnio {straipsnis['id']} teksto iš PDF")
+            continue
+        start = time.perf_counter()
+        changes = store.diff(straipsnis['id'], pages)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n📑 Straipsnis {straipsnis['id']}: {len(changes)} pasikeitusių segmentų "
+              f"iš {sum(len(chunks) for _, chunks in pages)} ({elapsed:.1f} ms)")
+        for change in changes:
+            print(f"   [{change['status']}] {change['page']} psl., segmentas {change['index']}")
+            if change['old'] is not None:
+                print(f"      - {change['old'][:100]}")
+            if change['new'] is not None:
+                print(f"      + {change['new'][:100]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ function getStraipsnioId() {
     return parseInt(urlParams.get('id'));
 }
 
-// Užkrauti konkretų straipsnį
+// Užkrauti konkretų straipsnį (tik jo duomenų failą, žr. frontend_bundle.py)
 function loadStraipsnis() {
     const id = getStraipsnioId();
 
@@ -13,14 +13,18 @@ function loadStraipsnis() {
         return;
     }
 
-    const straipsnis = straipsniuDuomenys.find(s => s.id === id);
-
-    if (straipsnis) {
-        displayStraipsnis(straipsnis);
-    } else {
-        document.getElementById('straipsnis-container').innerHTML =
-            '<p>Straipsnis nerastas.</p>';
-    }
+    fetch(`bundle/straipsnis-${id}.json`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(response.status);
+            }
+            return response.json();
+        })
+        .then(displayStraipsnis)
+        .catch(() => {
+            document.getElementById('straipsnis-container').innerHTML =
+                '<p>Straipsnis nerastas.</p>';
+        });
 }
 
 // Rodyti straipsnio turinį
@@ -33,7 +37,7 @@ function displayStraipsnis(straipsnis) {
         .join('');
 
     // Turinys
-    const turinys = straipsnis.turinys;
+    const turinys = straipsnis.turinys || {};
     let turinyHTML = '';
 
     for (const [key, value] of Object.entries(turinys)) {
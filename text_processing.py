@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Teksto valymas ir skaidymas į gabalus prieš vertimą
+Skaidymas pagal sakinius saugo akademines santrumpas ("et al.", "e.g.",
+inicialus "C.R. Brewin"), per ilgus sakinius kerpa ties sakinio dalimis,
+o gabalus pakuoja tiesiniu laiku (sąrašai + join, be eilučių sudėties).
+Pastraipos atkuriamos per puslapių ribas (reflow), kad sakinys, perkeltas
+į kitą puslapį, nebūtų verčiamas dviem atskirais fragmentais.
+"""
+
+import re
+import threading
+
+MAX_CHUNK_LENGTH = 4500
+
+# Santrumpos, po kurių taškas nereiškia sakinio pabaigos (mažosiomis raidėmis)
+ABBREVIATIONS = {
+    'al', 'e.g', 'i.e', 'cf', 'vs', 'etc', 'fig', 'figs', 'no', 'nos', 'vol', 'vols',
+    'pp', 'p', 'ed', 'eds', 'dr', 'prof', 'mr', 'mrs', 'ms', 'jr', 'sr', 'st',
+    'ch', 'sec', 'eq', 'approx', 'ca', 'resp', 'viz', 'ibid', 'op', 'cit', 'tab',
+    'u.s', 'u.k', 'ph.d', 'm.d', 'b.a', 'm.a', 'jan', 'feb', 'mar', 'apr', 'jun',
+    'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec'
+}
+
+# Galimos sakinio ribos: skyrybos ženklas, neprivalomos kabutės/skliaustai, tarpai
+_BOUNDARY_RE = re.compile(r'[.!?]["\')\]]*\s+')
+# Inicialai: "C.", "C.R.", "J.-P."
+_INITIALS_RE = re.compile(r'(?:[A-Z][a-z]?\.-?)+$')
+_CLAUSE_RE = re.compile(r'(?<=[;:,])\s+')
+# Pastraipa baigta, jei paskutinė eilutė baigiasi sakinio pabaigos ženklu
+_TERMINAL_RE = re.compile(r'[.!?:]["\'”’)\]]*$')
+# Skyriaus antraštė: "1. Introduction", "1.1. Parental mental health problems"
+_HEADING_RE = re.compile(r'^\d+(?:\.\d+)*\.?\s+[A-Z]')
+
+PARAGRAPH_SEPARATOR = "\n\n"
+
+
+def clean_text(text):
+    """Išvalyti tekstą prieš vertimą"""
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def split_paragraphs(text):
+    """
+    Atkurti pastraipas iš PDF puslapio eilučių
+    Tuščia eilutė arba trumpa eilutė su sakinio pabaiga - pastraipos riba;
+    žodžiai, perkelti su brūkšneliu eilutės gale, sujungiami.
+    """
+    lines = [line.strip() for line in text.split('\n')]
+    lengths = sorted(len(line) for line in lines if line)
+    if not lengths:
+        return []
+    short_line = 0.75 * lengths[len(lengths) // 2]
+
+    paragraphs = []
+    current = []
+    for line in lines:
+        if not line:
+            if current:
+                paragraphs.append(current)
+                current = []
+            continue
+
+        if _HEADING_RE.match(line) and len(line) < short_line and not _TERMINAL_RE.search(line):
+            if current:
+                paragraphs.append(current)
+            paragraphs.append([line])
+            current = []
+            continue
+
+        if current and len(current[-1]) > 1 and current[-1].endswith('-') \
+                and current[-1][-2].isalpha() and line[0].islower():
+            current[-1] = current[-1][:-1] + line
+        else:
+            current.append(line)
+
+        if _TERMINAL_RE.search(current[-1]) and len(current[-1]) < short_line:
+            paragraphs.append(current)
+            current = []
+
+    if current:
+        paragraphs.append(current)
+
+    return [paragraph for paragraph in (clean_text(" ".join(lines)) for lines in paragraphs) if paragraph]
+
+
+def reflow_pages(text_by_page):
+    """
+    Atkurti pastraipas per visą straipsnį (generatorius, žiūri vienu puslapiu į priekį)
+    Nebaigta puslapio paskutinė pastraipa prijungiama prie kito puslapio pirmosios ir
+    priskiriama puslapiui, kuriame prasideda. Grąžina puslapius su 'paragraphs' ir
+    'offset' - pirmos pastraipos pozicija viso straipsnio tekste (puslapių žemėlapis).
+    """
+    offset = 0
+    pending = None
+
+    for page_data in text_by_page:
+        paragraphs = split_paragraphs(page_data['text'] or "")
+
+        if pending is not None:
+            if pending['paragraphs'] and paragraphs and not _TERMINAL_RE.search(pending['paragraphs'][-1]):
+                pending['paragraphs'][-1] = f"{pending['paragraphs'][-1]} {paragraphs.pop(0)}"
+            pending['offset'] = offset
+            offset += sum(len(p) + len(PARAGRAPH_SEPARATOR) for p in pending['paragraphs'])
+            yield pending
+
+        pending = {'page': page_data['page'], 'original': page_data['text'], 'paragraphs': paragraphs}
+
+    if pending is not None:
+        pending['offset'] = offset
+        yield pending
+
+
+def chunk_paragraphs(paragraphs, max_length=MAX_CHUNK_LENGTH, stats=None):
+    """Paversti pastraipas gabalais; grąžina (gabalai, kiekvieno gabalo pastraipos nr.)"""
+    chunks = []
+    paragraph_ids = []
+    for paragraph_id, paragraph in enumerate(paragraphs):
+        if len(paragraph) > max_length:
+            pieces = split_into_chunks(paragraph, max_length, stats)
+        else:
+            pieces = [paragraph]
+            (stats or _chunk_stats).add(len(split_into_sentences(paragraph)), pieces, max_length)
+        chunks.extend(pieces)
+        paragraph_ids.extend([paragraph_id] * len(pieces))
+    return chunks, paragraph_ids
+
+
+def join_translated_chunks(translated_chunks, paragraph_ids=None):
+    """Sujungti išverstus gabalus: tos pačios pastraipos - tarpu, skirtingų - tuščia eilute"""
+    if not paragraph_ids:
+        return " ".join(translated_chunks)
+
+    parts = []
+    previous = None
+    for chunk, paragraph_id in zip(translated_chunks, paragraph_ids):
+        if previous is not None:
+            parts.append(" " if paragraph_id == previous else PARAGRAPH_SEPARATOR)
+        parts.append(chunk)
+        previous = paragraph_id
+    return "".join(parts)
+
+
+def _is_abbreviation(text, end):
+    """Ar taškas pozicijoje end-1 priklauso santrumpai ar inicialui"""
+    if text[end - 1] != '.':
+        return False
+    start = text.rfind(' ', 0, end - 1) + 1
+    token = text[start:end].lstrip('([')
+    if _INITIALS_RE.fullmatch(token):
+        return True
+    return token[:-1].lower() in ABBREVIATIONS
+
+
+def split_into_sentences(text):
+    """Padalinti tekstą į sakinius, nekerpant po santrumpų ir inicialų"""
+    sentences = []
+    start = 0
+    for match in _BOUNDARY_RE.finditer(text):
+        punct_end = match.start() + 1
+        next_pos = match.end()
+        if next_pos < len(text) and (text[next_pos].islower() or text[next_pos].isdigit()):
+            continue
+        if _is_abbreviation(text, punct_end):
+            continue
+        sentence = text[start:match.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+
+def _split_oversize(sentence, max_length):
+    """Per ilgą sakinį padalinti ties sakinio dalimis (; : ,), jei reikia - ties tarpais"""
+    pieces = []
+    for pattern in (_CLAUSE_RE, re.compile(r'\s+')):
+        pieces = _pack(pattern.split(sentence), max_length)
+        if all(len(piece) <= max_length for piece in pieces):
+            return pieces
+
+    # Kraštutiniu atveju (pvz. ilgas URL) - kirpti per jėgą
+    result = []
+    for piece in pieces:
+        result.extend(piece[i:i + max_length] for i in range(0, len(piece), max_length))
+    return result
+
+
+def _pack(parts, max_length):
+    """Sudėti dalis į gabalus tiesiniu laiku (sąrašas + join)"""
+    chunks = []
+    current = []
+    current_len = 0
+    for part in parts:
+        added = len(part) + (1 if current else 0)
+        if current and current_len + added > max_length:
+            chunks.append(" ".join(current))
+            current = []
+            current_len = 0
+            added = len(part)
+        current.append(part)
+        current_len += added
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+class ChunkStats:
+    """
+    Skaidymo statistika: kiek sakinių ir gabalų, kiek užklausų iš tikrųjų
+    išsiųsta (gabalai į užklausas pakuojami vertimo variklyje) ir kaip pilnai jos užpildytos
+    """
+
+    def __init__(self):
+        self.sentences = 0
+        self.chunks = 0
+        self.requests = 0
+        self.request_chars = 0
+        self.request_capacity = 0
+        self._lock = threading.Lock()
+
+    def add(self, sentence_count, chunks, max_length):
+        with self._lock:
+            self.sentences += sentence_count
+            self.chunks += len(chunks)
+
+    def add_request(self, length, max_length):
+        """Užregistruoti variklio išsiųstą užklausą (jos ilgį ir limitą)"""
+        with self._lock:
+            self.requests += 1
+            self.request_chars += length
+            self.request_capacity += max_length
+
+    @property
+    def fill_ratio(self):
+        """Vidutinis užklausų užpildymas (0..1)"""
+        return self.request_chars / self.request_capacity if self.request_capacity else 0.0
+
+    def print_report(self):
+        """Atspausdinti skaidymo ataskaitą"""
+        saved = max(self.sentences - self.requests, 0)
+        print(f"\n✂  Skaidymas į gabalus:")
+        print(f"   • Sakinių: {self.sentences} | Gabalų: {self.chunks} | Užklausų: {self.requests} "
+              f"| Sutaupyta užklausų: {saved}")
+        print(f"   • Vidutinis užklausų užpildymas: {self.fill_ratio * 100:.1f}%")
+
+
+_chunk_stats = ChunkStats()
+
+
+def get_chunk_stats():
+    """Grąžinti bendrą skaidymo statistiką visam paleidimui"""
+    return _chunk_stats
+
+
+def split_into_chunks(text, max_length=MAX_CHUNK_LENGTH, stats=None):
+    """
+    Padalinti tekstą į gabalus (Google Translate limitas ~5000 simbolių)
+    Gabalai niekada neviršija max_length; statistika kaupiama stats (numatyta - bendra)
+    """
+    sentences = []
+    for sentence in split_into_sentences(text):
+        if len(sentence) > max_length:
+            sentences.extend(_split_oversize(sentence, max_length))
+        else:
+            sentences.append(sentence)
+
+    chunks = _pack(sentences, max_length)
+    (stats or _chunk_stats).add(len(sentences), chunks, max_length)
+    return chunks
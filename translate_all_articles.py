@@ -4,326 +4,140 @@
 Universalus PDF vertimo skriptas - Išversti visus straipsnius
 """
 
-import PyPDF2
+import os
 import time
-from deep_translator import GoogleTranslator
-import sys
-import re
-import json
-
-# Straipsnių duomenys
-STRAIPSNIAI = [
-    {
-        "id": 1,
-        "pdf_file": "2_Istorija_Trauma research in the Baltic countries-1.pdf",
-        "pavadinimas": "Traumos tyrimai Baltijos šalyse: nuo politinio engimo iki atsigavimo",
-        "autoriai": "Evaldas Kazlauskas ir Paulina Zelvienė",
-        "original_title": "Trauma research in the Baltic countries: From political oppression to recovery"
-    },
-    {
-        "id": 2,
-        "pdf_file": "7_Trauma tarp kartu_Dashorst et al..pdf",
-        "pavadinimas": "Holokausto tarpkartinės pasekmės palikuonių psichinei sveikatai",
-        "autoriai": "Patricia Dashorst, Trudy M. Mooren, Rolf J. Kleber, Peter J. de Jong & Rafaele J. C. Huntjens",
-        "original_title": "Intergenerational consequences of the Holocaust on offspring mental health"
-    },
-    {
-        "id": 3,
-        "pdf_file": "8_Posttraumatic Growth Conceptual Foundations and Empirical Evidence, Tedeschi and Calhoun.pdf",
-        "pavadinimas": "Potrauminis augimas: koncepciniai pagrindai ir empiriniai įrodymai",
-        "autoriai": "Richard G. Tedeschi ir Lawrence G. Calhoun",
-        "original_title": "Posttraumatic Growth: Conceptual Foundations and Empirical Evidence"
-    },
-    {
-        "id": 4,
-        "pdf_file": "9_Pagalbos budai PTSS_Schnyder et al..pdf",
-        "pavadinimas": "Psichoterapijos metodai PTSS gydymui: kas jiems bendra?",
-        "autoriai": "Ulrich Schnyder, Anke Ehlers, Thomas Elbert, et al.",
-        "original_title": "Psychotherapies for PTSD: what do they have in common?"
-    },
-    {
-        "id": 5,
-        "pdf_file": "10_Pagalbos budai ir issukiai_Kazlauskas.pdf",
-        "pavadinimas": "Sveikatos priežiūros teikimo traumuotoms populiacijoms iššūkiai",
-        "autoriai": "Evaldas Kazlauskas",
-        "original_title": "Challenges for providing health care to traumatized populations"
-    }
-]
-
-def extract_text_from_pdf(pdf_path):
-    """Išgauti tekstą iš PDF failo"""
-    print(f"Skaitomas PDF failas: {pdf_path}")
-    text_by_page = []
-
-    try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            total_pages = len(pdf_reader.pages)
-            print(f"Rasta puslapių: {total_pages}")
-
-            for page_num in range(total_pages):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-                text_by_page.append({
-                    'page': page_num + 1,
-                    'text': text
-                })
-                print(f"Puslapio {page_num + 1}/{total_pages} tekstas išgautas ({len(text)} simbolių)")
-    except Exception as e:
-        print(f"Klaida skaitant PDF: {e}")
-        return None
-
-    return text_by_page
-
-def clean_text(text):
-    """Išvalyti tekstą prieš vertimą"""
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
-
-def split_into_chunks(text, max_length=4500):
-    """Padalinti tekstą į gabalus"""
-    if len(text) <= max_length:
-        return [text]
-
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    chunks = []
-    current_chunk = ""
-
-    for sentence in sentences:
-        if len(current_chunk) + len(sentence) + 1 < max_length:
-            current_chunk += sentence + " "
-        else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence + " "
-
-    if current_chunk:
-        chunks.append(current_chunk.strip())
-
-    return chunks
-
-def translate_text(text, retry=3):
-    """Išversti tekstą su retry logika"""
-    if not text or not text.strip():
-        return ""
-
-    for attempt in range(retry):
-        try:
-            if attempt > 0:
-                time.sleep(2)
-
-            translator = GoogleTranslator(source='en', target='lt')
-            result = translator.translate(text)
-            time.sleep(0.5)
-            return result
-
-        except Exception as e:
-            print(f"  ⚠ Vertimo klaida (bandymas {attempt + 1}/{retry}): {str(e)[:100]}")
-            if attempt < retry - 1:
-                wait_time = (attempt + 1) * 2
-                print(f"  Laukiama {wait_time}s prieš kitą bandymą...")
-                time.sleep(wait_time)
-            else:
-                return f"[KLAIDA: {text[:50]}...]"
-
-    return text
-
-def translate_pdf_content(text_by_page):
-    """Išversti visą PDF turinį"""
-    translated_pages = []
-
-    total_pages = len(text_by_page)
+import threading
+import argparse
+from translation_cache import get_default_cache
+from concurrent_translation import DEFAULT_RATE, DEFAULT_WORKERS, configure_rate_limiter
+from translation_backends import BACKENDS, create_backend, get_default_backend, set_default_backend
+from pdf_extraction import extract_text_from_pdf
+from boilerplate import BoilerplateStats, strip_boilerplate
+from text_processing import chunk_paragraphs, get_chunk_stats, reflow_pages
+from untranslatable import get_untranslatable_stats
+from retry_engine import DEFAULT_ATTEMPTS, configure_retry_engine, get_retry_engine
+from translation import get_dedup_stats, translate_many
+from translation_journal import TranslationJournal, journal_path
+from segment_store import get_segment_store
+from pipeline import run_streaming_pipeline
+from html_renderer import META_FIELDS, has_translation_errors
+from translation_model import build_model, model_path, write_html_from_model, write_model
+from build_manifest import BuildManifest, data_hash, source_hash
+from articles import parse_ids, select_articles
+
+BASE_DIR = "/Users/Danel.Rod/Downloads/vertimui"
+
+# Moduliai, nuo kurių priklauso vertimo rezultatas (jų pakeitimas - straipsniai perrenkami)
+TRANSLATION_MODULES = (
+    'pdf_extraction.py', 'boilerplate.py', 'text_processing.py', 'untranslatable.py',
+    'translation.py', 'html_renderer.py', 'translation_model.py'
+)
+
+# Procesų skaičius PDF teksto išgavimui (1 - nuosekliai, 0 - visi branduoliai)
+EXTRACT_WORKERS = 1
+
+def prepare_page_chunks(text_by_page):
+    """Pašalinti antraštes/poraštes, atkurti pastraipas ir padalinti jas į gabalus (be vertimo)"""
+    stats = BoilerplateStats()
+    text_by_page = strip_boilerplate(text_by_page, stats=stats)
+    stats.print_report()
+
+    prepared = []
+    for page_data in reflow_pages(text_by_page):
+        if sum(len(p) for p in page_data['paragraphs']) < 20:
+            print(f"⊘ Puslapis {page_data['page']} tuščias arba per trumpas, praleidžiamas")
+            continue
+        chunks, paragraph_ids = chunk_paragraphs(page_data['paragraphs'])
+        prepared.append({
+            'page': page_data['page'],
+            'original': page_data['original'],
+            'chunks': chunks,
+            'paragraph_ids': paragraph_ids
+        })
+    return prepared
+
+def plan_article(text_by_page, journal):
+    """Užregistruoti straipsnio puslapius žurnale; grąžina dar neišverstus gabalus"""
+    pending = []
+    for page in prepare_page_chunks(text_by_page):
+        journal.record_page(page['page'], page['original'], page['chunks'], page['paragraph_ids'])
+        for i, chunk in enumerate(page['chunks']):
+            if journal.lookup(page['page'], i, chunk) is None:
+                pending.append((journal, page['page'], i, chunk))
+    return pending
+
+def open_journal(straipsnis_info, resume=False):
+    """Straipsnio vertimo žurnalas, susietas su segmentų saugykla (pagal dabartinį variklį)"""
+    segments = get_segment_store().article(straipsnis_info['id'], get_default_backend().name)
+    return TranslationJournal(journal_path(straipsnis_info['id']), resume=resume, segments=segments)
+
+def translate_pdf_content(text_by_page, journal):
+    """Išversti visą PDF turinį (gabalai pakuojami per visą straipsnį), įrašant į žurnalą"""
+    pending = plan_article(text_by_page, journal)
+    total = len(pending)
     start_time = time.time()
 
-    for page_data in text_by_page:
-        page_num = page_data['page']
-        text = page_data['text']
-
-        print(f"\n{'─'*70}")
-        print(f" Puslapis {page_num}/{total_pages}")
-        print(f"{'─'*70}")
+    print(f"✂  Verčiama gabalų: {total} (iš žurnalo: {journal.reused}, iš segmentų saugyklos: {journal.from_store})")
 
-        cleaned_text = clean_text(text)
+    # on_result kviečiamas ne eilės tvarka (neverčiami, talpykla, dublikatai) - skaičiuojami gauti gabalai
+    progress = {'done': 0}
+    progress_lock = threading.Lock()
 
-        if not cleaned_text or len(cleaned_text) < 20:
-            print(f"⊘ Puslapis {page_num} tuščias arba per trumpas, praleidžiamas")
-            continue
+    def record(i, translated):
+        _, page_num, index, chunk = pending[i]
+        journal.record_chunk(page_num, index, chunk, translated)
+        with progress_lock:
+            progress['done'] += 1
+            done = progress['done']
+        elapsed = time.time() - start_time
+        remaining = (total - done) * elapsed / done
+        print(f"  [{done}/{total}] Puslapis {page_num}: ✓ {len(chunk)} -> {len(translated)} simb. "
+              f"| Praėjo: {elapsed/60:.1f}min | Liko ~{remaining/60:.1f}min")
 
-        print(f"📄 Originalaus teksto ilgis: {len(cleaned_text)} simbolių")
+    translate_many([item[3] for item in pending], on_result=record)
 
-        chunks = split_into_chunks(cleaned_text)
-        print(f"✂  Tekstas padalintas į {len(chunks)} gabalų")
+    return journal.translated_pages()
 
-        translated_chunks = []
-        for i, chunk in enumerate(chunks):
-            chunk_len = len(chunk)
-            print(f"  [{i+1}/{len(chunks)}] Verčiamas gabalas ({chunk_len} simb.)...", end=" ")
+def translate_articles_concurrently(texts_by_article, journals, max_workers=DEFAULT_WORKERS):
+    """Išversti kelių straipsnių visų puslapių gabalus vienu bendru gijų telkiniu"""
+    pending = []
+    for text_by_page, journal in zip(texts_by_article, journals):
+        pending.extend(plan_article(text_by_page, journal))
 
-            translated_chunk = translate_text(chunk)
-            translated_chunks.append(translated_chunk)
+    print(f"⚡ Lygiagretus vertimas: {len(pending)} gabalų, {max_workers} gijų")
 
-            print(f"✓ ({len(translated_chunk)} simb.)")
+    def record(i, translated):
+        journal, page_num, index, chunk = pending[i]
+        journal.record_chunk(page_num, index, chunk, translated)
 
-        translated_page_text = " ".join(translated_chunks)
+    translate_many([item[3] for item in pending], max_workers=max_workers, on_result=record)
 
-        translated_pages.append({
-            'page': page_num,
-            'original': text,
-            'translated': translated_page_text
-        })
+    return [journal.translated_pages() for journal in journals]
 
-        elapsed = time.time() - start_time
-        avg_time = elapsed / page_num if page_num > 0 else 0
-        remaining = (total_pages - page_num) * avg_time
-
-        print(f"✓ Puslapis {page_num} baigtas | Iš viso: {len(translated_page_text)} simbolių")
-        print(f"⏱  Praėjo: {elapsed/60:.1f}min | Liko ~{remaining/60:.1f}min")
-
-    return translated_pages
+def article_paths(straipsnis_info, input_dir=None, output_dir=None):
+    """Straipsnio PDF ir HTML failų keliai (numatyta - BASE_DIR)"""
+    return (f"{input_dir or BASE_DIR}/{straipsnis_info['pdf_file']}",
+            f"{output_dir or BASE_DIR}/{straipsnis_info['pilnas_vertimas']}")
 
 def create_html_output(translated_pages, straipsnis_info, output_html):
-    """Sukurti HTML failą su vertimu"""
+    """Įrašyti struktūrinį vertimo modelį (JSON) ir iš jo sukurti HTML failą; grąžina ar pavyko"""
     print(f"\n{'─'*70}")
     print(f" Kuriamas HTML failas {output_html}")
     print(f"{'─'*70}")
 
-    html_content = f"""<!DOCTYPE html>
-<html lang="lt">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{straipsnis_info['pavadinimas']} - PILNAS VERTIMAS 100%</title>
-    <link rel="stylesheet" href="styles.css">
-    <style>
-        body {{ font-family: 'Georgia', 'Times New Roman', serif; }}
-        .pilnas-straipsnis {{
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            line-height: 1.8;
-        }}
-        .page-section {{
-            margin-bottom: 35px;
-            padding: 25px;
-            background: #fafafa;
-            border-left: 5px solid #3498db;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .page-number {{
-            font-weight: bold;
-            color: #3498db;
-            font-size: 0.9em;
-            margin-bottom: 15px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 15px;
-            margin-bottom: 25px;
-        }}
-        h2 {{
-            color: #e74c3c;
-            margin-top: 10px;
-        }}
-        .meta-info {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            margin: 25px 0;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .meta-info strong {{ color: #fff; }}
-        .meta-info a {{ color: #ffd700; text-decoration: none; }}
-        .warning {{
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 15px;
-            margin: 20px 0;
-        }}
-        .page-text {{
-            text-align: justify;
-            line-height: 1.9;
-        }}
-    </style>
-</head>
-<body>
-    <header>
-        <div class="container">
-            <h1>Traumos Tyrimai Baltijos Šalyse</h1>
-            <p class="tagline">Mokslinių straipsnių biblioteka</p>
-        </div>
-    </header>
-
-    <main class="container">
-        <a href="straipsnis.html?id={straipsnis_info['id']}" class="back-btn">← Grįžti į santrauką</a>
-        <a href="index.html" class="back-btn">← Grįžti į pagrindinį</a>
-
-        <article class="pilnas-straipsnis">
-            <h1>{straipsnis_info['pavadinimas']}</h1>
-            <h2>PILNAS AUTOMATINIS VERTIMAS (100%)</h2>
-
-            <div class="meta-info">
-                <p><strong>Originalus pavadinimas:</strong> {straipsnis_info['original_title']}</p>
-                <p><strong>Autoriai:</strong> {straipsnis_info['autoriai']}</p>
-                <p><strong>PDF:</strong> <a href="{straipsnis_info['pdf_file']}" target="_blank">Originalus PDF</a></p>
-                <p><strong>Vertimo data:</strong> {time.strftime('%Y m. %B %d d.')}</p>
-                <p><strong>Vertimo metodas:</strong> Google Translate API (deep-translator)</p>
-            </div>
-
-            <div class="warning">
-                <strong>⚠ SVARBI PASTABA:</strong> Tai yra automatinis vertimas naudojant Google Translate.
-                Akademiniai terminai ir sudėtingos frazės gali būti išversti ne visai tiksliai.
-                Svarbiems teiginiams rekomenduojama pasitikrinti su originaliuoniu PDF failu.
-            </div>
-"""
-
-    for page_data in translated_pages:
-        translated_text = page_data['translated']
-        if '[KLAIDA:' in translated_text:
-            translated_text = translated_text.replace('[KLAIDA:', '<span style="color: red;">[VERTIMO KLAIDA:</span>')
-
-        html_content += f"""
-            <div class="page-section">
-                <div class="page-number">📄 Originalus puslapis {page_data['page']}</div>
-                <div class="page-text">{translated_text}</div>
-            </div>
-"""
-
-    html_content += f"""
-            <div class="meta-info" style="margin-top: 50px;">
-                <h3>Apie šį vertimą</h3>
-                <p>Šis vertimas buvo sukurtas automatiškai naudojant Google Translate API.</p>
-                <p>Iš viso išversta <strong>{len(translated_pages)} puslapių</strong> akademinio teksto.</p>
-                <p>Vertimas apima visą straipsnio turinį.</p>
-            </div>
-
-        </article>
-    </main>
-
-    <footer>
-        <div class="container">
-            <p>&copy; 2026 Traumos Tyrimai Baltijos Šalyse | Automatinis vertimas</p>
-        </div>
-    </footer>
-</body>
-</html>
-"""
-
     try:
-        with open(output_html, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        model = build_model(translated_pages, straipsnis_info)
+        write_model(model, model_path(straipsnis_info, os.path.dirname(output_html)))
+        write_html_from_model(model, output_html)
         print(f"✓ HTML failas sėkmingai sukurtas!")
+        return True
     except Exception as e:
         print(f"✗ Klaida kuriant HTML: {e}")
+        return False
 
-def translate_article(straipsnis_info):
+def translate_article(straipsnis_info, resume=False, input_dir=None, output_dir=None):
     """Išversti vieną straipsnį"""
-    base_dir = "/Users/Danel.Rod/Downloads/vertimui"
-    pdf_path = f"{base_dir}/{straipsnis_info['pdf_file']}"
-    output_html = f"{base_dir}/straipsnis-{straipsnis_info['id']}-pilnas.html"
+    pdf_path, output_html = article_paths(straipsnis_info, input_dir, output_dir)
 
     print("\n" + "="*70)
     print(f" STRAIPSNIS {straipsnis_info['id']}: {straipsnis_info['pavadinimas']}")
@@ -333,7 +147,7 @@ def translate_article(straipsnis_info):
     print("\n" + "="*70 + "\n")
 
     # 1. Išgauti tekstą iš PDF
-    text_by_page = extract_text_from_pdf(pdf_path)
+    text_by_page = extract_text_from_pdf(pdf_path, workers=EXTRACT_WORKERS)
 
     if not text_by_page:
         print("✗ Nepavyko išgauti teksto iš PDF!")
@@ -344,10 +158,20 @@ def translate_article(straipsnis_info):
     print(" PRADEDAMAS PILNAS 100% VERTIMAS ")
     print("="*70 + "\n")
 
-    translated_pages = translate_pdf_content(text_by_page)
+    journal = open_journal(straipsnis_info, resume)
+    try:
+        translate_pdf_content(text_by_page, journal)
+        journal.finish()
+        translated_pages = journal.translated_pages()
+    finally:
+        journal.close()
+
+    if journal.reused or journal.from_store:
+        print(f"↺ Iš žurnalo paimta {journal.reused} gabalų, iš segmentų saugyklos - {journal.from_store}")
 
-    # 3. Sukurti HTML failą
-    create_html_output(translated_pages, straipsnis_info, output_html)
+    # 3. Sukurti HTML failą (tik iš žurnalo duomenų)
+    if not create_html_output(translated_pages, straipsnis_info, output_html):
+        return False
 
     print("\n" + "="*70)
     print(f" ✓✓✓ STRAIPSNIS {straipsnis_info['id']} SĖKMINGAI IŠVERSTAS! ✓✓✓ ")
@@ -361,27 +185,167 @@ def translate_article(straipsnis_info):
 
     return True
 
+def translate_article_streaming(straipsnis_info, resume=False, input_dir=None, output_dir=None):
+    """Išversti vieną straipsnį srautiniu konvejeriu (HTML rašomas po puslapį)"""
+    pdf_path, output_html = article_paths(straipsnis_info, input_dir, output_dir)
+
+    print("\n" + "="*70)
+    print(f" STRAIPSNIS {straipsnis_info['id']} (srautu): {straipsnis_info['pavadinimas']}")
+    print("="*70)
+    print(f"\n📁 PDF failas: {pdf_path}")
+    print(f"🌐 Išvesties HTML: {output_html}\n")
+
+    # Modelis ir HTML rašomi kartu po puslapį (be viso straipsnio perpiešimo pabaigoje)
+    journal = open_journal(straipsnis_info, resume)
+    try:
+        page_count = run_streaming_pipeline(pdf_path, straipsnis_info, output_html, journal,
+                                            model_file=model_path(straipsnis_info, os.path.dirname(output_html)))
+        journal.finish()
+    finally:
+        journal.close()
+
+    print(f"\n📂 Sukurtas failas: {output_html} ({page_count} puslapių)\n")
+    return page_count > 0
+
+def translation_inputs(manifest, straipsnis_info, code_version, input_dir=None, output_dir=None):
+    """Vertimo etapo įėjimai: PDF turinys, metaduomenys, kodo/šablono versija, variklis ir išvesties failai"""
+    pdf_path, output_html = article_paths(straipsnis_info, input_dir, output_dir)
+    return {
+        'pdf': manifest.file_hash(pdf_path),
+        'meta': data_hash({field: straipsnis_info.get(field) for field in META_FIELDS}),
+        'code': code_version,
+        'backend': get_default_backend().name,
+        # Kitas --output-dir - kiti failai, todėl straipsnis ten renkamas iš naujo
+        'outputs': [os.path.abspath(output_html),
+                    os.path.abspath(model_path(straipsnis_info, os.path.dirname(output_html)))]
+    }
+
+def select_changed(manifest, straipsniai, force=False):
+    """Atrinkti straipsnius, kurių vertimo įėjimai pasikeitė; grąžina (straipsniai, įėjimai pagal id)"""
+    code_version = source_hash(*TRANSLATION_MODULES)
+    changed = []
+    inputs_by_id = {}
+    for straipsnis in straipsniai:
+        inputs = translation_inputs(manifest, straipsnis, code_version)
+        inputs_by_id[straipsnis['id']] = inputs
+        if not force and manifest.is_fresh('translate', straipsnis['id'], inputs):
+            print(f"⏭  Straipsnis {straipsnis['id']} nepasikeitė, praleidžiamas")
+        else:
+            changed.append(straipsnis)
+    return changed, inputs_by_id
+
+def record_translation(manifest, straipsnis_info, inputs, output_dir=None):
+    """Įrašyti išverstą straipsnį į manifestą (jei liko klaidų ar trūksta failų - kitą kartą bus verčiama vėl)"""
+    output_html = article_paths(straipsnis_info, output_dir=output_dir)[1]
+    if has_translation_errors(output_html):
+        manifest.invalidate('translate', straipsnis_info['id'])
+    else:
+        outputs = [output_html, model_path(straipsnis_info, os.path.dirname(output_html))]
+        try:
+            manifest.record('translate', straipsnis_info['id'], inputs, outputs)
+        except FileNotFoundError as e:
+            print(f"✗ {e}")
+            manifest.invalidate('translate', straipsnis_info['id'])
+    manifest.save()
+
+def translate_all_concurrently(straipsniai, max_workers, resume=False):
+    """Išversti visus straipsnius lygiagrečiai; grąžina (sėkmingų kiekis, nepavykę id)"""
+    success_count = 0
+    failed = []
+    extracted = []
+
+    for straipsnis in straipsniai:
+        text_by_page = extract_text_from_pdf(article_paths(straipsnis)[0], workers=EXTRACT_WORKERS)
+        if text_by_page:
+            extracted.append((straipsnis, text_by_page))
+        else:
+            print(f"✗ Nepavyko išgauti teksto iš PDF (straipsnis {straipsnis['id']})")
+            failed.append(straipsnis['id'])
+
+    journals = [open_journal(straipsnis, resume) for straipsnis, _ in extracted]
+    try:
+        results = translate_articles_concurrently([pages for _, pages in extracted], journals, max_workers)
+        for journal in journals:
+            journal.finish()
+    finally:
+        for journal in journals:
+            journal.close()
+
+    for (straipsnis, _), translated_pages in zip(extracted, results):
+        output_html = article_paths(straipsnis)[1]
+        if create_html_output(translated_pages, straipsnis, output_html):
+            success_count += 1
+        else:
+            failed.append(straipsnis['id'])
+
+    return success_count, failed
+
+def parse_args():
+    """Nuskaityti komandinės eilutės parametrus"""
+    parser = argparse.ArgumentParser(description="Išversti visus straipsnius")
+    parser.add_argument('--concurrent', action='store_true',
+                        help="versti visų straipsnių gabalus lygiagrečiai")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"gijų skaičius lygiagrečiam vertimui (numatyta {DEFAULT_WORKERS})")
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f"didžiausias užklausų skaičius per sekundę (numatyta {DEFAULT_RATE})")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='google',
+                        help="vertimo variklis (numatyta google per deep-translator)")
+    parser.add_argument('--retries', type=int, default=DEFAULT_ATTEMPTS,
+                        help=f"bandymų skaičius kiekvienai užklausai (numatyta {DEFAULT_ATTEMPTS})")
+    parser.add_argument('--extract-workers', type=int, default=EXTRACT_WORKERS,
+                        help="procesų skaičius PDF teksto išgavimui (0 - visi branduoliai)")
+    parser.add_argument('--stream', action='store_true',
+                        help="srautinis režimas: puslapiai verčiami ir rašomi į HTML po vieną")
+    parser.add_argument('--ids', type=parse_ids,
+                        help="versti tik nurodytus straipsnius, pvz. 1,3-5 (numatyta - visi manifeste)")
+    parser.add_argument('--force', action='store_true',
+                        help="versti visus straipsnius, net jei jų įėjimai nepasikeitė")
+    parser.add_argument('--resume', action='store_true',
+                        help="tęsti nutrūkusį vertimą nuo pirmo trūkstamo gabalo (pagal žurnalą)")
+    return parser.parse_args()
+
 def main():
     """Pagrindinė funkcija - išversti visus straipsnius"""
+    global EXTRACT_WORKERS
+    args = parse_args()
+    EXTRACT_WORKERS = args.extract_workers
+    configure_rate_limiter(args.rate, burst=max(1, args.workers) if args.concurrent else 1)
+    configure_retry_engine(attempts=args.retries)
+    set_default_backend(create_backend(args.backend))
+
     print("\n" + "="*70)
     print(" VISŲ STRAIPSNIŲ VERTIMAS - 100% TURINYS ")
     print("="*70)
-    print(f"\nIš viso straipsnių vertimui: {len(STRAIPSNIAI)}")
+    visi_straipsniai = select_articles(args.ids)
+    print(f"\nIš viso straipsnių vertimui: {len(visi_straipsniai)}")
     print("="*70 + "\n")
 
     start_time = time.time()
     success_count = 0
     failed = []
 
-    for straipsnis in STRAIPSNIAI:
-        try:
-            if translate_article(straipsnis):
-                success_count += 1
-            else:
+    manifest = BuildManifest()
+    straipsniai, inputs_by_id = select_changed(manifest, visi_straipsniai, args.force)
+    skipped = len(visi_straipsniai) - len(straipsniai)
+
+    if args.concurrent:
+        success_count, failed = translate_all_concurrently(straipsniai, args.workers, args.resume)
+        for straipsnis in straipsniai:
+            if straipsnis['id'] not in failed:
+                record_translation(manifest, straipsnis, inputs_by_id[straipsnis['id']])
+    else:
+        for straipsnis in straipsniai:
+            try:
+                translate_fn = translate_article_streaming if args.stream else translate_article
+                if translate_fn(straipsnis, resume=args.resume):
+                    success_count += 1
+                    record_translation(manifest, straipsnis, inputs_by_id[straipsnis['id']])
+                else:
+                    failed.append(straipsnis['id'])
+            except Exception as e:
+                print(f"✗ KLAIDA verčiant straipsnį {straipsnis['id']}: {e}")
                 failed.append(straipsnis['id'])
-        except Exception as e:
-            print(f"✗ KLAIDA verčiant straipsnį {straipsnis['id']}: {e}")
-            failed.append(straipsnis['id'])
 
     total_time = time.time() - start_time
 
@@ -389,10 +353,18 @@ def main():
     print(" ✓✓✓ VISŲ STRAIPSNIŲ VERTIMAS BAIGTAS! ✓✓✓ ")
     print("="*70)
     print(f"\n📊 Galutinė statistika:")
-    print(f"   • Sėkmingai išversta: {success_count}/{len(STRAIPSNIAI)}")
+    print(f"   • Sėkmingai išversta: {success_count}/{len(straipsniai)}")
+    print(f"   • Praleista (nepasikeitė): {skipped}")
     if failed:
         print(f"   • Nepavyko: {', '.join(map(str, failed))}")
     print(f"   • Bendras laikas: {total_time/60:.1f} minutės")
+    get_default_cache().print_report()
+    get_chunk_stats().print_report()
+    get_dedup_stats().print_report()
+    get_untranslatable_stats().print_report()
+    get_retry_engine().print_report()
+    get_segment_store().print_report()
+    print(f"   • Užklausų į vertimo variklį: {get_default_backend().requests}")
     print("\n")
 
 if __name__ == "__main__":
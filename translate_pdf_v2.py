@@ -5,99 +5,22 @@ PDF Translation Script v2 - Naudoja deep-translator biblioteką
 Išversti akademinį straipsnį iš anglų į lietuvių kalbą 100%
 """
 
-import PyPDF2
 import time
-from deep_translator import GoogleTranslator
 import sys
-import re
+from translation_cache import get_default_cache
+from pdf_extraction import extract_text_from_pdf
+from boilerplate import BoilerplateStats, strip_boilerplate
+from text_processing import clean_text, get_chunk_stats, split_into_chunks
+from untranslatable import get_untranslatable_stats
+from retry_engine import get_retry_engine
+from translation import get_dedup_stats, translate_many
+from html_renderer import write_html_file
+from articles import get_article
 
-def extract_text_from_pdf(pdf_path):
-    """Išgauti tekstą iš PDF failo"""
-    print(f"Skaitomas PDF failas: {pdf_path}")
-    text_by_page = []
+BASE_DIR = "/Users/Danel.Rod/Downloads/vertimui"
 
-    try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            total_pages = len(pdf_reader.pages)
-            print(f"Rasta puslapių: {total_pages}")
-
-            for page_num in range(total_pages):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-                text_by_page.append({
-                    'page': page_num + 1,
-                    'text': text
-                })
-                print(f"Puslapio {page_num + 1}/{total_pages} tekstas išgautas ({len(text)} simbolių)")
-    except Exception as e:
-        print(f"Klaida skaitant PDF: {e}")
-        sys.exit(1)
-
-    return text_by_page
-
-def clean_text(text):
-    """Išvalyti tekstą prieš vertimą"""
-    # Pašalinti perteklinius tarpus
-    text = re.sub(r'\s+', ' ', text)
-    # Pašalinti puslapio numerius ir antraštes
-    text = re.sub(r'\d+\s+C\.R\. Brewin.*?376', '', text)
-    return text.strip()
-
-def split_into_chunks(text, max_length=4500):
-    """
-    Padalinti tekstą į gabalus (Google Translate limitas ~5000 simbolių)
-    Stengiamės padalinti pagal sakinius, kad išlaikyt į prasmę
-    """
-    if len(text) <= max_length:
-        return [text]
-
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    chunks = []
-    current_chunk = ""
-
-    for sentence in sentences:
-        if len(current_chunk) + len(sentence) + 1 < max_length:
-            current_chunk += sentence + " "
-        else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence + " "
-
-    if current_chunk:
-        chunks.append(current_chunk.strip())
-
-    return chunks
-
-def translate_text(text, retry=3):
-    """Išversti tekstą su retry logika"""
-    if not text or not text.strip():
-        return ""
-
-    for attempt in range(retry):
-        try:
-            # Delay tarp užklausų
-            if attempt > 0:
-                time.sleep(2)
-
-            translator = GoogleTranslator(source='en', target='lt')
-            result = translator.translate(text)
-
-            # Truputį palaukti tarp sėkmingų vertimų
-            time.sleep(0.5)
-
-            return result
-
-        except Exception as e:
-            print(f"  ⚠ Vertimo klaida (bandymas {attempt + 1}/{retry}): {str(e)[:100]}")
-            if attempt < retry - 1:
-                wait_time = (attempt + 1) * 2
-                print(f"  Laukiama {wait_time}s prieš kitą bandymą...")
-                time.sleep(wait_time)
-            else:
-                return f"[KLAIDA: {text[:50]}...]"
-
-    return text  # Grąžinti originalą jei nepavyko
+# Verčiamo straipsnio duomenys (iš data/straipsniai.json)
+STRAIPSNIS = get_article(6)
 
 def translate_pdf_content(text_by_page, output_file):
     """Išversti visą PDF turinį"""
@@ -107,19 +30,26 @@ def translate_pdf_content(text_by_page, output_file):
     print(" PRADEDAMAS PILNAS 100% VERTIMAS ")
     print("="*70 + "\n")
 
+    # Pašalinti pasikartojančias antraštes, poraštes ir puslapių numerius
+    boilerplate_stats = BoilerplateStats()
+    text_by_page = strip_boilerplate(text_by_page, stats=boilerplate_stats)
+    boilerplate_stats.print_report()
+
     total_pages = len(text_by_page)
     start_time = time.time()
 
+    # Visų puslapių gabalai verčiami vienu kvietimu - variklis juos sujungia į bendras užklausas
+    pages = []
+    chunks = []
     for page_data in text_by_page:
         page_num = page_data['page']
-        text = page_data['text']
 
         print(f"\n{'─'*70}")
         print(f" Puslapis {page_num}/{total_pages}")
         print(f"{'─'*70}")
 
         # Išvalyti tekstą
-        cleaned_text = clean_text(text)
+        cleaned_text = clean_text(page_data['text'])
 
         if not cleaned_text or len(cleaned_text) < 20:
             print(f"⊘ Puslapis {page_num} tuščias arba per trumpas, praleidžiamas")
@@ -128,34 +58,37 @@ def translate_pdf_content(text_by_page, output_file):
         print(f"📄 Originalaus teksto ilgis: {len(cleaned_text)} simbolių")
 
         # Padalinti į gabalus
-        chunks = split_into_chunks(cleaned_text)
-        print(f"✂  Tekstas padalintas į {len(chunks)} gabalų")
-
-        translated_chunks = []
-        for i, chunk in enumerate(chunks):
-            chunk_len = len(chunk)
-            print(f"  [{i+1}/{len(chunks)}] Verčiamas gabalas ({chunk_len} simb.)...", end=" ")
-
-            translated_chunk = translate_text(chunk)
-            translated_chunks.append(translated_chunk)
+        page_chunks = split_into_chunks(cleaned_text)
+        print(f"✂  Tekstas padalintas į {len(page_chunks)} gabalų")
+        pages.append((page_data, len(chunks), len(page_chunks)))
+        chunks.extend(page_chunks)
+
+    total = len(chunks)
+    # on_result kviečiamas ne eilės tvarka (talpykla, dublikatai) - skaičiuojami gauti gabalai
+    progress = {'done': 0}
+
+    def record(i, translated):
+        progress['done'] += 1
+        done = progress['done']
+        elapsed = time.time() - start_time
+        remaining = (total - done) * elapsed / done
+        print(f"  [{done}/{total}] ✓ {len(chunks[i])} -> {len(translated)} simb. "
+              f"| Praėjo: {elapsed/60:.1f}min | Liko ~{remaining/60:.1f}min")
 
-            print(f"✓ ({len(translated_chunk)} simb.)")
+    print(f"\n✂  Verčiama gabalų: {total}")
+    translated_chunks = translate_many(chunks, on_result=record)
 
+    for page_data, start, count in pages:
         # Sujungti išverstus gabalus
-        translated_page_text = " ".join(translated_chunks)
+        translated_page_text = " ".join(translated_chunks[start:start + count])
 
         translated_pages.append({
-            'page': page_num,
-            'original': text,
+            'page': page_data['page'],
+            'original': page_data['text'],
             'translated': translated_page_text
         })
 
-        elapsed = time.time() - start_time
-        avg_time = elapsed / page_num
-        remaining = (total_pages - page_num) * avg_time
-
-        print(f"✓ Puslapis {page_num} baigtas | Iš viso: {len(translated_page_text)} simbolių")
-        print(f"⏱  Praėjo: {elapsed/60:.1f}min | Liko ~{remaining/60:.1f}min")
+        print(f"✓ Puslapis {page_data['page']} baigtas | Iš viso: {len(translated_page_text)} simbolių")
 
     # Išsaugoti rezultatus
     save_translation(translated_pages, output_file)
@@ -176,11 +109,11 @@ def save_translation(translated_pages, output_file):
             f.write("="*80 + "\n")
             f.write("PILNAS AKADEMINIO STRAIPSNIO VERTIMAS (100%)\n")
             f.write("="*80 + "\n\n")
-            f.write("Pavadinimas: Psichologinės potrauminio streso sutrikimo teorijos\n")
-            f.write("Originalo pavadinimas: Psychological theories of posttraumatic stress disorder\n")
-            f.write("Autoriai: Chris R. Brewin, Emily A. Holmes\n")
-            f.write("Šaltinis: Clinical Psychology Review 23 (2003) 339-376\n")
-            f.write("DOI: https://doi.org/10.1016/S0272-7358(03)00033-3\n\n")
+            f.write(f"Pavadinimas: {STRAIPSNIS['pavadinimas']}\n")
+            f.write(f"Originalo pavadinimas: {STRAIPSNIS['original_title']}\n")
+            f.write(f"Autoriai: {STRAIPSNIS['autoriai']}\n")
+            f.write(f"Šaltinis: {STRAIPSNIS['saltinis']}\n")
+            f.write(f"DOI: {STRAIPSNIS['doi']}\n\n")
             f.write(f"Vertimo data: {time.strftime('%Y-%m-%d %H:%M')}\n")
             f.write("Vertimo metodas: Google Translate (deep-translator)\n")
             f.write("="*80 + "\n\n")
@@ -203,138 +136,8 @@ def create_html_output(translated_pages, output_html):
     print(f" Kuriamas HTML failas {output_html}")
     print(f"{'─'*70}")
 
-    html_content = """<!DOCTYPE html>
-<html lang="lt">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Psichologinės potrauminio streso sutrikimo teorijos - PILNAS VERTIMAS 100%</title>
-    <link rel="stylesheet" href="styles.css">
-    <style>
-        body { font-family: 'Georgia', 'Times New Roman', serif; }
-        .pilnas-straipsnis {
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            line-height: 1.8;
-        }
-        .page-section {
-            margin-bottom: 35px;
-            padding: 25px;
-            background: #fafafa;
-            border-left: 5px solid #3498db;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .page-number {
-            font-weight: bold;
-            color: #3498db;
-            font-size: 0.9em;
-            margin-bottom: 15px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-        h1 {
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 15px;
-            margin-bottom: 25px;
-        }
-        h2 {
-            color: #e74c3c;
-            margin-top: 10px;
-        }
-        .meta-info {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            margin: 25px 0;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        .meta-info strong { color: #fff; }
-        .meta-info a { color: #ffd700; text-decoration: none; }
-        .warning {
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 15px;
-            margin: 20px 0;
-        }
-        .page-text {
-            text-align: justify;
-            line-height: 1.9;
-        }
-    </style>
-</head>
-<body>
-    <header>
-        <div class="container">
-            <h1>Traumos Tyrimai Baltijos Šalyse</h1>
-            <p class="tagline">Mokslinių straipsnių biblioteka</p>
-        </div>
-    </header>
-
-    <main class="container">
-        <a href="straipsnis.html?id=6" class="back-btn">← Grįžti į santrauką</a>
-        <a href="index.html" class="back-btn">← Grįžti į pagrindinį</a>
-
-        <article class="pilnas-straipsnis">
-            <h1>Psichologinės potrauminio streso sutrikimo teorijos</h1>
-            <h2>PILNAS AUTOMATINIS VERTIMAS (100%)</h2>
-
-            <div class="meta-info">
-                <p><strong>Originalus pavadinimas:</strong> Psychological theories of posttraumatic stress disorder</p>
-                <p><strong>Autoriai:</strong> Chris R. Brewin, Emily A. Holmes</p>
-                <p><strong>Institucija:</strong> University College London; MRC Cognition and Brain Sciences Unit, Cambridge</p>
-                <p><strong>Šaltinis:</strong> Clinical Psychology Review 23 (2003) 339-376</p>
-                <p><strong>DOI:</strong> <a href="https://doi.org/10.1016/S0272-7358(03)00033-3" target="_blank">10.1016/S0272-7358(03)00033-3</a></p>
-                <p><strong>PDF:</strong> <a href="6_PTSS teorijos_Brewin, Holmes.pdf" target="_blank">Originalus PDF</a></p>
-                <p><strong>Vertimo data:</strong> """ + time.strftime('%Y m. %B %d d.') + """</p>
-                <p><strong>Vertimo metodas:</strong> Google Translate API (deep-translator)</p>
-            </div>
-
-            <div class="warning">
-                <strong>⚠ SVARBI PASTABA:</strong> Tai yra automatinis vertimas naudojant Google Translate.
-                Akademiniai terminai ir sudėtingos frazės gali būti išversti ne visai tiksliai.
-                Svarbiems teiginiams rekomenduojama pasitikrinti su originaliuoniu PDF failu.
-            </div>
-"""
-
-    for page_data in translated_pages:
-        # Pašalinti ilgas klaidas iš teksto
-        translated_text = page_data['translated']
-        if '[KLAIDA:' in translated_text:
-            translated_text = translated_text.replace('[KLAIDA:', '<span style="color: red;">[VERTIMO KLAIDA:</span>')
-
-        html_content += f"""
-            <div class="page-section">
-                <div class="page-number">📄 Originalus puslapis {page_data['page']}</div>
-                <div class="page-text">{translated_text}</div>
-            </div>
-"""
-
-    html_content += """
-            <div class="meta-info" style="margin-top: 50px;">
-                <h3>Apie šį vertimą</h3>
-                <p>Šis vertimas buvo sukurtas automatiškai naudojant Google Translate API.</p>
-                <p>Iš viso išversta <strong>""" + str(len(translated_pages)) + """ puslapių</strong> akademinio teksto.</p>
-                <p>Vertimas apima visą straipsnio turinį: įvadą, teorinius modelius, empirinius tyrimus ir išvadas.</p>
-            </div>
-
-        </article>
-    </main>
-
-    <footer>
-        <div class="container">
-            <p>&copy; 2026 Traumos Tyrimai Baltijos Šalyse | Automatinis vertimas</p>
-        </div>
-    </footer>
-</body>
-</html>
-"""
-
     try:
-        with open(output_html, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        write_html_file(translated_pages, STRAIPSNIS, output_html)
         print(f"✓ HTML failas sėkmingai sukurtas!")
     except Exception as e:
         print(f"✗ Klaida kuriant HTML: {e}")
@@ -342,9 +145,9 @@ def create_html_output(translated_pages, output_html):
 def main():
     """Pagrindinė funkcija"""
     # Nustatymai
-    pdf_path = "/Users/Danel.Rod/Downloads/vertimui/6_PTSS teorijos_Brewin, Holmes.pdf"
-    output_txt = "/Users/Danel.Rod/Downloads/vertimui/straipsnis-6-PILNAS-100.txt"
-    output_html = "/Users/Danel.Rod/Downloads/vertimui/straipsnis-6-pilnas.html"
+    pdf_path = f"{BASE_DIR}/{STRAIPSNIS['pdf_file']}"
+    output_txt = f"{BASE_DIR}/straipsnis-{STRAIPSNIS['id']}-PILNAS-100.txt"
+    output_html = f"{BASE_DIR}/{STRAIPSNIS['pilnas_vertimas']}"
 
     print("\n" + "="*70)
     print(" AKADEMINIO STRAIPSNIO VERTIMAS - 100% PILNAS TURINYS ")
@@ -379,6 +182,11 @@ def main():
     print(f"   • HTML: {output_html}")
     print(f"\n🌐 Atidaryti naršyklėje:")
     print(f"   open {output_html}")
+    get_default_cache().print_report()
+    get_chunk_stats().print_report()
+    get_dedup_stats().print_report()
+    get_untranslatable_stats().print_report()
+    get_retry_engine().print_report()
     print("\n")
 
 if __name__ == "__main__":
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bendras vertimo kelias visiems skriptams
+Neverčiami fragmentai -> deduplikacija -> talpykla -> paketai -> vertimo variklis -> pakartojimai.
+Nepavykę paketai atidedami ir kartojami po vieną gabalą vertimo pabaigoje.
+Vienodi (po normalizacijos) segmentai verčiami vieną kartą, o vertimas
+išdalinamas visoms jų vietoms; per visą paleidimą skaičiuojama, kiek
+segmentų pasikartojo (afiliacijos, paveikslų parašai, literatūros fragmentai).
+"""
+
+import hashlib
+import threading
+
+from concurrent_translation import translate_chunks_concurrently
+from retry_engine import get_retry_engine
+from translation_backends import get_default_backend, pack_batches
+from translation_cache import get_default_cache, normalize_text
+from untranslatable import prepare_segment, restore_spans
+
+
+class SegmentDedup:
+    """Segmentų deduplikacija ir jos statistika visam paleidimui (visiems straipsniams)"""
+
+    def __init__(self):
+        self.segments = 0
+        self.seen = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text):
+        """Normalizuoto segmento maiša"""
+        return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+    def collapse(self, texts):
+        """
+        Sutraukti pasikartojančius tekstus; grąžina (unikalūs tekstai, vietos)
+        vietos[j] - visų texts indeksų, kuriems tinka unikalus tekstas j, sąrašas
+        """
+        unique = []
+        positions = []
+        index_by_key = {}
+        counted = 0
+        for i, text in enumerate(texts):
+            key = self.key(text)
+            if key not in index_by_key:
+                index_by_key[key] = len(unique)
+                unique.append(text)
+                positions.append([])
+            positions[index_by_key[key]].append(i)
+            if text.strip():
+                counted += 1
+
+        with self._lock:
+            self.segments += counted
+            self.seen.update(key for key, j in index_by_key.items() if unique[j].strip())
+        return unique, positions
+
+    @property
+    def unique(self):
+        return len(self.seen)
+
+    @property
+    def ratio(self):
+        """Pasikartojusių segmentų dalis (0..1)"""
+        return 1 - self.unique / self.segments if self.segments else 0.0
+
+    def print_report(self):
+        """Atspausdinti deduplikacijos ataskaitą"""
+        print(f"\n🔁 Segmentų deduplikacija:")
+        print(f"   • Segmentų: {self.segments} | Unikalių: {self.unique} | "
+              f"Pasikartojančių: {self.segments - self.unique} ({self.ratio * 100:.1f}%)")
+
+
+_dedup = SegmentDedup()
+
+
+def get_dedup_stats():
+    """Grąžinti bendrą deduplikacijos statistiką visam paleidimui"""
+    return _dedup
+
+
+def _translate_batch(batch, backend, retry):
+    """Išversti vieną paketą per pakartojimų variklį ir išsaugoti talpykloje (klaidos iškeliamos)"""
+    cache = get_default_cache()
+    translated = get_retry_engine().call(backend.translate_many, batch, attempts=retry)
+    for text, result in zip(batch, translated):
+        cache.put(text, result, source=backend.source, target=backend.target, backend=backend.name)
+    return translated
+
+
+def error_marker(text):
+    """Žymė vietoj gabalo, kurio nepavyko išversti"""
+    return f"[KLAIDA: {text[:50]}...]"
+
+
+def _retry_deferred(texts, deferred, backend, retry, on_result):
+    """Atidėtus gabalus bandyti dar kartą po vieną; nepavykusius pažymėti klaida"""
+    engine = get_retry_engine()
+    print(f"\n🔁 Kartojami atidėti gabalai: {len(deferred)}")
+    for i in deferred:
+        try:
+            result = _translate_batch([texts[i]], backend, retry)[0]
+            engine.count('recovered')
+        except Exception as e:
+            print(f"  ✗ Gabalo nepavyko išversti: {str(e)[:100]}")
+            engine.count('failed')
+            result = error_marker(texts[i])
+        on_result(i, result)
+
+
+def translate_many(texts, retry=None, max_workers=1, on_result=None):
+    """
+    Išversti tekstų sąrašą: literatūros įrašai ir lentelės grąžinami be vertimo,
+    URL/DOI/citatos apsaugomi žymekliais, pasikartojantys tekstai verčiami vieną kartą,
+    talpykloje esantys grąžinami iškart, kiti siunčiami paketais.
+    on_result(i, vertimas) kviečiamas vos tik išverčiamas kiekvienas tekstas.
+    """
+    results = [None] * len(texts)
+
+    def deliver(i, result):
+        results[i] = result
+        if on_result:
+            on_result(i, result)
+
+    prepared = [prepare_segment(text) for text in texts]
+    translatable = []
+    for i, (protected, value) in enumerate(prepared):
+        if protected is None:
+            deliver(i, value)  # neverčiamas segmentas grąžinamas toks, koks yra
+        else:
+            translatable.append(i)
+
+    unique, positions = _dedup.collapse([prepared[i][0] for i in translatable])
+
+    def fan_out(j, result):
+        for position in positions[j]:
+            i = translatable[position]
+            deliver(i, restore_spans(result, prepared[i][1]))
+
+    _translate_unique(unique, retry, max_workers, fan_out)
+    return results
+
+
+def _translate_unique(texts, retry, max_workers, on_result):
+    """Išversti unikalius tekstus (talpykla -> paketai -> lygiagretus vertimas)"""
+    backend = get_default_backend()
+    cache = get_default_cache()
+    missing = []
+
+    for i, text in enumerate(texts):
+        if not text or not text.strip():
+            on_result(i, "")
+            continue
+        cached = cache.get(text, source=backend.source, target=backend.target, backend=backend.name)
+        if cached is not None:
+            on_result(i, cached)
+        else:
+            missing.append(i)
+    # Pataikymų LRU laiko žymos įrašomos vienu kartu visam paketui
+    cache.flush()
+
+    groups = []
+    position = 0
+    for batch in pack_batches([texts[i] for i in missing], backend.max_chars):
+        groups.append(missing[position:position + len(batch)])
+        position += len(batch)
+
+    deferred = []
+    deferred_lock = threading.Lock()
+
+    def translate_group(group):
+        try:
+            translated = _translate_batch([texts[i] for i in group], backend, retry)
+        except Exception as e:
+            # Nepavykęs paketas nepaverčiamas klaidos žyme iškart - bandomas dar kartą pabaigoje
+            print(f"  ⏸ Paketas ({len(group)} gab.) atidėtas: {str(e)[:100]}")
+            get_retry_engine().count('deferred', len(group))
+            with deferred_lock:
+                deferred.extend(group)
+            return None
+        for i, result in zip(group, translated):
+            on_result(i, result)
+        return translated
+
+    translate_chunks_concurrently(groups, translate_group, max_workers)
+
+    if deferred:
+        _retry_deferred(texts, sorted(deferred), backend, retry, on_result)
+
+
+def translate_text(text, retry=None):
+    """Išversti tekstą (retry - bandymų skaičius, numatytas imamas iš pakartojimų variklio)"""
+    if not text or not text.strip():
+        return ""
+    return translate_many([text], retry=retry)[0]
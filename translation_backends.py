@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vertimo varikliai (backend'ai)
+Visi varikliai turi vieną sąsają - translate_many(list[str]) -> list[str].
+Maži gabalai sujungiami į vieną užklausą iki 5000 simbolių limito,
+o variklio objektas naudojamas per visą paleidimą.
+"""
+
+import random
+import re
+import threading
+import time
+from typing import List, Protocol
+
+from concurrent_translation import get_rate_limiter
+from text_processing import get_chunk_stats
+
+MAX_REQUEST_CHARS = 5000
+BATCH_SEPARATOR = "\n"
+# Eilutės lūžis gabalo viduje paketinėje užklausoje (kad netaptų paketo skirtuku)
+LINE_BREAK_MARKER = "⟦¶⟧"
+_LINE_BREAK_RE = re.compile(r'[ \t]*⟦\s*¶\s*⟧[ \t]*')
+
+
+class BackendError(Exception):
+    """Vertimo variklio klaida"""
+
+
+class RateLimitError(BackendError):
+    """Variklis riboja užklausų dažnį (HTTP 429)"""
+
+
+class TransientBackendError(BackendError):
+    """Laikina klaida - verta bandyti dar kartą"""
+
+
+class PermanentBackendError(BackendError):
+    """Nuolatinė klaida - kartoti neverta"""
+
+
+class TranslationBackend(Protocol):
+    """Vertimo variklio sąsaja"""
+
+    name: str
+
+    def translate_many(self, texts: List[str]) -> List[str]:
+        """Išversti tekstų sąrašą, grąžinant vertimus ta pačia tvarka"""
+        ...
+
+
+def escape_line_breaks(text):
+    """Pakeisti eilučių lūžius gabalo viduje žymekliu"""
+    return text.replace(BATCH_SEPARATOR, LINE_BREAK_MARKER)
+
+
+def restore_line_breaks(text):
+    """Grąžinti žymekliais pažymėtus eilučių lūžius"""
+    return _LINE_BREAK_RE.sub(BATCH_SEPARATOR, text)
+
+
+def pack_batches(texts, max_chars=MAX_REQUEST_CHARS, separator=BATCH_SEPARATOR):
+    """Sugrupuoti tekstus į paketus, kurių bendras ilgis neviršija max_chars"""
+    batches = []
+    current = []
+    current_len = 0
+
+    for text in texts:
+        # Ilgis su žymekliais, kurie paketinėje užklausoje pakeičia eilučių lūžius
+        length = len(escape_line_breaks(text))
+        added = length + (len(separator) if current else 0)
+        if current and current_len + added > max_chars:
+            batches.append(current)
+            current = []
+            current_len = 0
+            added = length
+        current.append(text)
+        current_len += added
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+class BatchingBackend:
+    """Bazinė klasė - paketų sudarymas ir užklausų skaičiavimas"""
+
+    name = "base"
+
+    def __init__(self, source='en', target='lt', max_chars=MAX_REQUEST_CHARS):
+        self.source = source
+        self.target = target
+        self.max_chars = max_chars
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def _request(self, text):
+        """Išsiųsti vieną užklausą variklio API"""
+        raise NotImplementedError
+
+    def _count_request(self, text):
+        """Suskaičiuoti išsiųstą užklausą (ir skaidymo statistikoje)"""
+        with self._lock:
+            self.requests += 1
+        get_chunk_stats().add_request(len(text), self.max_chars)
+
+    def _send(self, text):
+        """Išsiųsti užklausą laikantis bendro dažnio ribotuvo"""
+        get_rate_limiter().acquire()
+        self._count_request(text)
+        return self._request(text)
+
+    def translate(self, text):
+        """Išversti vieną tekstą"""
+        return self.translate_many([text])[0]
+
+    def translate_many(self, texts):
+        """Išversti tekstų sąrašą, sujungiant mažus gabalus į bendras užklausas"""
+        results = []
+        for batch in pack_batches(texts, self.max_chars):
+            if len(batch) == 1:
+                results.append(self._send(batch[0]))
+                continue
+
+            joined = BATCH_SEPARATOR.join(escape_line_breaks(text) for text in batch)
+            translated = self._send(joined).split(BATCH_SEPARATOR)
+            if len(translated) == len(batch):
+                results.extend(restore_line_breaks(part.strip()) for part in translated)
+            else:
+                # Variklis sujungė arba perskėlė eilutes - versti po vieną
+                results.extend(self._send(text) for text in batch)
+        return results
+
+
+class DeepTranslatorBackend(BatchingBackend):
+    """Google Translate per deep-translator biblioteką"""
+
+    name = "google"
+
+    def __init__(self, source='en', target='lt', max_chars=MAX_REQUEST_CHARS):
+        super().__init__(source, target, max_chars)
+        from deep_translator import GoogleTranslator
+        self._translator = GoogleTranslator(source=source, target=target)
+
+    def _request(self, text):
+        return self._translator.translate(text)
+
+
+class GoogletransBackend(BatchingBackend):
+    """Google Translate per googletrans biblioteką"""
+
+    name = "googletrans"
+
+    def __init__(self, source='en', target='lt', max_chars=MAX_REQUEST_CHARS):
+        super().__init__(source, target, max_chars)
+        from googletrans import Translator
+        self._translator = Translator()
+
+    def _request(self, text):
+        return self._translator.translate(text, src=self.source, dest=self.target).text
+
+
+class OfflineBackend(BatchingBackend):
+    """Vietinis variklis be tinklo - testams ir sausiems paleidimams"""
+
+    name = "offline"
+
+    def __init__(self, source='en', target='lt', max_chars=MAX_REQUEST_CHARS, latency=0.0, prefix="",
+                 rate_limited=False):
+        super().__init__(source, target, max_chars)
+        self.latency = latency
+        self.prefix = prefix
+        self.rate_limited = rate_limited
+
+    def _send(self, text):
+        # rate_limited=True - kaip tikras variklis, per bendrą dažnio ribotuvą (benchmark'ams)
+        if self.rate_limited:
+            return super()._send(text)
+        # Kitaip dažnis neribojamas - vėlavimą imituoja pats
+        self._count_request(text)
+        return self._request(text)
+
+    def _request(self, text):
+        if self.latency:
+            time.sleep(self.latency)
+        return BATCH_SEPARATOR.join(self.prefix + line for line in text.split(BATCH_SEPARATOR))
+
+
+class FlakyBackend(OfflineBackend):
+    """
+    Offline variklis su įterpiamais gedimais - pakartojimų logikai tikrinti
+    Kiekviena užklausa su nurodyta tikimybe iškelia ribojimo, laikiną ar nuolatinę klaidą.
+    """
+
+    name = "flaky"
+
+    def __init__(self, source='en', target='lt', max_chars=MAX_REQUEST_CHARS, latency=0.0, prefix="",
+                 rate_limit_rate=0.1, transient_rate=0.1, permanent_rate=0.0, seed=None, rate_limited=False):
+        super().__init__(source, target, max_chars, latency, prefix, rate_limited)
+        self.rate_limit_rate = rate_limit_rate
+        self.transient_rate = transient_rate
+        self.permanent_rate = permanent_rate
+        self.failures = 0
+        self._rng = random.Random(seed)
+
+    def _request(self, text):
+        with self._lock:
+            roll = self._rng.random()
+            failed = roll < self.rate_limit_rate + self.transient_rate + self.permanent_rate
+            if failed:
+                self.failures += 1
+        if roll < self.rate_limit_rate:
+            raise RateLimitError("429 Too Many Requests (imituota)")
+        if roll < self.rate_limit_rate + self.transient_rate:
+            raise TransientBackendError("Ryšio klaida (imituota)")
+        if failed:
+            raise PermanentBackendError("Netinkamas užklausos turinys (imituota)")
+        return super()._request(text)
+
+
+BACKENDS = {
+    'google': DeepTranslatorBackend,
+    'deep-translator': DeepTranslatorBackend,
+    'googletrans': GoogletransBackend,
+    'offline': OfflineBackend,
+    'flaky': FlakyBackend,
+}
+
+
+def create_backend(name='google', source='en', target='lt', **kwargs):
+    """Sukurti vertimo variklį pagal pavadinimą"""
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Nežinomas vertimo variklis: {name} (galimi: {', '.join(sorted(BACKENDS))})")
+    return backend_class(source=source, target=target, **kwargs)
+
+
+_default_backend = None
+
+
+def set_default_backend(backend):
+    """Nustatyti variklį, naudojamą per visą paleidimą"""
+    global _default_backend
+    _default_backend = backend
+    return backend
+
+
+def get_default_backend():
+    """Grąžinti bendrą variklį (pagal nutylėjimą - deep-translator)"""
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = create_backend('google')
+    return _default_backend
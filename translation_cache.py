@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vertimų talpykla (cache) diske
+Išversti gabalai saugomi viename SQLite faile, raktas - (šaltinio kalba,
+tikslinė kalba, vertimo variklis, normalizuoto teksto SHA-256).
+Kai talpykla viršija nustatytą dydį, pašalinami seniausiai naudoti įrašai (LRU).
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "vertimai.sqlite")
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Kiek pataikymų laiko žymų kaupti atmintyje prieš įrašant jas į diską
+TOUCH_BATCH = 256
+
+
+def normalize_text(text):
+    """Normalizuoti tekstą prieš skaičiuojant raktą"""
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def make_key(text, source, target, backend):
+    """Sudaryti talpyklos raktą"""
+    digest = hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+    return f"{source}:{target}:{backend}:{digest}"
+
+
+class TranslationCache:
+    """SQLite vertimų talpykla su LRU išmetimu pagal dydį"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Pataikymų LRU laiko žymos, dar neįrašytos į diską: raktas -> laikas
+        self._touched = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Keli cli.py procesai gali rašyti vienu metu - laukiama užrakto
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS vertimai ("
+            " raktas TEXT PRIMARY KEY,"
+            " vertimas TEXT NOT NULL,"
+            " dydis INTEGER NOT NULL,"
+            " naudota REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_naudota ON vertimai (naudota)")
+        self._conn.commit()
+
+    def get(self, text, source='en', target='lt', backend='google'):
+        """Grąžinti išsaugotą vertimą arba None"""
+        key = make_key(text, source, target, backend)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vertimas FROM vertimai WHERE raktas = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            # Laiko žyma atnaujinama paketu (ne commit kiekvienam pataikymui)
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_BATCH:
+                self._flush_touched()
+                self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def _flush_touched(self):
+        """Įrašyti sukauptas pataikymų laiko žymas (be commit)"""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE vertimai SET naudota = ? WHERE raktas = ?",
+                [(used, key) for key, used in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def flush(self):
+        """Įrašyti sukauptas laiko žymas į diską"""
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+
+    def put(self, text, translation, source='en', target='lt', backend='google'):
+        """Išsaugoti vertimą ir, jei reikia, išmesti seniausius įrašus"""
+        key = make_key(text, source, target, backend)
+        size = len(key) + len(translation.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO vertimai (raktas, vertimas, dydis, naudota) VALUES (?, ?, ?, ?)",
+                (key, translation, size, time.time())
+            )
+            # Prieš išmetant LRU įrašus - aktualios pataikymų laiko žymos
+            self._flush_touched()
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Pašalinti seniausiai naudotus įrašus, kol dydis neviršija limito"""
+        total = self._conn.execute("SELECT COALESCE(SUM(dydis), 0) FROM vertimai").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT raktas, dydis FROM vertimai ORDER BY naudota ASC")
+        to_delete = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM vertimai WHERE raktas = ?", to_delete)
+
+    def stats(self):
+        """Grąžinti talpyklos statistiką"""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(dydis), 0) FROM vertimai"
+            ).fetchone()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': entries,
+            'bytes': total
+        }
+
+    def print_report(self):
+        """Atspausdinti pataikymų/nepataikymų ataskaitą"""
+        stats = self.stats()
+        requests = stats['hits'] + stats['misses']
+        ratio = stats['hits'] / requests * 100 if requests else 0.0
+        print(f"\n💾 Vertimų talpykla ({self.path}):")
+        print(f"   • Pataikymai: {stats['hits']} | Nepataikymai: {stats['misses']} ({ratio:.1f}% iš talpyklos)")
+        print(f"   • Įrašų: {stats['entries']} | Dydis: {stats['bytes'] / 1024:.1f} KB")
+
+    def close(self):
+        """Įrašyti sukauptas laiko žymas ir uždaryti duomenų bazę"""
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
+
+
+_default_cache = None
+
+
+def set_default_cache(cache):
+    """Nustatyti talpyklą, naudojamą per visą paleidimą"""
+    global _default_cache
+    _default_cache = cache
+    return cache
+
+
+def get_default_cache():
+    """Grąžinti bendrą talpyklą visam paleidimui"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TranslationCache()
+    return _default_cache
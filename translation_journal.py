@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vertimo darbo žurnalas (checkpoint)
+Kiekvienam straipsniui - atskiras papildomas (append-only) JSONL failas.
+Kiekvienas išverstas gabalas įrašomas iškart, todėl nutrūkus vertimui
+--resume režimas tęsia nuo pirmo trūkstamo gabalo. Jei nurodyta segmentų
+saugykla (segment_store.py), nepasikeitę gabalai imami iš jos, o vos išvertus
+visus puslapio gabalus sulygintas originalas ir vertimas įrašomi į ją.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from text_processing import join_translated_chunks
+
+DEFAULT_JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "zurnalai")
+
+
+def chunk_hash(text):
+    """Gabalo teksto maiša - aptikti pasikeitusius gabalus"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def journal_path(straipsnis_id, journal_dir=DEFAULT_JOURNAL_DIR):
+    """Straipsnio žurnalo failo kelias"""
+    return os.path.join(journal_dir, f"straipsnis-{straipsnis_id}.jsonl")
+
+
+class TranslationJournal:
+    """Papildomas JSONL žurnalas su išverstais gabalais"""
+
+    def __init__(self, path, resume=False, segments=None):
+        self.path = path
+        self.pages = {}
+        self.chunks = {}
+        # Dar neįrašyti į saugyklą puslapiai: puslapis -> (gabalai, pastraipos, neišversti indeksai)
+        self.pending = {}
+        # Šio paleidimo puslapiai (baigus - kiti straipsnio puslapiai šalinami iš saugyklos)
+        self.seen_pages = set()
+        self.segments = segments
+        self.reused = 0
+        self.from_store = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if resume and os.path.exists(path):
+            self._load()
+            mode = 'a'
+        else:
+            mode = 'w'
+        self._file = open(path, mode, encoding='utf-8')
+
+    def _load(self):
+        """
+        Nuskaityti esamą žurnalą
+        Sugadintos eilutės praleidžiamos, o neužbaigta paskutinė eilutė (nutrūkus
+        procesui) nukerpama, kad nauji įrašai nebūtų prilipdyti prie jos.
+        """
+        complete = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                complete += len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self._apply(record)
+        if complete < os.path.getsize(self.path):
+            with open(self.path, 'r+b') as f:
+                f.truncate(complete)
+
+    def _apply(self, record):
+        if record['type'] == 'page':
+            self.pages[record['page']] = record
+        elif record['type'] == 'chunk':
+            self.chunks[(record['page'], record['index'])] = record
+
+    def _append(self, record):
+        with self._lock:
+            self._apply(record)
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def record_page(self, page, original, chunks, paragraph_ids=None):
+        """Užregistruoti puslapį, jo gabalų maišas ir gabalų pastraipų numerius"""
+        hashes = [chunk_hash(chunk) for chunk in chunks]
+        paragraph_ids = list(paragraph_ids) if paragraph_ids else None
+        existing = self.pages.get(page)
+        if not (existing and existing['original'] == original and existing['hashes'] == hashes
+                and existing.get('paragraphs') == paragraph_ids):
+            self._append({'type': 'page', 'page': page, 'original': original, 'hashes': hashes,
+                          'paragraphs': paragraph_ids})
+        if self.segments is None:
+            return
+        self.seen_pages.add(page)
+
+        # Gabalų tekstai laikomi tik kol puslapis dar neišverstas (žurnale - tik maišos)
+        remaining = set()
+        for index, expected in enumerate(hashes):
+            record = self.chunks.get((page, index))
+            if record is None or record['error'] or record['hash'] != expected:
+                remaining.add(index)
+        if remaining:
+            with self._lock:
+                self.pending[page] = (list(chunks), paragraph_ids, remaining)
+        else:
+            self._save_page(page, chunks, paragraph_ids)
+
+    def lookup(self, page, index, chunk):
+        """Grąžinti jau išverstą gabalą (iš žurnalo arba segmentų saugyklos), jei jo tekstas nepasikeitė"""
+        record = self.chunks.get((page, index))
+        if record and not record['error'] and record['hash'] == chunk_hash(chunk):
+            with self._lock:
+                self.reused += 1
+            return record['translated']
+        if self.segments is not None:
+            translated = self.segments.lookup(page, index, chunk)
+            if translated is not None:
+                self.record_chunk(page, index, chunk, translated)
+                with self._lock:
+                    self.from_store += 1
+                return translated
+        return None
+
+    def record_chunk(self, page, index, chunk, translated):
+        """Įrašyti išverstą gabalą (klaidos pažymimos ir --resume metu verčiamos iš naujo)"""
+        self._append({
+            'type': 'chunk',
+            'page': page,
+            'index': index,
+            'hash': chunk_hash(chunk),
+            'translated': translated,
+            'error': translated.startswith('[KLAIDA:')
+        })
+        with self._lock:
+            pending = self.pending.get(page)
+            if pending is None or index >= len(pending[0]) or pending[0][index] != chunk:
+                return
+            pending[2].discard(index)
+            if pending[2]:
+                return
+            del self.pending[page]
+        self._save_page(page, pending[0], pending[1])
+
+    def translated_pages(self):
+        """Atkurti išverstus puslapius vien iš žurnalo"""
+        translated_pages = []
+        for page in sorted(self.pages):
+            info = self.pages[page]
+            parts = [self.chunks.get((page, i)) for i in range(len(info['hashes']))]
+            if any(part is None or part['hash'] != expected for part, expected in zip(parts, info['hashes'])):
+                continue
+            translated_pages.append({
+                'page': page,
+                'original': info['original'],
+                'translated': join_translated_chunks([part['translated'] for part in parts], info.get('paragraphs'))
+            })
+        return translated_pages
+
+    def _save_page(self, page, chunks, paragraph_ids):
+        """Įrašyti puslapio sulygintus segmentus (originalas + vertimas) į saugyklą"""
+        segments = []
+        for index, chunk in enumerate(chunks):
+            record = self.chunks.get((page, index))
+            if record is None or record['hash'] != chunk_hash(chunk):
+                continue
+            segments.append({
+                'page': page,
+                'index': index,
+                'paragraph': paragraph_ids[index] if paragraph_ids else None,
+                'source': chunk,
+                'translated': record['translated'],
+                'error': record['error']
+            })
+        self.segments.save_page(page, len(chunks), segments)
+
+    def finish(self):
+        """Straipsnis išverstas iki galo: pašalinti iš saugyklos puslapius, kurių šaltinyje nebėra"""
+        if self.segments is not None:
+            self.segments.prune(self.seen_pages)
+
+    def close(self):
+        """Uždaryti žurnalo failą; neužbaigtų puslapių išversti gabalai vis tiek įrašomi į saugyklą"""
+        with self._lock:
+            self._file.close()
+            pending, self.pending = self.pending, {}
+        for page in sorted(pending):
+            chunks, paragraph_ids, _ = pending[page]
+            self._save_page(page, chunks, paragraph_ids)
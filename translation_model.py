@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Struktūrinis vertimo rezultatas (JSON)
+Vertimo etapas įrašo straipsnio metaduomenis, vertimo datą ir puslapius
+(originalas + išverstos pastraipos) į straipsnis-N-pilnas.json. HTML ir Word
+generatoriai skaito šį failą tiesiogiai - Word keliui nebereikia iš naujo
+analizuoti HTML, o abu rezultatai priklauso tik nuo modelio turinio.
+"""
+
+import json
+import os
+import textwrap
+import time
+
+from text_processing import PARAGRAPH_SEPARATOR
+from html_renderer import META_FIELDS, write_html_file
+
+MODEL_VERSION = 1
+
+
+def model_path(straipsnis_info, output_dir='.'):
+    """Modelio failo kelias (šalia HTML: straipsnis-N-pilnas.html -> .json)"""
+    html_name = straipsnis_info['pilnas_vertimas']
+    return os.path.join(output_dir, os.path.splitext(html_name)[0] + ".json")
+
+
+def model_meta(straipsnis_info, translation_date=None):
+    """Modelio laukai be puslapių"""
+    if translation_date is None:
+        translation_date = time.strftime('%Y m. %B %d d.')
+    return {
+        'version': MODEL_VERSION,
+        'straipsnis': {field: straipsnis_info.get(field) for field in META_FIELDS},
+        'translation_date': translation_date
+    }
+
+
+def model_page(page_data):
+    """Išverstas puslapis ({'page', 'original', 'translated'}) -> modelio puslapis"""
+    return {
+        'page': page_data['page'],
+        'original': page_data.get('original', ""),
+        'paragraphs': page_data['translated'].split(PARAGRAPH_SEPARATOR)
+    }
+
+
+def build_model(translated_pages, straipsnis_info, translation_date=None):
+    """Sudaryti modelį iš išverstų puslapių ir straipsnio metaduomenų"""
+    model = model_meta(straipsnis_info, translation_date)
+    model['pages'] = [model_page(page_data) for page_data in translated_pages]
+    return model
+
+
+def model_pages(model):
+    """Išversti puslapiai HTML generatoriui ({'page', 'original', 'translated'})"""
+    for page in model['pages']:
+        yield {
+            'page': page['page'],
+            'original': page['original'],
+            'translated': PARAGRAPH_SEPARATOR.join(page['paragraphs'])
+        }
+
+
+def write_model(model, path):
+    """Išsaugoti modelį (atomiškai, stabilia tvarka)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(model, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def write_model_stream(translated_pages, straipsnis_info, path, translation_date=None):
+    """
+    Rašyti modelį srautu: kiekvienas puslapis įrašomas ir perduodamas toliau
+    Failas baigiamas (atomiškai), kai puslapiai baigiasi; turinys - toks pat kaip write_model.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    completed = False
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            # sort_keys=True: 'pages' eina pirmas, todėl puslapius galima rašyti iš karto
+            f.write('{\n "pages": [')
+            separator = "\n"
+            for page_data in translated_pages:
+                encoded = json.dumps(model_page(page_data), ensure_ascii=False, indent=1, sort_keys=True)
+                f.write(separator + textwrap.indent(encoded, "  "))
+                separator = ",\n"
+                yield page_data
+            meta = json.dumps(model_meta(straipsnis_info, translation_date), ensure_ascii=False, indent=1,
+                              sort_keys=True)
+            f.write(("\n ]," if separator != "\n" else "],") + meta[1:] + "\n")
+        os.replace(tmp_path, path)
+        completed = True
+    finally:
+        if not completed and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_model(path):
+    """Nuskaityti modelį; ValueError, jei versija nepalaikoma"""
+    with open(path, 'r', encoding='utf-8') as f:
+        model = json.load(f)
+    if model.get('version') != MODEL_VERSION:
+        raise ValueError(f"Nepalaikoma modelio versija {model.get('version')} ({path})")
+    return model
+
+
+def write_html_from_model(model, output_html):
+    """Sugeneruoti HTML iš modelio; grąžina puslapių skaičių"""
+    return write_html_file(model_pages(model), model['straipsnis'], output_html, model['translation_date'])
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Neverčiamų fragmentų atpažinimas
+Literatūros sąrašo įrašai ir skaičių lentelės perduodami be vertimo, o
+URL, DOI ir citatos skliaustuose "(Brewin & Holmes, 2003)" tekste pakeičiami
+žymekliais ⟦n⟧ ir po vertimo grąžinami nepakeisti. Taip mažiau simbolių
+siunčiama vertimo varikliui, o nuorodos negadinamos.
+"""
+
+import re
+import threading
+
+# Literatūros įrašo pradžia: "Brewin, C. R.", "van der Kolk, B. A.", "[4] Wittchen HU", "12. Kohn R"
+_REFERENCE_START_RE = re.compile(
+    r"^(?:"
+    r"(?:(?:van|von|de|der|den|du|la|le) )*[A-Z][\w'’\-]+(?: [A-Za-z][\w'’\-]+){0,2}\s?[´˘¨]?,\s*(?:[A-Z]\s?\.\s?-?\s?)+"
+    r"|(?:\[\s*\d+\s*\]|\d+\.)\s+[A-Z][\w'’\-]+,? [A-Z]{1,3}\b"
+    r")"
+)
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}[a-z]?\b|\(in press\)')
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+_URL_RE = re.compile(r'(?:https?://|www\.)[^\s<>"]+[^\s<>".,;:)\]]')
+_DOI_RE = re.compile(r'\b(?:doi:\s*)?10\.\d{4,9}/[^\s<>"]+[^\s<>".,;:)\]]', re.IGNORECASE)
+# Citata skliaustuose; "e.g.", "see" ir pan. paliekami vertimui
+_CITATION_RE = re.compile(
+    r'\((?P<prefix>(?:e\.g\.|i\.e\.|see|cf\.)[,\s]+)?'
+    r'(?P<cite>[A-Z][^()]{0,300}?,\s*(?:19|20)\d{2}[a-z]?(?:[;,][^()]{0,300}?(?:19|20)\d{2}[a-z]?)*)\)'
+)
+# Skaitinės nuorodos: "[ 8]", "[12,13]", "[5–7]"
+_NUMERIC_CITATION_RE = re.compile(r'\[\s*\d+(?:\s*[,–-]\s*\d+)*\s*\]')
+
+PLACEHOLDER = "⟦{}⟧"
+_PLACEHOLDER_RE = re.compile(r'⟦\s*(\d+)\s*⟧')
+
+MAX_REFERENCE_GAP = 500     # literatūros sąraše bent vieni metai kas tiek simbolių
+MAX_TABLE_LETTER_SHARE = 0.4
+
+
+def is_reference_entry(text):
+    """Ar tekstas yra literatūros sąrašo įrašas (ar keli sulipę įrašai)"""
+    text = text.strip()
+    if not _REFERENCE_START_RE.match(text):
+        return False
+    years = len(_YEAR_RE.findall(text))
+    return years > 0 and len(text) <= years * MAX_REFERENCE_GAP
+
+
+def is_numeric_table(text):
+    """Ar tekstas yra skaičių lentelė (raidžių mažiau nei skaičių ir skyrybos)"""
+    chars = [char for char in text if not char.isspace()]
+    if not chars:
+        return False
+    letters = sum(1 for char in chars if _LETTER_RE.match(char))
+    return letters / len(chars) < MAX_TABLE_LETTER_SHARE
+
+
+def classify_segment(text):
+    """Segmento rūšis: 'empty', 'reference', 'table' arba 'text'"""
+    if not text or not text.strip():
+        return 'empty'
+    if is_reference_entry(text):
+        return 'reference'
+    if is_numeric_table(text):
+        return 'table'
+    return 'text'
+
+
+def protect_spans(text):
+    """Pakeisti URL, DOI ir citatas žymekliais; grąžina (tekstas, pakeisti fragmentai)"""
+    spans = []
+
+    def replace(span):
+        spans.append(span)
+        return PLACEHOLDER.format(len(spans) - 1)
+
+    text = _URL_RE.sub(lambda m: replace(m.group(0)), text)
+    text = _DOI_RE.sub(lambda m: replace(m.group(0)), text)
+    text = _CITATION_RE.sub(lambda m: f"({m.group('prefix') or ''}{replace(m.group('cite'))})", text)
+    text = _NUMERIC_CITATION_RE.sub(lambda m: replace(m.group(0)), text)
+    return text, spans
+
+
+def restore_spans(text, spans):
+    """Grąžinti žymeklių vietoje originalius fragmentus (dingę žymekliai pridedami gale)"""
+    if not spans:
+        return text
+    used = set()
+
+    def restore(match):
+        index = int(match.group(1))
+        if index >= len(spans):
+            return match.group(0)
+        used.add(index)
+        return spans[index]
+
+    text = _PLACEHOLDER_RE.sub(restore, text)
+    missing = [span for i, span in enumerate(spans) if i not in used]
+    if missing:
+        text = f"{text} {' '.join(missing)}"
+    return text
+
+
+class UntranslatableStats:
+    """Kiek segmentų ir simbolių praleista be vertimo"""
+
+    def __init__(self):
+        self.segments = {'reference': 0, 'table': 0}
+        self.chars = 0
+        self.spans = 0
+        self.span_chars = 0
+        self._lock = threading.Lock()
+
+    def add_segment(self, kind, text):
+        with self._lock:
+            self.segments[kind] += 1
+            self.chars += len(text)
+
+    def add_spans(self, spans):
+        with self._lock:
+            self.spans += len(spans)
+            self.span_chars += sum(len(span) for span in spans)
+
+    def print_report(self):
+        """Atspausdinti ataskaitą"""
+        print(f"\n🔒 Neverčiami fragmentai:")
+        print(f"   • Literatūros įrašų: {self.segments['reference']} | Lentelių: {self.segments['table']} "
+              f"({self.chars:,} simbolių)")
+        print(f"   • URL/DOI/citatų tekste: {self.spans} ({self.span_chars:,} simbolių)")
+
+
+_stats = UntranslatableStats()
+
+
+def get_untranslatable_stats():
+    """Grąžinti bendrą neverčiamų fragmentų statistiką visam paleidimui"""
+    return _stats
+
+
+def prepare_segment(text, stats=None):
+    """
+    Paruošti segmentą vertimui
+    Grąžina (None, paruoštas vertimas), jei segmento versti nereikia,
+    arba (tekstas su žymekliais, fragmentai) - jei reikia.
+    """
+    stats = stats or _stats
+    kind = classify_segment(text)
+    if kind == 'empty':
+        return None, ""
+    if kind != 'text':
+        stats.add_segment(kind, text)
+        return None, text
+
+    protected, spans = protect_spans(text)
+    if not _LETTER_RE.search(_PLACEHOLDER_RE.sub('', protected)):
+        return None, text
+    stats.add_spans(spans)
+    return protected, spans